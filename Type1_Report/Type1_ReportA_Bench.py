@@ -0,0 +1,443 @@
+import gc
+import os
+import sys
+import json
+import time
+import atexit
+import shutil
+import argparse
+import datetime
+import platform
+import tempfile
+import tracemalloc
+import subprocess
+import numpy as np
+import pandas as pd
+from openpyxl import Workbook
+from openpyxl.styles import Border, Side
+from tests.synthetic import SYNTHETIC_CWK, COMPARISON_COLS, install_pdr_stubs, make_g360_frames, prepare_run, make_volume_frame, \
+    make_fc_frame, make_filtered_frame, fc_header, make_fc_workbook
+from tests.reference import per_cell_dataframe_to_excel, per_cell_set_style, row_by_row_summary_lookups, row_apply_df_filtered
+
+# Description: This is the benchmark program to time each phase of the Type 1 Report A job on synthetic data, without the Oracle database or the network templates.
+
+# Largest number of cells written one at a time by the reference writer of the micro benchmarks
+PER_CELL_MAX_CELLS = 50000 * 160
+# Largest number of distributors looked up one summary row at a time by the reference summary lookups
+ROW_BY_ROW_MAX_DISTRIBUTORS = 2000
+# Measure and manufacturer filters of the final deliverable of each category, as in the category jobs
+COMPARISON_FILTERS = {
+    "cig": ("Ctns", ["XXX Brands"]),
+    "ecig": ("Units", ["blu ecigs"]),
+    "cgr": ("Vol", ["XXX Cigars Inc \\(Mmc\\)"]),
+    "otp": ("Vol", ["Modern Oral", "Wraps"]),
+}
+
+
+def run_scale(distributors: int, work_dir: str, trace_memory: bool, write_only: bool = False) -> dict:
+    """Run the whole job on synthetic data for the number of distributors and time each phase.
+
+    Args:
+        distributors (int): The number of distributors in each category.
+        work_dir (str): The folder for the templates and the output files.
+        trace_memory (bool): True to also trace the peak memory of each phase.
+        write_only (bool, optional): True to stream the dynamic and WDC reports into write-only workbooks. Defaults to False.
+
+    Returns:
+        dict: the timings of the run.
+    """
+    state = {"cwk": SYNTHETIC_CWK, "reports": {}}
+    install_pdr_stubs(state)
+    import src.Type1_ReportA_Rpt as itg
+    from src.classes.SpanTracer import SpanTracer
+    # Last week's dynamic reports are saved before the run, this is not timed
+    report_id, template_path, output_path = prepare_run(distributors, work_dir, state)
+    # Run this week's job
+    start = time.perf_counter()
+    cpu_start = time.process_time()
+    job = itg.Type1_ReportA_Rpt(None, "BENCH.DR_REPORTS", report_id, template_path, output_path, trace=True, trace_memory=trace_memory, write_only=write_only)
+    job.run()
+    result = {
+        "distributors": distributors,
+        "write_only": write_only,
+        "g360_rows": int(len(state["reports"][4].index)),
+        "wall_s": round(time.perf_counter() - start, 3),
+        "cpu_s": round(time.process_time() - cpu_start, 3),
+        "phases": {phase: round(wall, 3) for phase, wall in SpanTracer.phase_totals(job.tracer.spans).items()},
+        "spans": job.tracer.spans,
+    }
+    try:
+        import resource
+        result["max_rss_mb"] = round(resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024, 1)
+    except ImportError:
+        pass
+    return result
+
+
+def reset_peak_rss() -> bool:
+    """Reset the peak resident memory of this process, which only Linux can do.
+
+    Returns:
+        bool: True if the peak was reset.
+    """
+    try:
+        with open("/proc/self/clear_refs", "w") as file:
+            file.write("5")
+        return True
+    except OSError:
+        return False
+
+
+def peak_rss_mb() -> float:
+    """Get the peak resident memory of this process in MB since it was last reset, None where /proc is not available."""
+    try:
+        with open("/proc/self/status") as file:
+            for line in file:
+                if line.startswith("VmHWM:"):
+                    return round(int(line.split()[1]) / 1024, 1)
+    except OSError:
+        pass
+    return None
+
+
+def timed(function, setup, trace_memory: bool = False) -> dict:
+    """Call a function and get its wall time, its peak resident memory and the peak memory traced by tracemalloc if asked.
+
+    The peak resident memory includes the arguments returned by setup, and is only measured on Linux.
+    tracemalloc slows down the call a lot, so the peak memory is traced in a second call that is not timed.
+    A dict returned by the function, such as the time of each phase, is added to the result of the timed call.
+
+    Args:
+        function (callable): The function to time.
+        setup (callable): The function that returns the arguments of each call, it is not timed.
+        trace_memory (bool, optional): True to also trace the peak memory. Defaults to False.
+
+    Returns:
+        dict: the wall time in seconds and the peak memories in MB.
+    """
+    args = setup()
+    gc.collect()
+    reset = reset_peak_rss()
+    start = time.perf_counter()
+    details = function(*args)
+    result = {"wall_s": round(time.perf_counter() - start, 3)}
+    if reset:
+        result["peak_rss_mb"] = peak_rss_mb()
+    if isinstance(details, dict):
+        result.update(details)
+    del args, details
+    if trace_memory:
+        args = setup()
+        gc.collect()
+        tracemalloc.start()
+        function(*args)
+        result["peak_mb"] = round(tracemalloc.get_traced_memory()[1] / 2 ** 20, 1)
+        tracemalloc.stop()
+    return result
+
+
+def micro_writer(rows: int, columns: int) -> list:
+    """Time writing a dynamic report frame below a 7-row header, one cell at a time, with the bulk writer and with the write-only report.
+
+    The cell-by-cell writer is only timed up to PER_CELL_MAX_CELLS cells, past that it takes most of an hour. The write-only
+    variant includes saving the workbook, as its rows are streamed to the file instead of being kept in the worksheet.
+    """
+    import src.Type1_ReportA_Rpt as itg
+    from src.classes.WriteOnlyReport import WriteOnlyReport
+    Rpt = itg.Type1_ReportA_Rpt
+    df = make_volume_frame(rows, columns)
+    thin = Side(border_style="thin", color="000000")
+    border = Rpt.styles.border(left=thin, right=thin, top=thin, bottom=thin)
+
+    def write_only(df, template_ws, header_rows):
+        report = WriteOnlyReport(template_ws, "Sheet", header_rows)
+        report.write_data(df, font=Rpt.styles.font(name="Arial", size=8), alignment=Rpt.styles.alignment(wrapText=True), border=border)
+        with tempfile.TemporaryDirectory() as work_dir:
+            report.save(os.path.join(work_dir, "write_only.xlsx"))
+
+    setup = lambda: (df, Workbook().active, 7)
+    variants = [("write_only", write_only, setup), ("bulk", Rpt.dataframe_to_excel, setup)]
+    if rows * columns <= PER_CELL_MAX_CELLS:
+        variants.insert(0, ("per_cell", per_cell_dataframe_to_excel, setup))
+    return variants
+
+
+def micro_style(rows: int, columns: int) -> list:
+    """Time the styling of the data of a dynamic report, with new style objects per cell and with the shared styles of set_range_style()."""
+    import src.Type1_ReportA_Rpt as itg
+    Rpt = itg.Type1_ReportA_Rpt
+    df = make_volume_frame(rows, columns)
+    thin = Side(border_style="thin", color="000000")
+    border = Border(left=thin, right=thin, top=thin, bottom=thin)
+
+    def setup():
+        ws = Workbook().active
+        Rpt.dataframe_to_excel(df, ws, skip_rows=7)
+        return ws, rows + 7, columns, border
+
+    def range_style(ws, max_row, max_col, border):
+        Rpt.set_range_style(ws, 8, max_row, 1, max_col, size=8, horizontal=None, wrapText=True, border=border)
+
+    return [("per_cell", per_cell_set_style, setup), ("range", range_style, setup)]
+
+
+def micro_summary_lookup(rows: int, columns: int) -> list:
+    """Time the lookups of the summary columns by 'Concatenated' in the four FC worksheets, for a number of distributors.
+
+    The indexed variant includes keeping the FC dataframes in the artifact store. The row-by-row reference of the first
+    version is only timed up to ROW_BY_ROW_MAX_DISTRIBUTORS distributors, as it scans every FC worksheet for every summary row.
+    """
+    import src.Type1_ReportA_Rpt as itg
+    with tempfile.TemporaryDirectory() as work_dir:
+        job = itg.Type1_ReportA_Rpt(None, "BENCH.DR_REPORTS", list(range(1, 9)), work_dir, [work_dir] * 4)
+    sheets = job.out_summary_sheets[1:5]
+    frames = {sheet: make_fc_frame(rows, seed=i) for i, sheet in enumerate(sheets)}
+    header = fc_header(job)
+    df_summary = pd.DataFrame({job.col_curr_db[0]: [f"Distributor Number {i} ({100000 + i})" for i in range(rows)]})
+
+    def indexed(df):
+        for sheet, df_fc in frames.items():
+            job.artifacts.put(job.out_final_summary, df_fc, header, sheet=sheet)
+        fc_index = job._build_fc_index()
+        df = job._add_cols_impacted(fc_index, df)
+        df = job._add_cols_rsd_vol(fc_index, df)
+        df = job._add_cols_vol_impact(fc_index, df)
+        return job._add_cols_week_change(fc_index, df)
+
+    variants = [("indexed", indexed, lambda: (df_summary.copy(),))]
+    if rows <= ROW_BY_ROW_MAX_DISTRIBUTORS:
+        wb = make_fc_workbook(job, frames)
+        variants.insert(0, ("row_by_row", row_by_row_summary_lookups, lambda: (job, wb, df_summary.copy())))
+    return variants
+
+
+def micro_final_excel(rows: int, columns: int) -> list:
+    """Time create_final_excel() of the cig category for a number of distributors.
+
+    The read_back reference rebuilds the Curr_DB and Prev_DB frames of the comparison from the worksheet values, as the first
+    version did, and the frames variant compares the frames written to the worksheets. The rest of the report is the same.
+    """
+    # The job is run against this state, last week's dynamic reports are saved before the variants are timed
+    state = {"cwk": SYNTHETIC_CWK, "reports": {}}
+    install_pdr_stubs(state)
+    import src.Type1_ReportA_Rpt as itg
+    from src.classes.SpanTracer import SpanTracer
+    Rpt = itg.Type1_ReportA_Rpt
+
+    class ReadBackRpt(Rpt):
+        def create_ws_comparison(self, wb, ws_name, df_curr, df_prev, filter_str, end_week):
+            frames = []
+            with self.tracer.span(ws_name, "process"):
+                for sheet in self.out_final_sheets[2:4]:
+                    data = wb[sheet].values
+                    # Skip the first two rows of worksheet
+                    next(data)
+                    next(data)
+                    frames.append(pd.DataFrame(data, columns=self.col_curr_db))
+            return super().create_ws_comparison(wb, ws_name, frames[0], frames[1], filter_str, end_week)
+
+    # The folder is removed when the process exits, after the variants are timed
+    work_dir = tempfile.mkdtemp()
+    atexit.register(shutil.rmtree, work_dir, ignore_errors=True)
+    report_id, template_path, output_path = prepare_run(rows, work_dir, state)
+    df = Rpt.compact_dr_frame(state["reports"][4].copy())
+
+    def create_final_excel(job, df):
+        job.create_final_excel(df, "Ctns", job.temp_final_cig, job.input_dr_cig, job.out_final_cig, ["XXX Brands"])
+        return {"phases": {phase: round(wall, 3) for phase, wall in SpanTracer.phase_totals(job.tracer.spans).items()}}
+
+    setup = lambda job_class: lambda: (job_class(None, "BENCH.DR_REPORTS", report_id, template_path, output_path, trace=True), df.copy())
+    return [("read_back", create_final_excel, setup(ReadBackRpt)), ("frames", create_final_excel, setup(Rpt))]
+
+
+def micro_category_frames(rows: int, columns: int) -> list:
+    """Time the Curr_DB/Prev_DB and comparison frames of each category for a number of distributors, without the workbooks.
+
+    The float64 variants process the dynamic report volumes as they are pulled, with NaN for the empty weeks, as the
+    first version did. The compact variants first convert them with compact_dr_frame(), as get_dr_data() and the Prev_DB
+    read do. Both start from the same float64 frames, which are part of the peak resident memory.
+    """
+    import src.Type1_ReportA_Rpt as itg
+    Rpt = itg.Type1_ReportA_Rpt
+    with tempfile.TemporaryDirectory() as work_dir:
+        job = Rpt(None, "BENCH.DR_REPORTS", list(range(1, 9)), work_dir, [work_dir] * 4)
+
+    def process_frames(df_curr, df_prev, col_filter, filter_str, compact):
+        if compact:
+            Rpt.compact_dr_frame(df_curr)
+            Rpt.compact_dr_frame(df_prev)
+        df_merged = job._merge_df_curr_prev(job._process_df_curr_db(df_curr, col_filter), job._process_df_curr_db(df_prev, col_filter))
+        df_merged = job._process_df_merged(df_merged, COMPARISON_COLS, 14)
+        job._process_df_filtered(df_merged[df_merged[COMPARISON_COLS[6]] != 0], COMPARISON_COLS, filter_str, 14)
+
+    variants = []
+    for i, (category, (col_filter, filter_str)) in enumerate(COMPARISON_FILTERS.items()):
+        setup = lambda category=category, col_filter=col_filter, filter_str=filter_str, seed=i: (
+            *make_g360_frames(rows, category, seed), col_filter, filter_str
+        )
+        variants.append((f"{category}_float64", lambda *args: process_frames(*args, compact=False), setup))
+        variants.append((f"{category}_compact", lambda *args: process_frames(*args, compact=True), setup))
+    return variants
+
+
+def micro_comparison_columns(rows: int, columns: int) -> list:
+    """Time the C Diff strings and the labels of the cig comparison for a number of distributors, one row at a time and column-wise."""
+    import src.Type1_ReportA_Rpt as itg
+    with tempfile.TemporaryDirectory() as work_dir:
+        job = itg.Type1_ReportA_Rpt(None, "BENCH.DR_REPORTS", list(range(1, 9)), work_dir, [work_dir] * 4)
+    df_filtered = make_filtered_frame(job, rows)
+    setup = lambda: (df_filtered.copy(), COMPARISON_COLS, ["XXX Brands"], 14)
+    return [("row_apply", lambda *args: row_apply_df_filtered(job, *args), setup), ("column_wise", job._process_df_filtered, setup)]
+
+
+# Micro benchmarks of a single part of the job: the function, its default numbers of rows and the names of its variants
+MICRO_BENCHMARKS = {
+    "writer": (micro_writer, [10000, 50000, 200000], ["per_cell", "write_only", "bulk"]),
+    "style": (micro_style, [10000, 50000], ["per_cell", "range"]),
+    "summary_lookup": (micro_summary_lookup, [1000, 2000, 10000, 100000], ["row_by_row", "indexed"]),
+    "final_excel": (micro_final_excel, [500, 1000, 2000], ["read_back", "frames"]),
+    "comparison_columns": (micro_comparison_columns, [1000, 5000, 20000], ["row_apply", "column_wise"]),
+    "category_frames": (
+        micro_category_frames,
+        [2000, 10000, 20000],
+        [f"{category}_{dtypes}" for category in COMPARISON_FILTERS for dtypes in ["float64", "compact"]],
+    ),
+}
+
+
+def run_micro(name: str, rows: int, columns: int, trace_memory: bool, variant: str = None):
+    """Run a micro benchmark on synthetic data, one variant at a time.
+
+    Args:
+        name (str): The name of the micro benchmark, a key of MICRO_BENCHMARKS.
+        rows (int): The number of rows, or of distributors for the benchmarks of the summary report.
+        columns (int): The number of columns of the dynamic report frames.
+        trace_memory (bool): True to also trace the peak memory of each variant.
+        variant (str, optional): The only variant to run, all of them if None. Defaults to None.
+
+    Yields:
+        dict: the timings of each variant, as soon as the variant is timed.
+    """
+    install_pdr_stubs({"cwk": SYNTHETIC_CWK, "reports": {}})
+    function = MICRO_BENCHMARKS[name][0]
+    for variant_name, variant_function, setup in function(rows, columns):
+        if variant is None or variant_name == variant:
+            yield {"benchmark": name, "rows": rows, "columns": columns, "variant": variant_name, **timed(variant_function, setup, trace_memory)}
+
+
+def git_commit() -> str:
+    """Get the commit of the working tree, None outside of a git repository."""
+    try:
+        return subprocess.run(["git", "rev-parse", "--short", "HEAD"], capture_output=True, text=True, check=True,
+            cwd=os.path.dirname(os.path.abspath(__file__))).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def compare(results: dict, baseline_file: str):
+    """Print the time of each phase against the results of another commit."""
+    with open(baseline_file) as file:
+        baseline = {run["distributors"]: run for run in json.load(file)["runs"]}
+    if results["runs"]:
+        print(f"{'Distributors':>12} {'Phase':<8} {'Baseline (s)':>12} {'Now (s)':>9} {'Ratio':>7}")
+    for run in results["runs"]:
+        base = baseline.get(run["distributors"])
+        if base is None:
+            continue
+        for phase in sorted(set(run["phases"]) | set(base["phases"])) + ["total"]:
+            before = base["wall_s"] if phase == "total" else base["phases"].get(phase, 0)
+            now = run["wall_s"] if phase == "total" else run["phases"].get(phase, 0)
+            ratio = f"{now / before:.2f}" if before else ""
+            print(f"{run['distributors']:>12} {phase:<8} {before:>12.2f} {now:>9.2f} {ratio:>7}")
+    # Micro benchmarks are matched on their name, number of rows and variant
+    key = lambda run: (run["benchmark"], run["rows"], run["variant"])
+    with open(baseline_file) as file:
+        baseline = {key(run): run for run in json.load(file).get("micro", [])}
+    if results["micro"]:
+        print(f"{'Benchmark':<12} {'Rows':>8} {'Variant':<10} {'Baseline (s)':>12} {'Now (s)':>9} {'Ratio':>7}")
+    for run in results["micro"]:
+        base = baseline.get(key(run))
+        if base is not None:
+            ratio = f"{run['wall_s'] / base['wall_s']:.2f}" if base["wall_s"] else ""
+            print(f"{run['benchmark']:<12} {run['rows']:>8} {run['variant']:<10} {base['wall_s']:>12.2f} {run['wall_s']:>9.2f} {ratio:>7}")
+
+
+def main(args):
+    # Run each scale in its own process so that the timings and the memory do not depend on the previous scales
+    if args.one_scale is not None:
+        with tempfile.TemporaryDirectory() as work_dir:
+            print(json.dumps(run_scale(args.one_scale, work_dir, args.trace_memory, args.write_only)))
+        return
+    if args.one_micro is not None:
+        for run in run_micro(args.one_micro, args.rows[0], args.columns, args.trace_memory, args.one_variant):
+            print(json.dumps(run))
+        return
+    results = {
+        "commit": git_commit(),
+        "date": datetime.datetime.now().isoformat(timespec="seconds"),
+        "python": platform.python_version(),
+        "pandas": pd.__version__,
+        "numpy": np.__version__,
+        "platform": platform.platform(),
+        "runs": [],
+        "micro": [],
+    }
+    # The micro benchmarks replace the runs of the whole job when they are asked for, each variant is run in its own process
+    for name in args.micro or []:
+        for rows in args.rows or MICRO_BENCHMARKS[name][1]:
+            for variant in MICRO_BENCHMARKS[name][2]:
+                command = [sys.executable, os.path.abspath(__file__), "--one-micro", name, "--one-variant", variant, "--rows", str(rows), "--columns", str(args.columns)]
+                if args.trace_memory:
+                    command.append("--trace-memory")
+                output = subprocess.run(command, capture_output=True, text=True, cwd=os.path.dirname(os.path.abspath(__file__)))
+                # A variant that does not fit in memory is killed by the system, the other variants and sizes are still run
+                if output.returncode != 0:
+                    reason = "probably out of memory" if output.returncode < 0 else (output.stderr.strip().splitlines() or [""])[-1]
+                    print(f"{name} {rows} rows x {args.columns} columns, {variant}: failed with exit code {output.returncode}, {reason}")
+                    continue
+                # Variants that are only run up to some size print nothing for the larger sizes
+                for line in output.stdout.splitlines():
+                    if not line.startswith('{"benchmark"'):
+                        continue
+                    run = json.loads(line)
+                    results["micro"].append(run)
+                    rss = f", peak RSS {run['peak_rss_mb']} MB" if "peak_rss_mb" in run else ""
+                    peak = f", peak {run['peak_mb']} MB" if "peak_mb" in run else ""
+                    phases = f" {run['phases']}" if "phases" in run else ""
+                    print(f"{name} {rows} rows x {args.columns} columns, {run['variant']}: {run['wall_s']:.2f}s{rss}{peak}{phases}")
+    for distributors in [] if args.micro else args.scales:
+        command = [sys.executable, os.path.abspath(__file__), "--one-scale", str(distributors)]
+        if args.trace_memory:
+            command.append("--trace-memory")
+        if args.write_only:
+            command.append("--write-only")
+        output = subprocess.run(command, capture_output=True, text=True, check=True, cwd=os.path.dirname(os.path.abspath(__file__)))
+        run = json.loads(output.stdout.strip().splitlines()[-1])
+        results["runs"].append(run)
+        mode = ", write-only" if run["write_only"] else ""
+        print(f"{distributors} distributors ({run['g360_rows']} rows per category{mode}): {run['wall_s']:.2f}s {run['phases']}")
+    os.makedirs(args.output, exist_ok=True)
+    out_file = os.path.join(args.output, f"bench_{results['commit'] or 'nogit'}_{datetime.datetime.now():%Y%m%d_%H%M%S}.json")
+    with open(out_file, "w") as file:
+        json.dump(results, file, indent=1)
+    print(f"Results saved to {out_file}")
+    if args.compare:
+        compare(results, args.compare)
+
+
+if __name__ == "__main__":
+    # Import the src package from the folder of this file, as Type1_ReportA_Main.py does
+    sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+    parser = argparse.ArgumentParser(description="Time each phase of the Type 1 Report A job on synthetic data.")
+    parser.add_argument("--scales", type=int, nargs="+", default=[100, 500, 2000], help="numbers of distributors in each category to run")
+    parser.add_argument("--output", default="bench_results", help="folder to save the JSON results to")
+    parser.add_argument("--compare", help="JSON results of another commit to compare with")
+    parser.add_argument("--trace-memory", action="store_true", help="also trace the peak memory of each phase, which slows down the job")
+    parser.add_argument("--write-only", action="store_true", help="stream the dynamic and WDC reports into write-only workbooks, as write_only in Type1_ReportA_CFG.py does")
+    parser.add_argument("--micro", nargs="+", choices=sorted(MICRO_BENCHMARKS), help="run micro benchmarks of a single part of the job instead of the whole job")
+    parser.add_argument("--rows", type=int, nargs="+", help="numbers of rows of the micro benchmarks, each has its own default")
+    parser.add_argument("--columns", type=int, default=160, help="number of columns of the dynamic report frames in the micro benchmarks")
+    parser.add_argument("--one-scale", type=int, help=argparse.SUPPRESS)
+    parser.add_argument("--one-micro", help=argparse.SUPPRESS)
+    parser.add_argument("--one-variant", help=argparse.SUPPRESS)
+    main(parser.parse_args())
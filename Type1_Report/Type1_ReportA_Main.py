@@ -4,19 +4,22 @@ import pdr.handlers.Console_Handler as console
 import pdr.data.Connection as conn
 import src.Type1_ReportA_CFG as config
 import src.Type1_ReportA_Rpt as itg
+import argparse
 import datetime
+import functools
 import sys
 
 # Author: Dragon Xu
 # Date: 07/17/2024
 # Description: This is the main program to run the Type 1 Report A job.
 
-def main():
+def main(args):
     current_time = datetime.datetime.now()
     # Logging the start of the program
     console.log("Type 1 Report A Job Has Started on " + str(current_time))
-    # Establish connection to Oracle database
-    connection = conn.oracle_connect(
+    # Open connections to Oracle database the same way in this process and in the worker processes
+    connect = functools.partial(
+        conn.oracle_connect,
         config.host,
         config.port,
         config.instance,
@@ -24,19 +27,28 @@ def main():
         config.password,
         msg=False,
     )
+    # Establish connection to Oracle database
+    connection = connect()
     # Initialize an instance of the class Type1_ReportA_Rpt
-    job = itg.Type1_ReportA_Rpt(connection, config.table, config.report_id, config.template_file, config.output_file)
-    # Run the Type 1 Report A job
-    job.run()
+    job = itg.Type1_ReportA_Rpt(connection, config.table, config.report_id, config.template_file, config.output_file, config.fetch_arraysize, config.trace, config.trace_memory, config.write_only, args.resume)
+    try:
+        # Run the Type 1 Report A job
+        job.run(config.workers, connect)
+    finally:
+        # Write the time spent in each phase next to the console log, also when the job has failed
+        job.tracer.report(config.console_file)
 
 
 if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Run the Type 1 Report A job.")
+    parser.add_argument("--resume", action="store_true", help="skip the steps already completed for this week in the run manifest and only rebuild what is missing or stale")
+    args = parser.parse_args()
     warn.open_warning_handler(config.warnings_file)
     console.set_log(config.console_file)
     # Call the main method
     try:
         start = time.time()
-        main()
+        main(args)
         end = time.time()
         total = end - start
         console.log(
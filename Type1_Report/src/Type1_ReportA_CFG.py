@@ -16,3 +16,18 @@ import pdr.utils.Config as c
     console_file,
     log_path,
 ) = c.get_params(r"\\Corp\XXXXX")
+
+# Number of category jobs to run at the same time, each in its own process with its own connection (1 runs them one after another)
+workers = 1
+
+# Number of rows fetched from Oracle per round trip (the execute call also brings back the first fetch_arraysize + 1 rows)
+fetch_arraysize = 5000
+
+# Time each phase of the job (query, process, write, style, save) and write the timings next to the console log
+trace = True
+# Also trace the peak memory of each phase with tracemalloc, which slows down the job
+trace_memory = False
+
+# Stream the dynamic reports and WDC reports into write-only workbooks, so that memory does not grow with the number of rows.
+# The rows are converted to XML as they are written, so the time moves from the style and save phases to the write phase.
+write_only = False
@@ -3,16 +3,24 @@ import datetime
 import numpy as np
 import traceback
 import os
+import multiprocessing
 import pdr.handlers.Console_Handler as console
 import pdr.data.Dynamic_Report as dr
 import pdr.period.XXX as XXX
 from openpyxl import Workbook
 from openpyxl.worksheet.worksheet import Worksheet
 from openpyxl.styles import Font, Alignment, PatternFill, Border, Side
-from openpyxl.utils import get_column_letter
+from openpyxl.utils import get_column_letter, coordinate_to_tuple
 from openpyxl.cell import Cell
-from openpyxl import load_workbook
 import zipfile
+from src.classes.StyleRegistry import StyleRegistry
+from src.classes.ArtifactStore import ArtifactStore
+from src.classes.SidecarCache import SidecarCache
+from src.classes.TemplateCache import TemplateCache
+from src.classes.FetchLayer import FetchLayer
+from src.classes.SpanTracer import SpanTracer
+from src.classes.WriteOnlyReport import WriteOnlyReport
+from src.classes.RunManifest import RunManifest
 
 
 
@@ -22,10 +30,29 @@ import zipfile
 
 
 class Type1_ReportA_Rpt:
+    # Shared registry of style objects so each combination of style parameters is only created once
+    styles = StyleRegistry()
+    # Shared cache of the template workbooks so each template is only read and parsed once per process
+    templates = TemplateCache()
+    # Event set when a category job fails in a worker process, so that the other category jobs stop before their next step
+    stop_event = None
+
     # Initialize all the instance variables
-    def __init__(self, connection, table, report_id, template_path, output_path):
+    def __init__(self, connection, table, report_id, template_path, output_path, fetch_arraysize=5000, trace=False, trace_memory=False, write_only=False, resume=False, log=console.log):
         # Initialize the connection to the Oracle database
         self.connection = connection
+        # Initialize the function that writes the log messages of the job, a worker process keeps them for the main process
+        self.log = log
+        # Keep the other arguments to create the same job in a worker process
+        self.init_args = (table, report_id, template_path, output_path, fetch_arraysize, trace, trace_memory, write_only, resume)
+        # Initialize the rendering mode of the dynamic reports, True to stream the rows into a write-only workbook
+        self.write_only = write_only
+        # Initialize the resume mode, True to skip the steps already completed for this week in the run manifest
+        self.resume = resume
+        # Initialize the tracer of the time spent in each phase of the job
+        self.tracer = SpanTracer(trace, trace_memory)
+        # Initialize the fetch layer, the dynamic report library opens its cursors through the tuned connection of the layer
+        self.fetcher = FetchLayer(self.connection, arraysize=fetch_arraysize, log=self.log)
         # Initialize the table names
         self.tb_dr_reports = table
         # Initialize a list of report ID
@@ -60,12 +87,18 @@ class Type1_ReportA_Rpt:
         col1 = ["Concatenated", "Distributor Hierarchy", "Measures", "Manufacturer"]
         col2 = [f"CURRENT_{i}" for i in range(1, 157)]
         self.col_curr_db = col1 + col2
+        # Initialize the first week of the Sum_Change_Curr window, the Sum_Change_Prev window starts one week earlier
+        self.sum_change_week = 14
         self.col_fc_dates = ['RSD Vol','first date','last date','first fulldate','last fulldate','Date Range']
         self.col_summary = ["Distributor Name", "Customer Number", "Cigarettes", "e-Cigs", "Cigars", "Otp",
             "Additions", "Decreases", "Weeks Occurred", "Reason", 
             "Cigarettes (Ctns)", "e-Cigs (Units)", "Cigars (Sticks)", "Otp (Sticks)"
         ]
         self.calibri = "Calibri"
+        # Initialize the store of final comparison and WDC dataframes saved during this run
+        self.artifacts = ArtifactStore(self.log)
+        # Initialize the typed copies of the dynamic reports read back by next week's run
+        self.sidecars = SidecarCache(self.log)
         # Initialize constants
         self.SPACE = ' '
         self.UNDERSCORE = '_'
@@ -116,6 +149,8 @@ class Type1_ReportA_Rpt:
         self.input_dr_ecig = os.path.join(ecig_folder, f"{self.dr_ecig}_{self.cwk - 1}.xlsx")
         self.input_dr_cgr = os.path.join(cgr_folder, f"{self.dr_cgr}_{self.cwk - 1}.xlsx")
         self.input_dr_otp = os.path.join(otp_folder, f"{self.dr_otp}_{self.cwk - 1}.xlsx")
+        # Initialize the run manifest of this week that records the completed steps and their artifacts
+        self.manifest = RunManifest(os.path.join(cig_folder, f"Type1_ReportA_Manifest_{self.cwk}.json"), self.cwk, self.sidecars, self.log)
         # Create a list of files to delete (we only want to keep the latest 3 weeks of data)
         # self.list_delete = [os.path.join(cig_folder, f"{self.dr_cig}_{self.cwk - 3}.xlsx"),
         #                 os.path.join(ecig_folder, f"{self.dr_ecig}_{self.cwk - 3}.xlsx"),
@@ -171,20 +206,56 @@ class Type1_ReportA_Rpt:
         return False
     
     @staticmethod
-    def validate_df(df: pd.DataFrame, df_name: str):
+    def validate_df(df: pd.DataFrame, df_name: str, log=console.log):
         """Validate the DataFrame object.
 
         Args:
             df (pd.DataFrame): The DataFrame object to validate.
             df_name (str): The name of the DataFrame object
+            log (callable, optional): The function that writes the log messages. Defaults to console.log.
 
         Raises:
             ValueError: If the DataFrame is None or empty.
         """
         if df is None or df.empty:
-            console.log(f"Dataframe for '{df_name}' is None or empty.")
+            log(f"Dataframe for '{df_name}' is None or empty.")
             # raise ValueError(f"DataFrame {df_name} is None or empty.")
         
+    @staticmethod
+    def fill_zero(df: pd.DataFrame):
+        """Replace the null values with 0 in place, only in the columns that have any.
+
+        Unlike df.fillna(0), the other columns are not copied, and categorical columns without null values are left as they are.
+
+        Args:
+            df (pd.DataFrame): The dataframe to fill.
+        """
+        for i in np.flatnonzero(df.isna().any().to_numpy()):
+            df.isetitem(int(i), df.iloc[:, i].fillna(0))
+
+    @staticmethod
+    def compact_dr_frame(df: pd.DataFrame) -> pd.DataFrame:
+        """Store the columns of a dynamic report dataframe in compact types, in place.
+
+        The first three columns (distributor hierarchy, measures, manufacturer) become categoricals and
+        the numeric columns after them, like the CURRENT_* volumes, use the smallest integer type that holds
+        their values. Null values are replaced with 0 first, the same as when the dynamic report is saved.
+        Columns that are not whole numbers are kept as float64.
+
+        Args:
+            df (pd.DataFrame): The dynamic report dataframe.
+
+        Returns:
+            pd.DataFrame: the same dataframe.
+        """
+        for i in range(len(df.columns)):
+            series = df.iloc[:, i]
+            if i < 3:
+                df.isetitem(i, series.fillna(0).astype("category"))
+            elif pd.api.types.is_numeric_dtype(series) and not pd.api.types.is_bool_dtype(series):
+                df.isetitem(i, pd.to_numeric(series.fillna(0), downcast="integer"))
+        return df
+
     @staticmethod
     def dataframe_to_excel(
         df: pd.DataFrame,
@@ -204,20 +275,59 @@ class Type1_ReportA_Rpt:
             sample_cell (Cell, optional): _description_. Defaults to None.
             alt_border (bool, optional): _description_. Defaults to False.
         """
-        max_col = len(df.columns)
-        max_row = len(df.index)
-        for col in range(1, max_col + 1):
-            for row in range(1, max_row + 1):
-                col_complete = get_column_letter(col + skip_cols)
-                row_complete = row + skip_rows
-                dest_cell = ws[col_complete + str(row_complete)]
-                # Copy the style of the sample cell to the destination cell if it is provided
-                if sample_cell is not None:
-                    Type1_ReportA_Rpt.copy_paste_cell(
-                        sample_cell, dest_cell, alt_value=True, alt_border=alt_border
-                    )
-                dest_cell.value = df.iat[row - 1, col - 1]
-                
+        # Convert the offsets into the anchor cell and write the data row by row
+        anchor = f"{get_column_letter(skip_cols + 1)}{skip_rows + 1}"
+        Type1_ReportA_Rpt.bulk_write_df(df, ws, anchor, sample_cell=sample_cell, alt_border=alt_border)
+
+    @staticmethod
+    def bulk_write_df(
+        df: pd.DataFrame,
+        ws: Worksheet,
+        anchor: str = "A1",
+        sample_cell: Cell = None,
+        alt_border: bool = False,
+        batch_size: int = 10000,
+    ):
+        """Write a DataFrame into a worksheet in row batches starting from the anchor cell.
+
+        The values are written in row-major order with ws.cell(), so there is no column letter
+        lookup or coordinate parsing per cell. Cells that already exist in the template keep their
+        style, and columns outside of the DataFrame are left untouched.
+
+        Args:
+            df (pd.DataFrame): The DataFrame to be written to the worksheet.
+            ws (Worksheet): The worksheet to write the DataFrame to.
+            anchor (str, optional): The top left cell of the data block. Defaults to "A1".
+            sample_cell (Cell, optional): The cell to copy the style from. Defaults to None.
+            alt_border (bool, optional): True if the border of the sample cell should not be copied. Defaults to False.
+            batch_size (int, optional): The number of rows converted to Python values at a time. Defaults to 10000.
+        """
+        first_row, first_col = coordinate_to_tuple(anchor)
+        # Build the style of the sample cell once instead of once per destination cell
+        style = None
+        if sample_cell is not None:
+            style = (
+                Type1_ReportA_Rpt.get_cell_font(sample_cell),
+                Type1_ReportA_Rpt.get_cell_alignment(sample_cell),
+                Type1_ReportA_Rpt.get_cell_fill(sample_cell),
+                None if alt_border else Type1_ReportA_Rpt.get_cell_border(sample_cell),
+            )
+        cell = ws.cell
+        for start in range(0, len(df.index), batch_size):
+            batch = df.iloc[start:start + batch_size]
+            for i, values in enumerate(batch.itertuples(index=False, name=None)):
+                row = first_row + start + i
+                for j, value in enumerate(values):
+                    dest_cell = cell(row=row, column=first_col + j)
+                    dest_cell.value = value
+                    # Apply the style of the sample cell to the destination cell if it is provided
+                    if style is not None:
+                        dest_cell.font = style[0]
+                        dest_cell.alignment = style[1]
+                        dest_cell.fill = style[2]
+                        if style[3] is not None:
+                            dest_cell.border = style[3]
+
     @staticmethod
     def copy_paste_cell(
         src_cell: Cell,
@@ -262,7 +372,7 @@ class Type1_ReportA_Rpt:
             PatternFill: The fill of the cell.
         """
         if cell.fill.fgColor.type == "rgb":
-            fill = PatternFill(
+            fill = Type1_ReportA_Rpt.styles.fill(
                 start_color=cell.fill.start_color,
                 end_color=cell.fill.end_color,
                 fill_type=cell.fill.fill_type,
@@ -281,7 +391,7 @@ class Type1_ReportA_Rpt:
         Returns:
             Border: The border of the cell.
         """
-        return Border(
+        return Type1_ReportA_Rpt.styles.border(
             left=Side(
                 border_style=cell.border.left.border_style, color=cell.border.left.color
             ),
@@ -308,7 +418,7 @@ class Type1_ReportA_Rpt:
         Returns:
             Font: The font of the cell.
         """
-        return Font(
+        return Type1_ReportA_Rpt.styles.font(
             name=cell.font.name,
             size=cell.font.size,
             bold=cell.font.bold,
@@ -329,7 +439,7 @@ class Type1_ReportA_Rpt:
         Returns:
             Alignment: The alignment of the cell.
         """
-        return Alignment(
+        return Type1_ReportA_Rpt.styles.alignment(
             horizontal=cell.alignment.horizontal,
             vertical=cell.alignment.vertical,
             text_rotation=cell.alignment.text_rotation,
@@ -355,8 +465,8 @@ class Type1_ReportA_Rpt:
         try: 
             if data is not None:
                 cell.value = data
-            cell.font = Font(name=name, size=size, bold=bold, underline=underline)
-            cell.alignment = Alignment(
+            cell.font = Type1_ReportA_Rpt.styles.font(name=name, size=size, bold=bold, underline=underline)
+            cell.alignment = Type1_ReportA_Rpt.styles.alignment(
                 vertical=vertical, horizontal=horizontal, wrapText=wrapText
             )
             if fill is not None:
@@ -366,6 +476,44 @@ class Type1_ReportA_Rpt:
         except Exception as e:
             console.log(f"Error in set_cell_style(): {e}")
             raise e
+
+    @staticmethod
+    def set_range_style(
+        ws: Worksheet,
+        min_row: int,
+        max_row: int,
+        min_col: int,
+        max_col: int,
+        name="Arial",
+        size=10,
+        bold=False,
+        underline=None,
+        vertical="bottom",
+        horizontal="center",
+        wrapText=False,
+        fill=None,
+        border=None,
+    ):
+        """Set the same cell style as set_cell_style() on every cell in a range.
+
+        Args:
+            ws (Worksheet): The worksheet to set the cell style.
+            min_row (int): The first row of the range.
+            max_row (int): The last row of the range.
+            min_col (int): The first column of the range.
+            max_col (int): The last column of the range.
+        """
+        try:
+            Type1_ReportA_Rpt.styles.style_range(
+                ws, min_row, max_row, min_col, max_col,
+                font=Type1_ReportA_Rpt.styles.font(name=name, size=size, bold=bold, underline=underline),
+                alignment=Type1_ReportA_Rpt.styles.alignment(vertical=vertical, horizontal=horizontal, wrapText=wrapText),
+                fill=fill,
+                border=border,
+            )
+        except Exception as e:
+            console.log(f"Error in set_range_style(): {e}")
+            raise e
         
     @staticmethod
     def close_wb(wb: Workbook, output_file_name: str):
@@ -376,9 +524,10 @@ class Type1_ReportA_Rpt:
             output_file_name (str): the formatted output file name
         """
         try:
-            # Save the workbook
-            wb.save(f"{output_file_name}")
+            # Save to a temporary file first so that a failed save never leaves a partial report
+            wb.save(f"{output_file_name}.tmp")
             wb.close()
+            os.replace(f"{output_file_name}.tmp", output_file_name)
         except Exception as e:
             console.log(f"Error when saving and closing the workbook: {e}")
             raise e
@@ -407,6 +556,93 @@ class Type1_ReportA_Rpt:
         buffer = 2
         for col, width in column_widths.items():
             ws.column_dimensions[col].width = width + buffer
+
+    @staticmethod
+    def _max_str_len(series: pd.Series, sample_size: int = None) -> int:
+        """Get the length of the longest non-empty value of a column once converted to a string.
+
+        Args:
+            series (pd.Series): The column to measure.
+            sample_size (int, optional): The number of rows to sample for text columns. Defaults to None.
+
+        Returns:
+            int: The length of the longest value, 0 if all the values are empty.
+        """
+        # Only count the values that would pass the 'if cell.value' check in auto_adjust_column_width()
+        if pd.api.types.is_bool_dtype(series):
+            lengths = np.char.str_len(series[series].to_numpy().astype(str))
+        elif pd.api.types.is_numeric_dtype(series):
+            lengths = np.char.str_len(series[series != 0].to_numpy().astype(str))
+        else:
+            values = series.astype(object)
+            # Only sample text columns since they are the ones that need a conversion per value
+            if sample_size is not None and len(values) > sample_size:
+                values = values.sample(n=sample_size, random_state=0)
+            # Drop the null values first since pd.NA has no truth value
+            values = values[values.notna()]
+            values = values[values.map(bool)]
+            lengths = values.map(str).str.len()
+        return int(lengths.max()) if len(lengths) > 0 else 0
+
+    @staticmethod
+    def plan_column_widths(
+        df: pd.DataFrame,
+        ws: Worksheet,
+        data_row: int,
+        start_row: int = 1,
+        skip_cols: int = 0,
+        sample_size: int = None,
+    ) -> dict:
+        """Plan the column widths from the DataFrame written at data_row and the template cells above it.
+
+        This gives the same widths as auto_adjust_column_width(ws, start_row) without scanning the data
+        rows of the worksheet. With sample_size, text columns taller than sample_size are measured on a
+        random sample of sample_size rows. The planned width can then be too narrow, but with probability
+        at least 1 - d, fewer than ln(1/d) / sample_size of the rows are wider than planned
+        (e.g. less than 0.05% of the rows with 10000 samples and d = 1%).
+
+        Args:
+            df (pd.DataFrame): The DataFrame that was written to the worksheet.
+            ws (Worksheet): The worksheet the DataFrame was written to.
+            data_row (int): The first row of the data in the worksheet (1-based index).
+            start_row (int, optional): The first row to measure (1-based index). Defaults to 1.
+            skip_cols (int, optional): The number of columns before the data. Defaults to 0.
+            sample_size (int, optional): The number of rows to sample for text columns. Defaults to None.
+
+        Returns:
+            dict: The width of each column keyed by column letter.
+        """
+        column_widths = {}
+        # Measure the template cells between start_row and the first data row
+        if data_row > start_row:
+            for row in ws.iter_rows(min_row=start_row, max_row=data_row - 1):
+                for cell in row:
+                    if cell.value:
+                        column_width = len(str(cell.value))
+                        if column_width > column_widths.get(cell.column_letter, 0):
+                            column_widths[cell.column_letter] = column_width
+        # Measure the data with vectorized string lengths per column
+        for i in range(len(df.columns)):
+            column_width = Type1_ReportA_Rpt._max_str_len(df.iloc[:, i], sample_size)
+            col = get_column_letter(i + 1 + skip_cols)
+            if column_width > column_widths.get(col, 0):
+                column_widths[col] = column_width
+        return column_widths
+
+    @staticmethod
+    def apply_column_widths(ws: Worksheet, column_widths: dict):
+        """Apply the planned column widths to the worksheet in one pass.
+
+        Args:
+            ws (Worksheet): The worksheet to adjust the column width.
+            column_widths (dict): The width of each column keyed by column letter.
+        """
+        if ws.title == "Summary":
+            column_widths["B"] = column_widths["B"] + 3
+        # Adding a small buffer to column width for aesthetics
+        buffer = 2
+        for col, width in column_widths.items():
+            ws.column_dimensions[col].width = width + buffer
     
     @staticmethod
     def delete_files(list_delete: list):
@@ -444,17 +680,75 @@ class Type1_ReportA_Rpt:
             str: The report description for the report_id.
         """
         try:
-            query = f"SELECT report_desc FROM {self.tb_dr_reports} WHERE report_id = {report_id};"
+            query = f"SELECT report_desc FROM {self.tb_dr_reports} WHERE report_id = :report_id"
             # Execute the query and get the data as a DataFrame
-            df = pd.read_sql_query(query, self.connection)
+            df = self.fetcher.fetch_frame(query, {"report_id": int(report_id)}, name=f"report_desc {report_id}")
             # Check if the DataFrame is None or empty
-            Type1_ReportA_Rpt.validate_df(df, self.tb_dr_reports)
+            Type1_ReportA_Rpt.validate_df(df, self.tb_dr_reports, log=self.log)
             # Get the report description from the DataFrame
             return df["REPORT_DESC"][0]
         except Exception as e:
-            console.log(f"Error in query_report_desc(): {e}")
+            self.log(f"Error in query_report_desc(): {e}")
             raise e
         
+    def _dr_header_values(self, df: pd.DataFrame, report_id: int, data_name: str, row_count_cell: str) -> dict:
+        """Get the values of the header block of the dynamic report, keyed by cell coordinate."""
+        return {
+            # Report title
+            "A1": f"WKLY REPORT - {data_name.upper()}",
+            # Report subtitle
+            "A2": f"{self.SPACE.join(data_name.replace(self.UNDERSCORE, self.SPACE).split()[:4])} CHANGES RPT",
+            # Report creation date and time
+            "A3": f"Report created on {self.current_datetime}",
+            # Report details
+            "A4": f"Generated from Report ID {report_id} on {self.tb_dr_reports.split(".")[1]}.",
+            # Row count, e.g. at cell FD4
+            row_count_cell: int(df.shape[0]),
+        }
+
+    def _stream_dr_excel(self, df: pd.DataFrame, report_id: int, data_name: str, temp_file: str, out_file: str, row_count_cell: str) -> list:
+        """Create a dynamic report by streaming the rows into a write-only workbook with the header block of the template.
+
+        The output has the same values and cell styles as the template-based output of create_dr_excel(), while only
+        the template is kept in memory. Only the template rows above the data are copied.
+
+        Args:
+            df (pd.DataFrame): the data to put into the dynamic report
+            report_id (int): the report ID used to query the report data
+            data_name (str): the name of the data
+            temp_file (str): the template file path for the dynamic report
+            out_file (str): the output file path for the dynamic report
+            row_count_cell (str): the cell of the row count, e.g. 'FD4'
+
+        Returns:
+            list: the values of the header row above the data.
+        """
+        try:
+            # Get the worksheet of the template, the data starts from row 8
+            template_ws = Type1_ReportA_Rpt.templates.load(temp_file).active
+            report = WriteOnlyReport(template_ws, f"{data_name}_{self.cwk}", header_rows=7)
+            # Replace all the null values with 0
+            Type1_ReportA_Rpt.fill_zero(df)
+            # The column widths are written before the rows, so they are planned from the dataframe and the header row
+            with self.tracer.span(data_name, "style", rows=df.shape[0], cells=df.size):
+                report.set_column_widths(Type1_ReportA_Rpt.plan_column_widths(df, template_ws, data_row=8, start_row=7))
+            # Write the header block and stream the data rows with the style of _set_style_dr_excel()
+            with self.tracer.span(data_name, "write", rows=df.shape[0], cells=df.size):
+                report.write_header(self._dr_header_values(df, report_id, data_name, row_count_cell))
+                report.write_data(
+                    df,
+                    font=Type1_ReportA_Rpt.styles.font(name="Arial", size=8, bold=False, underline=None),
+                    alignment=Type1_ReportA_Rpt.styles.alignment(vertical="bottom", horizontal=None, wrapText=True),
+                    border=self.thin_border,
+                )
+            # Save and close the workbook
+            with self.tracer.span(data_name, "save", rows=df.shape[0], cells=df.size):
+                report.save(out_file)
+            return [cell.value for cell in template_ws[7]]
+        except Exception as e:
+            self.log(f"Error in _stream_dr_excel(): {e}")
+            raise e
+
     def _put_data_dr_excel(self, ws: Worksheet, df: pd.DataFrame, report_id: int, data_name: str, row_count_cell: str):
         """Put the data from the DataFrame into the worksheet.
 
@@ -467,47 +761,43 @@ class Type1_ReportA_Rpt:
             e: Any exception that occurs during the process.
         """
         try:
-            # Update the report title on cell A1
-            ws["A1"].value = f"WKLY REPORT - {data_name.upper()}"
-            # Update the report subtitle on cell A2
-            ws["A2"].value = f"{self.SPACE.join(data_name.replace(self.UNDERSCORE, self.SPACE).split()[:4])} CHANGES RPT"
-            # Update the report creation date and time on cell A3
-            ws["A3"].value = f"Report created on {self.current_datetime}"
-            # Update the report details on cell A4
-            ws["A4"].value = f"Generated from Report ID {report_id} on {self.tb_dr_reports.split(".")[1]}."
-            # Update the row count at cell FD4
-            ws[row_count_cell].value = int(df.shape[0])
+            # Update the report title, subtitle, creation time and details on cells A1 to A4 and the row count
+            for coordinate, value in self._dr_header_values(df, report_id, data_name, row_count_cell).items():
+                ws[coordinate].value = value
             # Replace all the null values with 0
-            df.fillna(0, inplace=True)
+            Type1_ReportA_Rpt.fill_zero(df)
             # Put the dataframe into the worksheet starting from cell A8
             Type1_ReportA_Rpt.dataframe_to_excel(df, ws, skip_rows=7)
         except Exception as e:
-            console.log(f"Error in _put_data_dr_excel(): {e}")
+            self.log(f"Error in _put_data_dr_excel(): {e}")
             raise e
         
-    def _set_style_dr_excel(self, ws: Worksheet, max_col: int, max_row: int):
+    def _set_style_dr_excel(self, ws: Worksheet, max_col: int, max_row: int, df: pd.DataFrame = None):
         """Set the consistent cell style for the dynamic report.
 
         Args:
             ws (Worksheet): The worksheet to set the cell style.
             max_col (int): _description_
             max_row (int): _description_
+            df (pd.DataFrame, optional): The data written from cell A8, used to plan the column widths. Defaults to None.
 
         Raises:
             e: Any exception that occurs during the process.
         """
         try:
             # Set consistent cell style
-            for row in ws.iter_rows(min_row=8, max_col=max_col, max_row=max_row):
-                for cell in row:
-                    Type1_ReportA_Rpt.set_cell_style(cell, None, size=8, horizontal=None, wrapText=True, border=self.thin_border)
+            Type1_ReportA_Rpt.set_range_style(ws, 8, max_row, 1, max_col, size=8, horizontal=None, wrapText=True, border=self.thin_border)
             # Auto adjust the column width of the worksheet
-            Type1_ReportA_Rpt.auto_adjust_column_width(ws, 7)
+            if df is not None:
+                column_widths = Type1_ReportA_Rpt.plan_column_widths(df, ws, data_row=8, start_row=7)
+                Type1_ReportA_Rpt.apply_column_widths(ws, column_widths)
+            else:
+                Type1_ReportA_Rpt.auto_adjust_column_width(ws, 7)
         except Exception as e:
-            console.log(f"Error in _set_style_dr_excel(): {e}")
+            self.log(f"Error in _set_style_dr_excel(): {e}")
             raise e
 
-    def create_dr_excel(self, df: pd.DataFrame, report_id: int, data_name: str, temp_file: str, out_file: str, row_count_cell: str):
+    def create_dr_excel(self, df: pd.DataFrame, report_id: int, data_name: str, temp_file: str, out_file: str, row_count_cell: str, keep_frame: bool = False):
         """Create a dynamic report in Excel format.
 
         Args:
@@ -516,29 +806,47 @@ class Type1_ReportA_Rpt:
             data_name (str): the name of the data
             temp_file (str): the template file path for the dynamic report
             out_file (str): the output file path for the dynamic report
-            row_count_cell (str): _description_
+            row_count_cell (str): the cell of the row count, e.g. 'FD4'
+            keep_frame (bool, optional): True to keep the data in memory for the summary report. Defaults to False.
 
         Raises:
             e: Any exception raised during the process.
         """
         try:
-            # Create a workbook for the dynamic report template file
-            wb = load_workbook(temp_file)
-            # Get the active worksheet since there is only one worksheet in the template file
-            ws = wb.active
-            # Change the worksheet name
-            ws.title = f"{data_name}_{self.cwk}"
-            # Put the data into the worksheet
-            self._put_data_dr_excel(ws, df, report_id, data_name, row_count_cell)
-            # Set consistent cell style for the dynamic report
-            self._set_style_dr_excel(ws, len(df.columns), ws.max_row)
-            # Save and close the workbook
-            Type1_ReportA_Rpt.close_wb(wb, out_file)
+            if self.write_only:
+                # Stream the rows into a write-only workbook so that the cells are not kept in memory
+                header = self._stream_dr_excel(df, report_id, data_name, temp_file, out_file, row_count_cell)
+            else:
+                # Create a workbook for the dynamic report template file
+                wb = Type1_ReportA_Rpt.templates.load(temp_file)
+                # Get the active worksheet since there is only one worksheet in the template file
+                ws = wb.active
+                # Change the worksheet name
+                ws.title = f"{data_name}_{self.cwk}"
+                # Put the data into the worksheet
+                with self.tracer.span(data_name, "write", rows=df.shape[0], cells=df.size):
+                    self._put_data_dr_excel(ws, df, report_id, data_name, row_count_cell)
+                # Set consistent cell style for the dynamic report
+                with self.tracer.span(data_name, "style", rows=df.shape[0], cells=df.size):
+                    self._set_style_dr_excel(ws, len(df.columns), ws.max_row, df)
+                # Get the header row above the data before the workbook is closed
+                header = [cell.value for cell in ws[7]]
+                # Save and close the workbook
+                with self.tracer.span(data_name, "save", rows=df.shape[0], cells=df.size):
+                    Type1_ReportA_Rpt.close_wb(wb, out_file)
+            # Save a typed copy of the data next to the report so that the excel file does not need to be parsed again,
+            # the dynamic reports are read back by next week's run and the WDC reports by a resumed run of the summary report
+            with self.tracer.span(f"{data_name} sidecar", "save", rows=df.shape[0], cells=df.size):
+                df_saved = ArtifactStore.as_saved(df, header)
+                self.sidecars.write(out_file, df_saved)
+            # Keep the data as it is saved so that the summary report does not need to read the file back
+            if keep_frame:
+                self.artifacts.put_saved(out_file, df_saved)
         except Exception as e:
-            console.log(f"Error in create_dr_excel(): {e}")
+            self.log(f"Error in create_dr_excel(): {e}")
             raise e
         else:
-            console.log(f"Dynamic report '{data_name}_{self.cwk}' has been created successfully.")
+            self.log(f"Dynamic report '{data_name}_{self.cwk}' has been created successfully.")
             
     def _init_current_sum(self, num_weeks: int) -> list:
         """Initialize the 'CURRENT-*' columns used in the query."""
@@ -549,16 +857,22 @@ class Type1_ReportA_Rpt:
     
     def get_dr_data(self, report_id: int) -> pd.DataFrame:
         # Query the database to get dynamic report data
-        df = dr.collect_dynamic_report(self.connection, self.tb_dr_reports, report_id)
+        with self.tracer.span(f"report {report_id}", "query") as span:
+            df = self.fetcher.measure(f"report {report_id}", dr.collect_dynamic_report, self.fetcher.tuned_connection, self.tb_dr_reports, report_id)
+            span.rows, span.cells = self.fetcher.metrics["rows"], None if df is None else df.size
         # Check if the dataframe is None or empty
-        Type1_ReportA_Rpt.validate_df(df, self.dr_cig)
-        return df
+        Type1_ReportA_Rpt.validate_df(df, self.dr_cig, log=self.log)
+        # Store the volume columns as integers and the key columns as categoricals
+        with self.tracer.span(f"report {report_id}", "process", rows=self.fetcher.metrics["rows"]):
+            return Type1_ReportA_Rpt.compact_dr_frame(df)
         
     def get_dr_wdc(self, report_id: int, df_name: str) -> pd.DataFrame:
         # Query the database to get dynamic report data
-        df = dr.collect_dynamic_report(self.connection, self.tb_dr_reports, report_id)
+        with self.tracer.span(f"report {report_id}", "query") as span:
+            df = self.fetcher.measure(f"report {report_id}", dr.collect_dynamic_report, self.fetcher.tuned_connection, self.tb_dr_reports, report_id)
+            span.rows, span.cells = self.fetcher.metrics["rows"], None if df is None else df.size
         # Check if the dataframe is None or empty
-        Type1_ReportA_Rpt.validate_df(df, df_name)
+        Type1_ReportA_Rpt.validate_df(df, df_name, log=self.log)
         return df
     
     def _update_weeks_curr_db(self, ws: Worksheet, weeks: list):
@@ -584,21 +898,14 @@ class Type1_ReportA_Rpt:
         Returns:
             pd.DataFrame: Any exception raised during the process.
         """
-        # Process the dataframe by filterting for the rows with "Ctns" in column 'Measures'
-        df = df[df["Measures"] == col_filter]
-        # Drop the column 'Sort Order'
-        if "Sort Order" in df.columns:
-            df.drop(columns=["Sort Order"], inplace=True)
+        # Process the dataframe by filterting for the rows with "Ctns" in column 'Measures', without the column 'Sort Order'
+        df = df.loc[df["Measures"] == col_filter, [col for col in df.columns if col != "Sort Order"]]
         # Create a new column by concatenating the first three columns
-        df[self.col_curr_db[0]] = df.iloc[:, 0].astype(str) + df.iloc[:, 1].astype(str) + df.iloc[:, 2].astype(str)
+        concatenated = df.iloc[:, 0].astype(str) + df.iloc[:, 1].astype(str) + df.iloc[:, 2].astype(str)
         # Fill all the null values with 0
-        df.fillna(0, inplace=True)
-        # Rearrange columns to make the new column the first one
-        cols = df.columns.tolist() 
-        # Move the last column (new column) to the first position 
-        cols = [cols[-1]] + cols[:-1]
-        # Reassign the columns to the dataframe
-        df = df[cols]
+        Type1_ReportA_Rpt.fill_zero(df)
+        # Insert the new column as the first one
+        df.insert(0, self.col_curr_db[0], concatenated)
         return df
     
     def _set_style_curr_db(self, ws: Worksheet, max_row: int):
@@ -609,9 +916,7 @@ class Type1_ReportA_Rpt:
             max_row (int): The maximum row number in the worksheet.
         """
         # Set consistent cell style for columns B, C, D
-        for row in ws.iter_rows(min_row=3, max_row=max_row, min_col=2, max_col=4):
-            for cell in row:
-                Type1_ReportA_Rpt.set_cell_style(cell, None, vertical="center", horizontal="left", bold=True, fill=self.gray_fill, border=self.thin_border)
+        Type1_ReportA_Rpt.set_range_style(ws, 3, max_row, 2, 4, vertical="center", horizontal="left", bold=True, fill=self.gray_fill, border=self.thin_border)
         # Auto adjust the column width of the worksheet
         #Type1_ReportA_Rpt.auto_adjust_column_width(ws, 2)
         
@@ -628,6 +933,9 @@ class Type1_ReportA_Rpt:
 
         Raises:
             e: Any exception raised during the process.
+
+        Returns:
+            pd.DataFrame: the processed dataframe written to the worksheet.
         """
         try:
             # Load the worksheet Curr_DB from the template file
@@ -635,17 +943,38 @@ class Type1_ReportA_Rpt:
             # Update all the weeks in row 2 starting from column E
             self._update_weeks_curr_db(ws, weeks)
             # Process the dataframe by filtering and creating a new column
-            df_processed = self._process_df_curr_db(df, col_filter)
+            with self.tracer.span(ws_name, "process", rows=df.shape[0]):
+                df_processed = self._process_df_curr_db(df, col_filter)
             # Put the dataframe into the worksheet starting from cell B3
-            Type1_ReportA_Rpt.dataframe_to_excel(df_processed, ws, skip_rows=2)
+            with self.tracer.span(ws_name, "write", rows=df_processed.shape[0], cells=df_processed.size):
+                Type1_ReportA_Rpt.dataframe_to_excel(df_processed, ws, skip_rows=2)
             # Set consistent cell style for the worksheet
-            self._set_style_curr_db(ws, max_row=df_processed.shape[0] + 2)
+            with self.tracer.span(ws_name, "style", rows=df_processed.shape[0], cells=df_processed.shape[0] * 3):
+                self._set_style_curr_db(ws, max_row=df_processed.shape[0] + 2)
         except Exception as e:
-            console.log(f"Error in create_ws_curr_db(): {e}")
+            self.log(f"Error in create_ws_curr_db(): {e}")
             raise e
         else:
-            console.log(f"Worksheet '{ws_name}' has been created successfully.")
+            self.log(f"Worksheet '{ws_name}' has been created successfully.")
+            return df_processed
             
+    def _read_dr_file(self, input_dr: str) -> pd.DataFrame:
+        """Read the data of a dynamic report saved in a previous run.
+
+        Args:
+            input_dr (str): The file path of the dynamic report.
+
+        Returns:
+            pd.DataFrame: the data of the dynamic report.
+        """
+        # Get data from the sidecar of the dynamic report if it is still valid
+        df = self.sidecars.read(input_dr)
+        if df is None:
+            # Otherwise get it from the excel file, skip the first 6 rows of the dataframe
+            df = pd.read_excel(input_dr, header=0, skiprows=6)
+        #df = pd.read_csv(input_dr, delimiter='|')
+        return df
+
     def create_ws_prev_db(self, wb: Workbook, ws_name: str, weeks: list, col_filter: str, input_dr: str):
         """Create the Prev_DB worksheet in the workbook.
 
@@ -658,22 +987,50 @@ class Type1_ReportA_Rpt:
 
         Raises:
             e: Any exception raised during the process.
+
+        Returns:
+            pd.DataFrame: the processed dataframe written to the worksheet.
         """
         try:
-            # Get data from the previous week's dynamic report, skip the first 6 rows of the dataframe
-            df_input = pd.read_excel(input_dr, header=0, skiprows=6)
-            #df_input = pd.read_csv(input_dr, delimiter='|')
+            # Get the data from the previous week's dynamic report
+            with self.tracer.span(ws_name, "query") as span:
+                df_input = self._read_dr_file(input_dr)
+                span.rows, span.cells = df_input.shape[0], df_input.size
+            # Store the volume columns as integers and the key columns as categoricals
+            with self.tracer.span(f"{ws_name} input", "process", rows=df_input.shape[0]):
+                Type1_ReportA_Rpt.compact_dr_frame(df_input)
             # Create the worksheet Prev_DB using previous week's data
-            self.create_ws_curr_db(wb, ws_name, df_input, weeks, col_filter)
+            return self.create_ws_curr_db(wb, ws_name, df_input, weeks, col_filter)
         except Exception as e:
-            console.log(f"Error in create_ws_prev_db(): {e}")
+            self.log(f"Error in create_ws_prev_db(): {e}")
             raise e
         
-    def _merge_df_curr_prev(self, wb: Workbook) -> pd.DataFrame:
-        """Merge the dataframes from the Curr_DB and Prev_DB worksheets.
+    def _as_curr_db_frame(self, df: pd.DataFrame) -> pd.DataFrame:
+        """Name the columns of a processed Curr_DB/Prev_DB dataframe and type its whole-number columns as integers.
 
         Args:
-            wb (Workbook): The workbook to get the data from.
+            df (pd.DataFrame): The dataframe written to the Curr_DB or Prev_DB worksheet.
+
+        Returns:
+            pd.DataFrame: a new dataframe with the Curr_DB column names.
+        """
+        # Name the columns by position as they are laid out in the worksheet, missing columns are filled with 0 after the merge
+        df = df.set_axis(self.col_curr_db[:len(df.columns)], axis=1)
+        if len(df.columns) < len(self.col_curr_db):
+            df = df.reindex(columns=self.col_curr_db)
+        # Whole-number CURRENT columns are kept as integers
+        for col in self.col_curr_db[4:]:
+            series = df[col]
+            if pd.api.types.is_float_dtype(series) and series.notna().all() and (series % 1 == 0).all():
+                df[col] = series.astype("int64")
+        return df
+
+    def _merge_df_curr_prev(self, df_curr: pd.DataFrame, df_prev: pd.DataFrame) -> pd.DataFrame:
+        """Merge the dataframes written to the Curr_DB and Prev_DB worksheets.
+
+        Args:
+            df_curr (pd.DataFrame): The processed dataframe of the Curr_DB worksheet.
+            df_prev (pd.DataFrame): The processed dataframe of the Prev_DB worksheet.
 
         Raises:
             e: Any exception raised during the process.
@@ -682,33 +1039,44 @@ class Type1_ReportA_Rpt:
             pd.DataFrame: the merged dataframe.
         """
         try:
-            # Get the data from Curr_DB and Prev_DB worksheets as datafrmes
-            data1 = wb[self.out_final_sheets[2]].values
-            data2 = wb[self.out_final_sheets[3]].values
-            # Skip the first two rows of worksheet
-            next(data1)
-            next(data1)
-            next(data2)
-            next(data2)
-            # Create the dataframes from the worksheet values
-            df_prev = pd.DataFrame(data2, columns=self.col_curr_db)
-            df_curr = pd.DataFrame(data1, columns=self.col_curr_db)
+            # Use the same column names as the worksheets
+            df_curr = self._as_curr_db_frame(df_curr)
+            df_prev = self._as_curr_db_frame(df_prev)
             # Join the two dataframes on the first column 'Concatenated'
             df_merged = pd.merge(df_curr, df_prev, on=self.col_curr_db[0], how="inner", suffixes=('_Curr', '_Prev'))
             # Replace all the null values with 0
-            df_merged.fillna(0, inplace=True)
+            Type1_ReportA_Rpt.fill_zero(df_merged)
             return df_merged
         except Exception as e:
-            console.log(f"Error in _merge_df_curr_prev(): {e}")
+            self.log(f"Error in _merge_df_curr_prev(): {e}")
             raise e
     
+    def _comparison_schema(self, end_week: int) -> dict:
+        """Name the CURRENT columns of the merged Curr_DB/Prev_DB dataframe used by the comparison.
+
+        This week's data is one week ahead of last week's data, so CURRENT_{i + 1}_Curr is compared with CURRENT_{i}_Prev.
+
+        Args:
+            end_week (int): The number of week columns to keep.
+
+        Returns:
+            dict: the aligned column names of the week differences ('diff_curr', 'diff_prev') and of the summed weeks ('sum_curr', 'sum_prev').
+        """
+        first = self.sum_change_week
+        return {
+            "diff_curr": [f"CURRENT_{i + 1}_Curr" for i in range(1, end_week)],
+            "diff_prev": [f"CURRENT_{i}_Prev" for i in range(1, end_week)],
+            "sum_curr": [f"CURRENT_{i}_Curr" for i in range(first, first + end_week)],
+            "sum_prev": [f"CURRENT_{i - 1}_Prev" for i in range(first, first + end_week)],
+        }
+
     def _process_df_merged(self, df_merged: pd.DataFrame, cols: list, end_week: int) -> pd.DataFrame:
         """Process the merged dataframe to calculate the differences and sums.
 
         Args:
             df_merged (pd.DataFrame): The merged dataframe to process.
             cols (list): The list of column names to create in the dataframe.
-            end_week (int): _description_
+            end_week (int): The number of week columns to keep.
 
         Raises:
             e: Any exception raised during the process.
@@ -717,19 +1085,24 @@ class Type1_ReportA_Rpt:
             pd.DataFrame: the processed dataframe.
         """
         try:
-            # Calculate the difference between the CURRENT_* columns
-            for i in range(1, end_week):
-                df_merged[f"C Diff {i}"] = df_merged[f"CURRENT_{i + 1}_Curr"].astype(int) - df_merged[f"CURRENT_{i}_Prev"].astype(int)
-            # Calculate the sum of the next 13 CURRENT columns
-            df_merged[cols[0]] = df_merged.iloc[:, 17:17+end_week].sum(axis=1)
-            df_merged[cols[1]] = df_merged.iloc[:, 175:175+end_week].sum(axis=1)
-            # Calculate the difference between the sum of the CURRENT columns
-            df_merged[cols[2]] = df_merged[cols[0]] - df_merged[cols[1]]
-            # Calculate the ABS sum of change
-            df_merged[cols[6]] = abs(df_merged[cols[2]]) + df_merged.filter(like="C Diff").applymap(abs).sum(axis=1)
+            schema = self._comparison_schema(end_week)
+            # Calculate the difference between the aligned CURRENT_* columns as one integer matrix
+            diff = df_merged[schema["diff_curr"]].to_numpy().astype("int64") - df_merged[schema["diff_prev"]].to_numpy().astype("int64")
+            # Calculate the sum of the CURRENT columns of each window
+            sum_curr = df_merged[schema["sum_curr"]].to_numpy().sum(axis=1)
+            sum_prev = df_merged[schema["sum_prev"]].to_numpy().sum(axis=1)
+            # Calculate the difference between the sums, and the ABS sum of change
+            sum_diff = sum_curr - sum_prev
+            abs_change = np.abs(sum_diff) + np.abs(diff).sum(axis=1)
+            # Add the new columns in place, without copying the merged dataframe
+            df_merged[[f"C Diff {i}" for i in range(1, end_week)]] = diff
+            df_merged[cols[0]] = sum_curr
+            df_merged[cols[1]] = sum_prev
+            df_merged[cols[2]] = sum_diff
+            df_merged[cols[6]] = abs_change
             return df_merged
         except Exception as e:
-            console.log(f"Error in _process_df_merged(): {e}")
+            self.log(f"Error in _process_df_merged(): {e}")
             raise e  
         
     def _process_df_filtered(self, df_filtered: pd.DataFrame, cols: list, filter_str: list, end_week: int) -> pd.DataFrame:
@@ -739,7 +1112,7 @@ class Type1_ReportA_Rpt:
             df_filtered (pd.DataFrame): The filtered dataframe to process.
             cols (list): The list of column names to create in the dataframe.
             filter_str (list): The filter string used to filter the dataframe.
-            end_week (int): _description_
+            end_week (int): The number of week columns to keep.
             
             Raises:
             e: Any exception raised during the process.
@@ -748,23 +1121,20 @@ class Type1_ReportA_Rpt:
             pd.DataFrame: the processed dataframe.
         """
         try:
-            # Update all the C Diff columns to include *
+            # Update all the C Diff columns to include * around the difference when the current or previous week is 0
             for i in range(1, end_week):
-                df_filtered[f"C Diff {i}"] = df_filtered.apply(
-                    lambda row: (
-                        "*   " if row[f"CURRENT_{i + 1}_Curr"] == 0 else "") +
-                        f"""{int(row[f"CURRENT_{i + 1}_Curr"]) - int(row[f"CURRENT_{i}_Prev"])}""" +
-                        ("   *" if row[f"CURRENT_{i}_Prev"] == 0 else ""),
-                    axis=1
-                )
-            # Calculate the AVG volume for the first 13 CURRENT columns 
-            df_filtered[cols[5]] = df_filtered.iloc[:, 5:18].mean(axis=1)
-            # Create the column 'Dist/Packing' by concatenating the 2, 3, 4 column with '/'
-            df_filtered[cols[4]] = df_filtered.apply(
-                    lambda row: (row['Distributor Hierarchy_Curr']) + " / " + (row['Measures_Curr']) + " / " + (row["Manufacturer_Curr"]), axis=1)
-            # Create the column 'Dist Name / Cust #'
-            df_filtered[cols[3]] = df_filtered.apply(
-                    lambda row: (row['Distributor Hierarchy_Curr'].split(self.SPACE, maxsplit=1)[1].title()) + " (" + (row['Distributor Hierarchy_Curr'].split(self.SPACE)[0]) + ")", axis=1)
+                curr = df_filtered[f"CURRENT_{i + 1}_Curr"].to_numpy()
+                prev = df_filtered[f"CURRENT_{i}_Prev"].to_numpy()
+                diff = (curr.astype("int64") - prev.astype("int64")).astype(str).astype(object)
+                df_filtered[f"C Diff {i}"] = np.where(curr == 0, "*   ", "").astype(object) + diff + np.where(prev == 0, "   *", "").astype(object)
+            # Calculate the AVG volume for the CURRENT columns compared with last week
+            df_filtered[cols[5]] = df_filtered[self._comparison_schema(end_week)["diff_curr"]].mean(axis=1)
+            # Create the column 'Dist/Packing' by concatenating the 2, 3, 4 column with '/', categorical columns are concatenated as objects
+            hierarchy = df_filtered['Distributor Hierarchy_Curr'].astype(object)
+            df_filtered[cols[4]] = hierarchy + " / " + df_filtered['Measures_Curr'].astype(object) + " / " + df_filtered["Manufacturer_Curr"].astype(object)
+            # Create the column 'Dist Name / Cust #' from the customer number and the name split once at the first space
+            parts = hierarchy.str.split(self.SPACE, n=1)
+            df_filtered[cols[3]] = parts.str[1].str.title() + " (" + parts.str[0] + ")"
             # Filter the dataframe based on the filter string
             if filter_str is not None:
                 if len(filter_str) == 1:
@@ -776,7 +1146,7 @@ class Type1_ReportA_Rpt:
             # Return the final dataframe
             return df_filtered[col_final]
         except Exception as e:
-            console.log(f"Error in _process_df_filtered(): {e}")
+            self.log(f"Error in _process_df_filtered(): {e}")
             raise e
         
         
@@ -789,13 +1159,9 @@ class Type1_ReportA_Rpt:
             end_week (int): _description_
         """
         # Set consistent cell style for the first 4 columns
-        for row in ws.iter_rows(min_row=6, max_row=max_row, min_col=1, max_col=4):
-            for cell in row:
-                Type1_ReportA_Rpt.set_cell_style(cell, None, name=self.calibri, size=11, horizontal=None)
+        Type1_ReportA_Rpt.set_range_style(ws, 6, max_row, 1, 4, name=self.calibri, size=11, horizontal=None)
         # Set consistent cell style for the rest of colunns
-        for row in ws.iter_rows(min_row=6, max_row=max_row, min_col=5, max_col=4+end_week):
-            for cell in row:
-                Type1_ReportA_Rpt.set_cell_style(cell, None,  name=self.calibri, size=11)
+        Type1_ReportA_Rpt.set_range_style(ws, 6, max_row, 5, 4 + end_week, name=self.calibri, size=11)
         # Set the number format of the cell to show as an integer
         for i in range(6, ws.max_row + 1):
             ws.cell(row=i, column=3).number_format = '0'
@@ -824,44 +1190,53 @@ class Type1_ReportA_Rpt:
         # Update the report creation time on cell A2
         ws["A2"].value = f"Report created on {self.current_datetime}"
         
-    def create_ws_comparison(self, wb: Workbook, ws_name: str, filter_str: list, end_week: int):
+    def create_ws_comparison(self, wb: Workbook, ws_name: str, df_curr: pd.DataFrame, df_prev: pd.DataFrame, filter_str: list, end_week: int):
         """Create the Final_Comparison worksheet in the workbook.
 
         Args:
             wb (Workbook): The workbook to create the worksheet in.
             ws_name (str): The name of the template worksheet.
+            df_curr (pd.DataFrame): The processed dataframe of the Curr_DB worksheet.
+            df_prev (pd.DataFrame): The processed dataframe of the Prev_DB worksheet.
             filter_str (list): The filter string used to filter the dataframe.
             end_week (int): _description_
 
         Raises:
             e: Any exception raised during the process.
+
+        Returns:
+            pd.DataFrame: the final dataframe written to the worksheet.
         """
         try:
             # Load the worksheet Final_Comparison from the template file
             ws = wb[ws_name]
             # Update the week code at row 5 starting from column E
             self._update_weeks_comparison(ws, end_week)
-            # Merge the data from Curr_DB and Prev_DB worksheets
-            df_merged = self._merge_df_curr_prev(wb)
-            # Initialize column names
-            cols = ["Sum_Change_Curr", "Sum_Change_Prev", "Sum_Change_Diff", "Dist Name / Cust #", "Dist/Packing", "AVG_Volume", "ABS_Sum_Change"]
-            # Process the merged dataframe by creating new columns for ABS_Sum_change and Sum_Change_Diff
-            df_merged = self._process_df_merged(df_merged, cols, end_week)       
-            # Filter for the rows with non-zero values in the CURRENT columns
-            df_filtered = df_merged[df_merged[cols[6]] != 0]
-            # Process the filtered dataframe and return the final dataframe
-            df_final = self._process_df_filtered(df_filtered, cols, filter_str, end_week)
-            # Sort the dataframe by Totale ABS change
-            df_final.sort_values(by=cols[6], ascending=False, inplace=True)
+            with self.tracer.span(ws_name, "process", rows=df_curr.shape[0] + df_prev.shape[0]):
+                # Merge the data of the Curr_DB and Prev_DB worksheets
+                df_merged = self._merge_df_curr_prev(df_curr, df_prev)
+                # Initialize column names
+                cols = ["Sum_Change_Curr", "Sum_Change_Prev", "Sum_Change_Diff", "Dist Name / Cust #", "Dist/Packing", "AVG_Volume", "ABS_Sum_Change"]
+                # Process the merged dataframe by creating new columns for ABS_Sum_change and Sum_Change_Diff
+                df_merged = self._process_df_merged(df_merged, cols, end_week)       
+                # Filter for the rows with non-zero values in the CURRENT columns
+                df_filtered = df_merged[df_merged[cols[6]] != 0]
+                # Process the filtered dataframe and return the final dataframe
+                df_final = self._process_df_filtered(df_filtered, cols, filter_str, end_week)
+                # Sort the dataframe by Totale ABS change
+                df_final.sort_values(by=cols[6], ascending=False, inplace=True)
             # Put the dataframe into the worksheet starting from cell A6
-            Type1_ReportA_Rpt.dataframe_to_excel(df_final, ws, skip_rows=5)
+            with self.tracer.span(ws_name, "write", rows=df_final.shape[0], cells=df_final.size):
+                Type1_ReportA_Rpt.dataframe_to_excel(df_final, ws, skip_rows=5)
             # Set consistent cell style for the worksheet
-            self._set_style_comparison(ws, df_final.shape[0] + 5, end_week)
+            with self.tracer.span(ws_name, "style", rows=df_final.shape[0], cells=df_final.size):
+                self._set_style_comparison(ws, df_final.shape[0] + 5, end_week)
         except Exception as e:
-            console.log(f"Error in create_ws_comparison(): {e}")
+            self.log(f"Error in create_ws_comparison(): {e}")
             raise e
         else:
-            console.log(f"Worksheet '{ws_name}' has been created successfully.")
+            self.log(f"Worksheet '{ws_name}' has been created successfully.")
+            return df_final
         
 
     def create_final_excel(self, df: pd.DataFrame, col_filter: str, temp_final: str, input_dr: str, out_final: str, filter_str: list, end_week: int = 14):
@@ -881,108 +1256,196 @@ class Type1_ReportA_Rpt:
         """
         try:
             # Load the workbook for the final deliverable template file
-            wb = load_workbook(temp_final)
+            wb = Type1_ReportA_Rpt.templates.load(temp_final)
             # Create the worksheet Curr_DB
-            self.create_ws_curr_db(wb, self.out_final_sheets[2], df, self.weeks[:len(self.weeks) - 1], col_filter)
+            df_curr = self.create_ws_curr_db(wb, self.out_final_sheets[2], df, self.weeks[:len(self.weeks) - 1], col_filter)
             # Create the worksheet Prev_DB
-            self.create_ws_prev_db(wb, self.out_final_sheets[3], self.weeks[1:], col_filter, input_dr)
-            # Create the worksheet Final_Comparison
-            self.create_ws_comparison(wb, self.out_final_sheets[0], filter_str, end_week) 
+            df_prev = self.create_ws_prev_db(wb, self.out_final_sheets[3], self.weeks[1:], col_filter, input_dr)
+            # Create the worksheet Final_Comparison from the same dataframes
+            df_final = self.create_ws_comparison(wb, self.out_final_sheets[0], df_curr, df_prev, filter_str, end_week)
+            # Get the header row above the data before the workbook is closed
+            header = [cell.value for cell in wb[self.out_final_sheets[0]][5]]
             # Save and close the workbook
-            Type1_ReportA_Rpt.close_wb(wb, out_final)
+            with self.tracer.span(os.path.basename(out_final), "save", rows=df_final.shape[0]):
+                Type1_ReportA_Rpt.close_wb(wb, out_final)
+            # Keep the data as it is saved so that the summary report does not need to read the file back
+            self.artifacts.put(out_final, df_final, header)
         except Exception as e:
-            console.log(f"Error in create_final_excel(): {e}")
+            self.log(f"Error in create_final_excel(): {e}")
             raise e
         else:
-            console.log(f"Final deliverable '{out_final}' has been created successfully.")
+            self.log(f"Final deliverable '{out_final}' has been created successfully.")
             
            
                      
+    def _dr_params(self, report_id: int, temp_file: str) -> dict:
+        """Get the parameters of a dynamic report step, recorded in the run manifest."""
+        return {
+            "table": self.tb_dr_reports,
+            "report_id": report_id,
+            "cwk": self.cwk,
+            "template_sha256": Type1_ReportA_Rpt.templates.sha256(temp_file),
+        }
+
+    def _dr_step(self, category: str, report_id: int, data_name: str, temp_file: str, out_file: str, row_count_cell: str) -> pd.DataFrame:
+        """Query the dynamic report data and create its excel file, unless it was already created for this week.
+
+        When the step is resumed, the data is read back from this week's dynamic report instead of the database.
+
+        Args:
+            category (str): The category of the job, e.g. 'cig'.
+            report_id (int): the report ID used to query the report data
+            data_name (str): the name of the data
+            temp_file (str): the template file path for the dynamic report
+            out_file (str): the output file path for the dynamic report
+            row_count_cell (str): the cell of the row count, e.g. 'FD4'
+
+        Returns:
+            pd.DataFrame: this week's dynamic report data.
+        """
+        step = f"{category} dynamic report"
+        self._check_stop(step)
+        params = self._dr_params(report_id, temp_file)
+        if self.resume and self.manifest.is_done(step, params):
+            # Read the data the same way as the previous week's dynamic report
+            with self.tracer.span(data_name, "query") as span:
+                df = self._read_dr_file(out_file)
+                span.rows, span.cells = df.shape[0], df.size
+            with self.tracer.span(data_name, "process", rows=df.shape[0]):
+                return Type1_ReportA_Rpt.compact_dr_frame(df)
+        # Query the database to get dynamic report data
+        df = self.get_dr_data(report_id)
+        # Create an excel file for the dynamic report data
+        self.create_dr_excel(df, report_id, data_name, temp_file, out_file, row_count_cell)
+        self.manifest.record(step, params, [out_file])
+        return df
+
+    def _final_step(self, category: str, df: pd.DataFrame, col_filter: str, temp_final: str, input_dr: str, out_dr: str, out_final: str, filter_str: list):
+        """Create the final deliverable, unless it was already created for this week from the same dynamic reports.
+
+        Args:
+            category (str): The category of the job, e.g. 'cig'.
+            df (pd.DataFrame): This week's dynamic report data.
+            col_filter (str): The filter string used to filter the dataframe.
+            temp_final (str): The template file path for the final deliverable.
+            input_dr (str): The input file path for the previous week's dynamic report.
+            out_dr (str): The file path of this week's dynamic report.
+            out_final (str): The output file path for the final deliverable.
+            filter_str (list): The filter string used to filter the dataframe.
+        """
+        step = f"{category} final comparison"
+        self._check_stop(step)
+        params = {
+            "dynamic_report_sha256": self.manifest.sha256(out_dr),
+            "previous_dynamic_report_sha256": self.manifest.sha256(input_dr),
+            "template_sha256": Type1_ReportA_Rpt.templates.sha256(temp_final),
+            "col_filter": col_filter,
+            "filter_str": filter_str,
+            "end_week": 14,
+        }
+        if self.resume and self.manifest.is_done(step, params):
+            return
+        self.create_final_excel(df, col_filter, temp_final, input_dr, out_final, filter_str)
+        self.manifest.record(step, params, [out_final])
+
+    def _wdc_step(self, category: str, report_id: int, data_name: str, temp_file: str, out_file: str, row_count_cell: str):
+        """Query the WDC data and create its excel file, unless it was already created for this week.
+
+        When the step is resumed, the summary report reads the data back from this week's WDC report.
+
+        Args:
+            category (str): The category of the job, e.g. 'cig'.
+            report_id (int): the report ID used to query the WDC data
+            data_name (str): the name of the data
+            temp_file (str): the template file path for the WDC report
+            out_file (str): the output file path for the WDC report
+            row_count_cell (str): the cell of the row count, e.g. 'G4'
+        """
+        step = f"{category} wdc"
+        self._check_stop(step)
+        params = self._dr_params(report_id, temp_file)
+        if self.resume and self.manifest.is_done(step, params):
+            return
+        # Query the database to get WDC data
+        df_wdc = self.get_dr_wdc(report_id, data_name)
+        # Create an excel file for the WDC data
+        self.create_dr_excel(df_wdc, report_id, data_name, temp_file, out_file, row_count_cell, keep_frame=True)
+        self.manifest.record(step, params, [out_file])
+
     def cig_job(self):
         try:
-            # Query the database to get dynamic report data
-            df_g360 = self.get_dr_data(self.rid_cig)
-            # Create an excel file for the dynamic report data
-            self.create_dr_excel(df_g360, self.rid_cig, self.dr_cig, self.temp_dr_cig, self.out_dr_cig, "FD4")
+            # Query the database to get dynamic report data and create an excel file for it, unless it was already created for this week
+            df_g360 = self._dr_step("cig", self.rid_cig, self.dr_cig, self.temp_dr_cig, self.out_dr_cig, "FD4")
             # Create an excel file for the final deliverable
-            self.create_final_excel(df_g360, "Ctns", self.temp_final_cig, self.input_dr_cig, self.out_final_cig, ["XXX Brands"])
-            # Query the database to get WDC data
-            df_wdc = self.get_dr_wdc(self.rid_cig_wdc, self.wdc_cig)
-            # Create an excel file for the WDC data
-            self.create_dr_excel(df_wdc, self.rid_cig_wdc, self.wdc_cig, self.temp_wdc, self.out_wdc_cig, "G4")
+            self._final_step("cig", df_g360, "Ctns", self.temp_final_cig, self.input_dr_cig, self.out_dr_cig, self.out_final_cig, ["XXX Brands"])
+            # Query the database to get WDC data and create an excel file for it, unless it was already created for this week
+            self._wdc_step("cig", self.rid_cig_wdc, self.wdc_cig, self.temp_wdc, self.out_wdc_cig, "G4")
         except Exception as e:
-            console.log(f"Error in cig_job(): {e}")
+            self.log(f"Error in cig_job(): {e}")
             raise e
         else:
-            console.log("CIG part has completed successfully.")
+            self.log("CIG part has completed successfully.")
             
         
     def ecig_job(self):
         try:
-            # Query the database to get dynamic report data
-            df_g360 = self.get_dr_data(self.rid_ecig)
-            # Create a excel file for the dynamic report data
-            self.create_dr_excel(df_g360, self.rid_ecig, self.dr_ecig, self.temp_dr_cig, self.out_dr_ecig, "FD4")
+            # Query the database to get dynamic report data and create an excel file for it, unless it was already created for this week
+            df_g360 = self._dr_step("ecig", self.rid_ecig, self.dr_ecig, self.temp_dr_cig, self.out_dr_ecig, "FD4")
             # Create an excel file for the final deliverable
-            self.create_final_excel(df_g360, "Units", self.temp_final_ecig, self.input_dr_ecig, self.out_final_ecig, ["blu ecigs"])
-            # Query the database to get WDC data
-            df_wdc = self.get_dr_wdc(self.rid_ecig_wdc, self.wdc_ecig)
-            # Create an excel file for the WDC data
-            self.create_dr_excel(df_wdc, self.rid_ecig_wdc, self.wdc_ecig, self.temp_wdc, self.out_wdc_ecig, "G4")
+            self._final_step("ecig", df_g360, "Units", self.temp_final_ecig, self.input_dr_ecig, self.out_dr_ecig, self.out_final_ecig, ["blu ecigs"])
+            # Query the database to get WDC data and create an excel file for it, unless it was already created for this week
+            self._wdc_step("ecig", self.rid_ecig_wdc, self.wdc_ecig, self.temp_wdc, self.out_wdc_ecig, "G4")
         except Exception as e:
-            console.log(f"Error in ecig_job(): {e}")
+            self.log(f"Error in ecig_job(): {e}")
             raise e
         else:
-            console.log("ECIG part has completed successfully.")
+            self.log("ECIG part has completed successfully.")
             
             
     def cgr_job(self):
         try:
-            # Query the database to get dynamic report data
-            df_g360 = self.get_dr_data(self.rid_cgr)
-            # Create a excel file for the dynamic report data
-            self.create_dr_excel(df_g360, self.rid_cgr, self.dr_cgr, self.temp_dr_cig, self.out_dr_cgr, "FD4")
+            # Query the database to get dynamic report data and create an excel file for it, unless it was already created for this week
+            df_g360 = self._dr_step("cgr", self.rid_cgr, self.dr_cgr, self.temp_dr_cig, self.out_dr_cgr, "FD4")
             # Create an excel file for the final deliverable. Note that we use \ to escape the parentheses in the filter string.
-            self.create_final_excel(df_g360, "Vol", self.temp_final_cgr, self.input_dr_cgr, self.out_final_cgr, ["XXX Cigars Inc \\(Mmc\\)"])
-            # Query the database to get WDC data
-            df_wdc = self.get_dr_wdc(self.rid_cgr_wdc, self.wdc_cgr)
-            # Create an excel file for the WDC data
-            self.create_dr_excel(df_wdc, self.rid_cgr_wdc, self.wdc_cgr, self.temp_wdc, self.out_wdc_cgr, "G4")
+            self._final_step("cgr", df_g360, "Vol", self.temp_final_cgr, self.input_dr_cgr, self.out_dr_cgr, self.out_final_cgr, ["XXX Cigars Inc \\(Mmc\\)"])
+            # Query the database to get WDC data and create an excel file for it, unless it was already created for this week
+            self._wdc_step("cgr", self.rid_cgr_wdc, self.wdc_cgr, self.temp_wdc, self.out_wdc_cgr, "G4")
         except Exception as e:
-            console.log(f"Error in cgr_job(): {e}")
+            self.log(f"Error in cgr_job(): {e}")
             raise e
         else:
-            console.log("CGR part has completed successfully.")
+            self.log("CGR part has completed successfully.")
             
     def otp_job(self):
         try:
-            # Query the database to get dynamic report data
-            df_g360 = self.get_dr_data(self.rid_otp)
-            # Create a excel file for the dynamic report data
-            self.create_dr_excel(df_g360, self.rid_otp, self.dr_otp, self.temp_dr_cig, self.out_dr_otp, "FD4")
+            # Query the database to get dynamic report data and create an excel file for it, unless it was already created for this week
+            df_g360 = self._dr_step("otp", self.rid_otp, self.dr_otp, self.temp_dr_cig, self.out_dr_otp, "FD4")
             # Create an excel file for the final deliverable.
-            self.create_final_excel(df_g360, "Vol", self.temp_final_otp, self.input_dr_otp, self.out_final_otp, ["Modern Oral", "Wraps"])
-            # Query the database to get WDC data
-            df_wdc = self.get_dr_wdc(self.rid_otp_wdc, self.wdc_otp)
-            # Create an excel file for the WDC data
-            self.create_dr_excel(df_wdc, self.rid_otp_wdc, self.wdc_otp, self.temp_wdc, self.out_wdc_otp, "G4")
+            self._final_step("otp", df_g360, "Vol", self.temp_final_otp, self.input_dr_otp, self.out_dr_otp, self.out_final_otp, ["Modern Oral", "Wraps"])
+            # Query the database to get WDC data and create an excel file for it, unless it was already created for this week
+            self._wdc_step("otp", self.rid_otp_wdc, self.wdc_otp, self.temp_wdc, self.out_wdc_otp, "G4")
         except Exception as e:
-            console.log(f"Error in otp_job(): {e}")
+            self.log(f"Error in otp_job(): {e}")
             raise e
         else:
-            console.log("CGR part has completed successfully.")
+            self.log("CGR part has completed successfully.")
             
-    def _put_wdc_data(self, ws: Worksheet, input_wdc: str):
+    def _put_wdc_data(self, ws: Worksheet, input_wdc: str) -> pd.DataFrame:
         """Put the WDC data into the WDC worksheet in final deliverable summary report.
 
         Args:
             ws (Worksheet): The worksheet to put the data into.
             input_wdc (str): The input file path to get the WDC data.
+
+        Returns:
+            pd.DataFrame: the WDC data written to the worksheet.
         """
-        # Read wdc report data from excel for each category
-        df = pd.read_excel(input_wdc, header=0, skiprows=6)
+        # Get the wdc report data saved during this run, otherwise read it from excel for each category
+        df = self.artifacts.get(input_wdc)
+        if df is None:
+            df = self._read_dr_file(input_wdc)
         # Check if the DataFrame is None or empty
-        Type1_ReportA_Rpt.validate_df(df, input_wdc)
+        Type1_ReportA_Rpt.validate_df(df, input_wdc, log=self.log)
         # Concatenate the 2nd and 5th columns to create a new column
         df[self.col_curr_db[0]] = df.iloc[:, 1].astype(str) + df.iloc[:, 4].astype(str)
         # Reorder the columns so that the Concatenated column is the first column
@@ -991,23 +1454,26 @@ class Type1_ReportA_Rpt:
         df = df[cols]
         # Put the data into the worksheet starting from the second row and first column
         Type1_ReportA_Rpt.dataframe_to_excel(df, ws, skip_rows=1)
+        return df
         
-    def _set_wdc_style(self, ws: Worksheet):
+    def _set_wdc_style(self, ws: Worksheet, df: pd.DataFrame):
         """Set the consistent cell style for the WDC worksheet in final deliverable summary report.
 
         Args:
             ws (Worksheet): The worksheet to set the cell style.
+            df (pd.DataFrame): The WDC data written from cell A2, used to plan the column widths.
         """
-        for row in ws.iter_rows(min_row=2, max_row=ws.max_row, min_col=1, max_col=8):
-            for cell in row:
-                # Set consistent style for column 1, 3, 4, 8
-                if cell.column in [1, 3, 4, 8]:
-                    Type1_ReportA_Rpt.set_cell_style(cell, None, name=self.calibri, size=11, horizontal=None)
-                # Set consistent style for the rest of the columns
-                else:
-                    Type1_ReportA_Rpt.set_cell_style(cell, None, name=self.calibri, size=11, horizontal="right")
+        max_row = ws.max_row
+        for col in range(1, 9):
+            # Set consistent style for column 1, 3, 4, 8
+            if col in [1, 3, 4, 8]:
+                Type1_ReportA_Rpt.set_range_style(ws, 2, max_row, col, col, name=self.calibri, size=11, horizontal=None)
+            # Set consistent style for the rest of the columns
+            else:
+                Type1_ReportA_Rpt.set_range_style(ws, 2, max_row, col, col, name=self.calibri, size=11, horizontal="right")
         # Automatically adjust the column width of the worksheet
-        Type1_ReportA_Rpt.auto_adjust_column_width(ws)
+        column_widths = Type1_ReportA_Rpt.plan_column_widths(df, ws, data_row=2)
+        Type1_ReportA_Rpt.apply_column_widths(ws, column_widths)
                     
          
     def _create_wdc_sheet(self, wb: Workbook, input_wdc: str, sheet_wdc: str):
@@ -1024,15 +1490,22 @@ class Type1_ReportA_Rpt:
         try:
             # Load the worksheet for wdc report
             ws = wb[sheet_wdc]
+            # Get the header row of the template above the data
+            header = [cell.value for cell in ws[1]]
             # Put data into the worksheet
-            self._put_wdc_data(ws, input_wdc)
+            with self.tracer.span(sheet_wdc, "write") as span:
+                df = self._put_wdc_data(ws, input_wdc)
+                span.rows, span.cells = df.shape[0], df.size
+            # Keep the data as it is saved so that the summary sheet does not need to read the worksheet back
+            self.artifacts.put(self.out_final_summary, df, header, sheet=sheet_wdc)
             # Set the style of the worksheet
-            self._set_wdc_style(ws)
+            with self.tracer.span(sheet_wdc, "style", rows=df.shape[0], cells=df.shape[0] * 8):
+                self._set_wdc_style(ws, df)
         except Exception as e:
-            console.log(f"Error in _create_wdc_sheet(): {e}")
+            self.log(f"Error in _create_wdc_sheet(): {e}")
             raise e
         else:
-            console.log(f"Worksheet '{sheet_wdc}' has been created successfully.")
+            self.log(f"Worksheet '{sheet_wdc}' has been created successfully.")
         
             
     def _create_wdc_sheets(self, wb: Workbook):
@@ -1056,31 +1529,40 @@ class Type1_ReportA_Rpt:
             for input_wdc, sheet_wdc in zip(paths, sheets):
                 self._create_wdc_sheet(wb, input_wdc, sheet_wdc)
         except Exception as e:
-            console.log(f"Error in _create_wdc_sheets(): {e}")
+            self.log(f"Error in _create_wdc_sheets(): {e}")
             raise e
         else:
-            console.log("All of the WDC worksheets have been created successfully.")
+            self.log("All of the WDC worksheets have been created successfully.")
             
-    def add_new_columns(self, row):
-        # Filter the row for the date columns and drop zero values
-        filtered_row = row[self.col_dates].replace(0, pd.NA).dropna()
-        if not filtered_row.empty:
-            # First non-zero date
-            first_date = filtered_row.index[0]
-            # Last non-zero date
-            last_date = filtered_row.index[-1]
-        else:
-            # Handle case where there are no non-zero values
-            first_date, last_date = pd.NA, pd.NA
-        return pd.Series([first_date, last_date], index=['first full', 'last full'])
+    @staticmethod
+    def _nonzero_week_range(weeks: np.ndarray) -> tuple:
+        """Find the first and last non-zero week column of each row.
+
+        Args:
+            weeks (np.ndarray): The 2D integer array of the week columns.
+
+        Returns:
+            tuple: a boolean array that is True for rows with any non-zero week, the index of the first
+                non-zero week column and the index of the last non-zero week column of each row.
+        """
+        mask = weeks != 0
+        has_nonzero = mask.any(axis=1)
+        # argmax returns the first True of each row, the reversed array gives the last one
+        first = mask.argmax(axis=1)
+        last = mask.shape[1] - 1 - mask[:, ::-1].argmax(axis=1)
+        return has_nonzero, first, last
         
             
     def _put_fc_data(self, ws: Worksheet, input_fc: str):
         try:
-            # Read final comparison data from excel for each category
-            df = pd.read_excel(input_fc, header=0, skiprows=4)
+            # Get the final comparison data saved during this run, otherwise read it from excel for each category
+            df = self.artifacts.get(input_fc)
+            if df is None:
+                df = pd.read_excel(input_fc, header=0, skiprows=4)
             # Put the old data into the worksheet starting from A6
             Type1_ReportA_Rpt.dataframe_to_excel(df, ws, skip_rows=5)
+            # Keep the values written to columns A to R before they are cleaned up below
+            df_data = df.copy()
             # Remove any white space and special character * from column 5 to 18
             for column in df.columns[4:18]:
                 df[column] = df[column].astype(str).str.replace(r'[\s*]', '', regex=True)
@@ -1096,30 +1578,24 @@ class Type1_ReportA_Rpt:
             df[rsd_vol] = df.iloc[:, 4:18].sum(axis=1)
             # Convert that column to int value
             df[rsd_vol] = df[rsd_vol].astype(int)
-            # Get the column names from 5th column to 17 column and store it as a list
-            self.col_dates = df.columns[4:17].tolist()
-            # Create the rest of new columns related to first date and last date
-            new_row = df.apply(self.add_new_columns, axis=1)
-            # Join
-            df = df.join(new_row)
-            # Replace all the null values with empty string so that the split is successful
-            df['first full'] = df['first full'].fillna(' ')
-            df['last full'] = df['last full'].fillna(' ') 
-            # Split the column
-            df[[first_date, first_fulldate]] = df['first full'].str.split(expand=True)
-            df[[last_date, last_fulldate]] = df['last full'].str.split(expand=True)
-            # Safely convert to int, replacing non-convertible values with NaN
-            df[first_date] = pd.to_numeric(df[first_date], errors='coerce')
-            df[last_date] = pd.to_numeric(df[last_date], errors='coerce')
-            # Strip white spaces, considering null values
-            df[first_fulldate] = df[first_fulldate].str.strip().replace('', None)
-            df[last_fulldate] = df[last_fulldate].str.strip().replace('', None)
+            # Find the first and last non-zero week among the 5th to 17th columns
+            has_nonzero, first, last = Type1_ReportA_Rpt._nonzero_week_range(df.iloc[:, 4:17].to_numpy(dtype="int64"))
+            # Split each week header "period code     date" into the period code and the date
+            headers = [str(col).split() + [None, None] for col in df.columns[4:17]]
+            codes = np.array([header[0] for header in headers], dtype=object)
+            dates = np.array([header[1] for header in headers], dtype=object)
+            # Map the first and last week to their period code and date, rows without non-zero week are null
+            df[first_date] = pd.to_numeric(pd.Series(np.where(has_nonzero, codes[first], None), index=df.index), errors='coerce')
+            df[last_date] = pd.to_numeric(pd.Series(np.where(has_nonzero, codes[last], None), index=df.index), errors='coerce')
+            first_dates = np.where(has_nonzero, dates[first], None)
+            last_dates = np.where(has_nonzero, dates[last], None)
+            df[first_fulldate] = first_dates
+            df[last_fulldate] = last_dates
             # Create a new column 'Date Range' with null handling
-            df[self.col_fc_dates[5]] = df.apply(
-                lambda row: None if pd.isnull(row[first_fulldate]) or pd.isnull(row[last_fulldate]) 
-                else (row[first_fulldate] if row[first_fulldate] == row[last_fulldate] 
-                    else f"{row[last_fulldate]} - {row[first_fulldate]}"), 
-                axis=1
+            df[self.col_fc_dates[5]] = np.where(
+                pd.isnull(first_dates) | pd.isnull(last_dates),
+                None,
+                np.where(first_dates == last_dates, first_dates, last_dates.astype(str) + " - " + first_dates.astype(str)),
             )
             # Reorder the columns and only keep the dates columns that are newly created
             cols_reorder = self.col_fc_dates
@@ -1128,12 +1604,18 @@ class Type1_ReportA_Rpt:
             Type1_ReportA_Rpt.dataframe_to_excel(df_dates, ws, skip_rows=5, skip_cols=18)
             # Update the period code in the headers of the worksheet, end_week parameter is default to 14 for all categories
             self._update_weeks_comparison(ws, 14)
+            # Keep the values of column A to X as saved to the worksheet, so that the summary columns are looked up without reading it
+            df_saved = pd.concat([df_data, df_dates], axis=1, ignore_index=True)
+            df_saved.columns = list(range(1, len(df_data.columns) + 1)) + list(range(19, 19 + len(df_dates.columns)))
+            df_saved = df_saved.reindex(columns=range(1, 25))
+            header = [cell.value for cell in ws[5]]
+            self.artifacts.put(self.out_final_summary, df_saved, header, sheet=ws.title)
         except zipfile.BadZipFile:
-            console.log(f"Error: The file '{input_fc}' is corrupted or being occupied by other process. Verify the file and try run the program again.")
+            self.log(f"Error: The file '{input_fc}' is corrupted or being occupied by other process. Verify the file and try run the program again.")
         except FileNotFoundError:
-            console.log(f"The file '{input_fc}' was not found. Ensure the path is correct.")
+            self.log(f"The file '{input_fc}' was not found. Ensure the path is correct.")
         except Exception as e:
-            console.log(f"Error in _put_fc_data(): {e}")
+            self.log(f"Error in _put_fc_data(): {e}")
             raise e
         
         
@@ -1144,14 +1626,10 @@ class Type1_ReportA_Rpt:
         Args:
             ws (Worksheet): The worksheet to set the cell style.
         """
-        for row in ws.iter_rows(min_row=6, max_row=ws.max_row, min_col=1, max_col=18):
-            for cell in row:
-                # Set consistent style for column 1 ~ 4
-                if cell.column in [1, 2, 3, 4]:
-                    Type1_ReportA_Rpt.set_cell_style(cell, None, name=self.calibri, size=11, horizontal=None)
-                # Set consistent style for the rest of the columns
-                else:
-                    Type1_ReportA_Rpt.set_cell_style(cell, None, name=self.calibri, size=11)
+        # Set consistent style for column 1 ~ 4
+        Type1_ReportA_Rpt.set_range_style(ws, 6, ws.max_row, 1, 4, name=self.calibri, size=11, horizontal=None)
+        # Set consistent style for the rest of the columns
+        Type1_ReportA_Rpt.set_range_style(ws, 6, ws.max_row, 5, 18, name=self.calibri, size=11)
         # Set the number format of the cell to show as an integer
         for i in range(6, ws.max_row + 1):
             ws.cell(row=i, column=3).number_format = '0'
@@ -1173,14 +1651,16 @@ class Type1_ReportA_Rpt:
             # Load the worksheet for wdc report for each category
             ws = wb[sheet_fc]
             # Put data into the worksheet
-            self._put_fc_data(ws, input_fc)
+            with self.tracer.span(sheet_fc, "write"):
+                self._put_fc_data(ws, input_fc)
             # Set the style of the worksheet
-            self._set_fc_style(ws)
+            with self.tracer.span(sheet_fc, "style", rows=ws.max_row - 5, cells=(ws.max_row - 5) * 18):
+                self._set_fc_style(ws)
         except Exception as e:
-            console.log(f"Error in _create_fc_sheet(): {e}")
+            self.log(f"Error in _create_fc_sheet(): {e}")
             raise e
         else:
-            console.log(f"Worksheet '{sheet_fc}' has been created successfully.")
+            self.log(f"Worksheet '{sheet_fc}' has been created successfully.")
             
     def _create_fc_sheets(self, wb: Workbook):
         """Create the FC worksheets for all categories in the final deliverable summary report.
@@ -1203,10 +1683,10 @@ class Type1_ReportA_Rpt:
             for input_fc, sheet_fc in zip(paths, sheets):
                 self._create_fc_sheet(wb, input_fc, sheet_fc)
         except Exception as e:
-            console.log(f"Error in _create_fc_sheets(): {e}")
+            self.log(f"Error in _create_fc_sheets(): {e}")
             raise e
         else:
-            console.log("All of the FC worksheets have been created successfully.")
+            self.log("All of the FC worksheets have been created successfully.")
         
     def _add_col_concatenated(self, wb: Workbook) -> pd.DataFrame:
         """Add the 'Concatenated' column to the final deliverable summary report.
@@ -1254,46 +1734,78 @@ class Type1_ReportA_Rpt:
         # Check each row for issues and print details if problematic
         problematic_rows = split_df[split_df[1].isna()]
         if not problematic_rows.empty:
-            console.log("Rows that did not split correctly (missing or misplaced '('):")
-            console.log(problematic_rows)
+            self.log("Rows that did not split correctly (missing or misplaced '('):")
+            self.log(problematic_rows)
         # Assign cleaned-up columns back to the dataframe
         df_final[self.col_summary[0]] = split_df[0].str.strip()
         df_final[self.col_summary[1]] = split_df[1].str.replace(")", "", regex=False).str.strip() if split_df.shape[1] > 1 else ""
         return df_final
     
-    def _add_cols_impacted(self, wb: Workbook, df_final: pd.DataFrame) -> pd.DataFrame:
+    def _add_cols_impacted(self, fc_index: dict, df_final: pd.DataFrame) -> pd.DataFrame:
         """Add the 'Impacted' columns to the final deliverable summary report.
 
         Args:
-            wb (Workbook): The workbook to get the data from.
+            fc_index (dict): The FC worksheet values built by _build_fc_index().
             df_final (pd.DataFrame): The final dataframe to add the columns to.
 
         Returns:
             pd.DataFrame: the final dataframe with the new columns.
         """
-        # Dictionary to store values from each sheet's column A for quick lookup
-        sheet_values = {}
-        # Pre-fetch and store column A values from each sheet
         for sheet in self.out_summary_sheets[1:5]:
-            ws = wb[sheet]
-            # Store all values from column A starting from row 6 in a set for quick lookup
-            sheet_values[sheet] = {cell[0].value for cell in ws.iter_rows(min_row=6, min_col=1, max_col=1)}
-        # Loop through each row in column 'Concatenated' in df_final
-        for index, row in df_final.iterrows():
-            # Get the value in 'Concatenated' column
-            value = row[self.col_curr_db[0]]
-            # Check this value against each sheet's column A values
-            for sheet in sheet_values:
-                # If value is found in the set of sheet values, assign 'X', otherwise assign ''
-                df_final.loc[index, sheet] = "X" if value in sheet_values[sheet] else ""
+            # Get the values in column A of each sheet
+            sheet_values = fc_index[sheet][1]
+            # Assign 'X' if the value is found in the sheet, otherwise assign ''
+            df_final[sheet] = np.where(df_final[self.col_curr_db[0]].isin(sheet_values), "X", "")
         # Return the final dataframe
         return df_final
     
-    def _add_cols_rsd_vol(self, wb: Workbook, df: pd.DataFrame) -> pd.DataFrame:
+    def _build_fc_index(self) -> dict:
+        """Get the FC worksheet data saved during this run so that the summary columns can be looked up by 'Concatenated'.
+
+        Returns:
+            dict: a dataframe of columns A to X for each FC worksheet, keyed by sheet name.
+            The columns are numbered from 1 like the worksheet columns and only the data rows from row 6 are kept.
+        """
+        fc_index = {}
+        for sheet in self.out_summary_sheets[1:5]:
+            # Use the dataframe saved to the sheet, a sheet without data has no rows
+            df = self.artifacts.get(self.out_final_summary, sheet=sheet)
+            if df is None:
+                df = pd.DataFrame()
+            # Number the columns like the worksheet columns, from column A to column X (Date Range)
+            df.columns = range(1, len(df.columns) + 1)
+            fc_index[sheet] = df.reindex(columns=range(1, 25)).astype(object)
+        return fc_index
+
+    @staticmethod
+    def _lookup_first(keys: pd.Series, df_index: pd.DataFrame, value_col: int, default=None, skip_none: bool = False) -> pd.Series:
+        """Look up the value of the first row in df_index whose column A matches each key.
+
+        Args:
+            keys (pd.Series): The values to look up.
+            df_index (pd.DataFrame): The worksheet values built by _build_fc_index().
+            value_col (int): The column number of the value to return.
+            default (optional): The value for the keys that are not found. Defaults to None.
+            skip_none (bool, optional): True if rows with an empty value should not count as a match. Defaults to False.
+
+        Returns:
+            pd.Series: the values found for each key, with the same index as keys.
+        """
+        df_lookup = df_index[df_index[1].notna()]
+        if skip_none:
+            df_lookup = df_lookup[df_lookup[value_col].notna()]
+        # Keep the first match of each key, as the linear scan on column A did
+        df_lookup = df_lookup.drop_duplicates(subset=1, keep="first")
+        lookup = pd.Series(df_lookup[value_col].to_numpy(dtype=object), index=df_lookup[1].to_numpy(dtype=object))
+        found = keys.isin(lookup.index).to_numpy()
+        values = keys.map(lookup).to_numpy(dtype=object)
+        return pd.Series(np.where(found, values, default), index=keys.index, dtype=object)
+
+    def _add_cols_rsd_vol(self, fc_index: dict, df: pd.DataFrame) -> pd.DataFrame:
         """Add the RSD Volume columns 'Additions' and 'Decreases' to the final deliverable summary report.
 
         Args:
-            wb (Workbook): The workbook to get the data from.
+            fc_index (dict): The FC worksheet values built by _build_fc_index().
             df (pd.DataFrame): The final dataframe to add the columns to.
 
         Raises:
@@ -1303,40 +1815,24 @@ class Type1_ReportA_Rpt:
             pd.DataFrame: the final dataframe with the new columns.
         """
         try:
-            # Adding new columns to the DataFrame
-            df['Additions'] = self.SPACE
-            df['Decreases'] = self.SPACE
-            # Loop through each row in DataFrame
-            for index, row in df.iterrows():
-                additions_flag = self.SPACE
-                decreases_flag = self.SPACE
-                # Check each worksheet
-                for sheet_name in self.out_summary_sheets[1:5]:
-                    ws = wb[sheet_name]
-                    # Get all values in column A and corresponding values in column 19 from row 6 onwards
-                    col1_values = [cell[0].value for cell in ws.iter_rows(min_row=6, min_col=1, max_col=1)]
-                    col19_values = [cell[0].value for cell in ws.iter_rows(min_row=6, min_col=19, max_col=19)]
-                    # Check conditions and update flags
-                    for i, value in enumerate(col1_values):
-                        if value == row[self.col_curr_db[0]]:
-                            if col19_values[i] is not None:
-                                if col19_values[i] > 0:
-                                    additions_flag = 'X'
-                                elif col19_values[i] < 0:
-                                    decreases_flag = 'X'
-                # Set flags in df
-                df.at[index, 'Additions'] = additions_flag
-                df.at[index, 'Decreases'] = decreases_flag
+            # Get the values in column A and column S (RSD Vol) of all the FC worksheets
+            df_rsd = pd.concat([df_index[[1, 19]] for df_index in fc_index.values()], ignore_index=True)
+            rsd_vol = pd.to_numeric(df_rsd[19], errors="coerce")
+            # A distributor is flagged if any of its rows has a positive or negative RSD volume
+            additions = set(df_rsd.loc[rsd_vol > 0, 1])
+            decreases = set(df_rsd.loc[rsd_vol < 0, 1])
+            df['Additions'] = np.where(df[self.col_curr_db[0]].isin(additions), 'X', self.SPACE)
+            df['Decreases'] = np.where(df[self.col_curr_db[0]].isin(decreases), 'X', self.SPACE)
             return df
         except Exception as e:
-            console.log(f"Error in _add_cols_rsd_vol(): {e}")
+            self.log(f"Error in _add_cols_rsd_vol(): {e}")
             raise e
         
-    def _add_cols_vol_impact(self, wb: Workbook, df: pd.DataFrame) -> pd.DataFrame:
+    def _add_cols_vol_impact(self, fc_index: dict, df: pd.DataFrame) -> pd.DataFrame:
         """Add the 'Volume Impact' columns to the final deliverable summary report.
 
         Args:
-            wb (Workbook): The workbook to get the data from.
+            fc_index (dict): The FC worksheet values built by _build_fc_index().
             df (pd.DataFrame): The final dataframe to add the columns to.
 
         Returns:
@@ -1348,37 +1844,18 @@ class Type1_ReportA_Rpt:
             self.out_summary_sheets[3]: (self.col_summary[12], 4),
             self.out_summary_sheets[4]: (self.col_summary[13], 4)
         }
-        # Initialize new columns with default blank space
-        for sheet, info in sheets.items():
-            df[info[0]] = self.SPACE  # info[0] is the column name
-
-        # Loop through each row in the DataFrame
-        for index, row in df.iterrows():
-            value = row[self.col_curr_db[0]]
-            # Check each sheet specified
-            for sheet, info in sheets.items():
-                ws = wb[sheet]
-                column_name, column_index = info
-                found = False
-                # Scan through column A in the worksheet
-                for cell in ws['A']:  # Assuming data starts from row 1, adjust range as necessary
-                    if cell.value == value:
-                        # Exact match found, now get value from the specified column
-                        target_value = ws.cell(row=cell.row, column=column_index).value
-                        if target_value is not None:
-                            df.at[index, column_name] = target_value
-                            found = True
-                            break
-                # If no match was found, ensure the column is set to a blank space
-                if not found:
-                    df.at[index, column_name] = self.SPACE
+        for sheet, (column_name, column_index) in sheets.items():
+            # Get the first non-empty value in the specified column, otherwise a blank space
+            df[column_name] = Type1_ReportA_Rpt._lookup_first(
+                df[self.col_curr_db[0]], fc_index[sheet], column_index, default=self.SPACE, skip_none=True
+            )
         return df
                 
-    def _add_cols_week_change(self, wb: Workbook, df: pd.DataFrame) -> pd.DataFrame:
+    def _add_cols_week_change(self, fc_index: dict, df: pd.DataFrame) -> pd.DataFrame:
         """Add the 'Week Change' columns to the final dataframe.
 
         Args:
-            wb (Workbook): The workbook to get the data from.
+            fc_index (dict): The FC worksheet values built by _build_fc_index().
             df (pd.DataFrame): The final dataframe to add the columns to.
 
         Returns:
@@ -1391,28 +1868,10 @@ class Type1_ReportA_Rpt:
             self.out_summary_sheets[3]: {'wk_col': 21, 'date_col': 24},
             self.out_summary_sheets[4]: {'wk_col': 21, 'date_col': 24}
         }
-        # Initialize new columns in the DataFrame
-        for category, cols in sheet_info.items():
-            df[f'{category} wk'] = None  # Initialize week columns
-            df[f'{category} date'] = None  # Initialize date columns
-        # Loop through each row in the DataFrame
-        for index, row in df.iterrows():
-            value = row[self.col_curr_db[0]]
-            # Check each sheet
-            for category, info in sheet_info.items():
-                ws = wb[category]
-                wk_col = info['wk_col']
-                date_col = info['date_col']
-                # Scan through column A in the worksheet
-                for cell in ws['A']:
-                    if cell.value == value:
-                        # Match found, retrieve week and date
-                        wk_cell = ws.cell(row=cell.row, column=wk_col)
-                        date_cell = ws.cell(row=cell.row, column=date_col)
-                        df.at[index, f'{category} wk'] = wk_cell.value
-                        df.at[index, f'{category} date'] = date_cell.value
-                        # Stop looking once a match is found for this category
-                        break
+        for category, info in sheet_info.items():
+            # Retrieve the week and date of the first matching row in each category
+            df[f'{category} wk'] = Type1_ReportA_Rpt._lookup_first(df[self.col_curr_db[0]], fc_index[category], info['wk_col'])
+            df[f'{category} date'] = Type1_ReportA_Rpt._lookup_first(df[self.col_curr_db[0]], fc_index[category], info['date_col'])
         # Return the final DataFrame
         return df
     
@@ -1461,54 +1920,43 @@ class Type1_ReportA_Rpt:
                     df.at[index, key] = lookup_dict.get(lookup_value, None)
         return df
         
-    def _add_col_reason(self, wb: Workbook, df: pd.DataFrame) -> pd.DataFrame:
+    def _add_col_reason(self, df: pd.DataFrame) -> pd.DataFrame:
         """Add the 'Reason' column to the final deliverable summary report.
 
         Args:
             df (pd.DataFrame): The final dataframe to add the column to.
 
-        Raises:
-            ValueError: _description_
-
         Returns:
             pd.DataFrame: the final dataframe with the new column.
         """
         # Reset the index of the DataFrame
         df = df.reset_index(drop=True)
-        # df[self.col_summary[1]] = df[self.col_summary[1]].astype(np.int64)
 
         # Get all reason data into single dataframe
         reason_sheet_names = [self.out_summary_sheets[5], self.out_summary_sheets[6], self.out_summary_sheets[7], self.out_summary_sheets[8]]
         reason_data_frames = []
         for sheet_name in reason_sheet_names:
-            # Get individual sheet data
-            sheet_data = pd.DataFrame(wb[sheet_name].values)
-            sheet_data.columns = sheet_data.iloc[0]
-            sheet_data = sheet_data[1:].reset_index(drop=True)
-            reason_data_frames.append(sheet_data)
+            # Use the WDC dataframe saved to the sheet, named after the header row of the sheet
+            reason_data_frames.append(self.artifacts.get(self.out_final_summary, sheet=sheet_name))
         # Concatenate all dataframe into one
         reason_data = pd.concat(reason_data_frames, ignore_index=True)
-        reason_data = reason_data.reset_index(drop=True)
 
-        # Search for reason values in the reason data and assign to the final dataframe
+        # Keep the reason of the first row of each customer number
         reason_customer_num = "CUSTOMER_NUMBER"
-        df[self.col_summary[9]] = ""
-        for row in range(len(df.index)):
-            customer_num = df.iloc[row, 2]
-            reason_query = reason_data[reason_data[reason_customer_num] == customer_num]
-            if len(reason_query.index) > 0:
-                reason = reason_query.iloc[0, 3]
-                if reason is None or reason == "" or pd.isna(reason):
-                    continue
-                df.at[row, self.col_summary[9]] = reason
+        reason_first = reason_data.drop_duplicates(subset=reason_customer_num, keep="first")
+        reasons = pd.Series(reason_first.iloc[:, 3].to_numpy(dtype=object), index=reason_first[reason_customer_num].to_numpy(dtype=object))
+        # Search for reason values in the reason data and assign to the final dataframe
+        customer_num = df.iloc[:, 2]
+        found = (customer_num.notna() & customer_num.isin(reasons.index)).to_numpy()
+        reason = customer_num.map(reasons).to_numpy(dtype=object)
+        # Leave the reason empty if the customer number is not found or the first reason is empty
+        valid = found & pd.notna(reason) & (reason != "")
+        df[self.col_summary[9]] = pd.Series(np.where(valid, reason, ""), index=df.index, dtype=object)
             
         # Return the final DataFrame
         return df
         
-
-    
-        
-    def _put_summary_data(self, wb:Workbook, ws: Worksheet):
+    def _put_summary_data(self, wb:Workbook, ws: Worksheet) -> pd.DataFrame:
         """Create the summary data and put it into the worksheet 'Summary'.
 
         Args:
@@ -1517,56 +1965,62 @@ class Type1_ReportA_Rpt:
 
         Raises:
             e: Any exception raised during the process.
+
+        Returns:
+            pd.DataFrame: the summary data written to the worksheet.
         """
         try:
+            # Index the FC worksheets once to look up the summary columns by 'Concatenated'
+            fc_index = self._build_fc_index()
             # Create a new column 'Concatenated' to store distributor name and customer number
             df_final = self._add_col_concatenated(wb)
             # Create columns 'Distributor Name' and 'Customer Number' by splitting the 'Concatenated' column
             df_final = self._add_cols_dist_cust(df_final)
             # Create columns 'Impacted Category' for each category
-            df_final = self._add_cols_impacted(wb, df_final)
+            df_final = self._add_cols_impacted(fc_index, df_final)
             # Create columns 'Additions' and 'Decreases'
-            df_final = self._add_cols_rsd_vol(wb, df_final)
+            df_final = self._add_cols_rsd_vol(fc_index, df_final)
             # Create columns under 'Volume Impact'
-            df_final = self._add_cols_vol_impact(wb, df_final)
+            df_final = self._add_cols_vol_impact(fc_index, df_final)
             # Create columns under 'Week Change'
-            df_final = self._add_cols_week_change(wb, df_final)
+            df_final = self._add_cols_week_change(fc_index, df_final)
             # Create a new column 'Weeks Occurred'
             df_final = self._add_col_weeks_occurred(df_final)
             # Create columns under 'WDC changes info'
             df_final = self._add_cols_wdc_changes(wb, df_final)
             # Create a new column 'Reason'
-            df_final = self._add_col_reason(wb, df_final)
+            df_final = self._add_col_reason(df_final)
             # Reorder the columns that we want to display in the final deliverable
             df_final = df_final[['Distributor Name', 'Customer Number', 'cig', 'blu', 'cgr', 'otp', 'Additions', 'Decreases', "Weeks Occurred", "Reason", 
             'Cigarettes (Ctns)', 'e-Cigs (Units)', 'Cigars (Sticks)', 'Otp (Sticks)']]
             # Put the data into the worksheet starting from cell A3
             Type1_ReportA_Rpt.dataframe_to_excel(df_final, ws, skip_rows=2)
+            return df_final
         except Exception as e:
-            console.log(f"Error in _put_summary_data(): {e}")
+            self.log(f"Error in _put_summary_data(): {e}")
             raise e
         
         
-    def _set_style_summary(self, ws: Worksheet):
+    def _set_style_summary(self, ws: Worksheet, df: pd.DataFrame):
         """Set the style of the worksheet Summary_Rpt.
 
         Args:
             ws (Worksheet): The worksheet to set the style for.
+            df (pd.DataFrame): The summary data written from cell A3, used to plan the column widths.
         """
         # Set consistent style for all columns starting from row 3
-        for row in ws.iter_rows(min_row=3, max_row=ws.max_row, min_col=1, max_col=ws.max_column):
-            for cell in row:
-                # Set consistent style for column 1
-                if cell.column == 1:
-                    Type1_ReportA_Rpt.set_cell_style(cell, None, name=self.calibri, size=11, horizontal=None, border=self.thin_border)
-                # Set consistent style for the rest of the columns
-                else:
-                    Type1_ReportA_Rpt.set_cell_style(cell, None, name=self.calibri, size=11, border=self.thin_border)
-                # Set the number format for column H to show only the date
-                if cell.column == 8:
-                    cell.number_format = 'MM/DD/YYYY'
+        max_row = ws.max_row
+        # Set consistent style for column 1
+        Type1_ReportA_Rpt.set_range_style(ws, 3, max_row, 1, 1, name=self.calibri, size=11, horizontal=None, border=self.thin_border)
+        # Set consistent style for the rest of the columns
+        Type1_ReportA_Rpt.set_range_style(ws, 3, max_row, 2, ws.max_column, name=self.calibri, size=11, border=self.thin_border)
+        # Set the number format for column H to show only the date
+        if ws.max_column >= 8:
+            for i in range(3, max_row + 1):
+                ws.cell(row=i, column=8).number_format = 'MM/DD/YYYY'
         # Automatically adjust the column width of the worksheet
-        Type1_ReportA_Rpt.auto_adjust_column_width(ws, 2)
+        column_widths = Type1_ReportA_Rpt.plan_column_widths(df, ws, data_row=3, start_row=2)
+        Type1_ReportA_Rpt.apply_column_widths(ws, column_widths)
         
                                
     def _create_summary_sheet(self, wb: Workbook):
@@ -1582,14 +2036,17 @@ class Type1_ReportA_Rpt:
             # Load the template for the summary sheet
             ws = wb[self.out_summary_sheets[0]]
             # Put data into the worksheet
-            self._put_summary_data(wb, ws)
+            with self.tracer.span(self.out_summary_sheets[0], "process") as span:
+                df = self._put_summary_data(wb, ws)
+                span.rows, span.cells = df.shape[0], df.size
             # Set the style of the worksheet
-            self._set_style_summary(ws)         
+            with self.tracer.span(self.out_summary_sheets[0], "style", rows=df.shape[0], cells=df.size):
+                self._set_style_summary(ws, df)         
         except Exception as e:
-            console.log(f"Error in _create_summary_sheet(): {e}")
+            self.log(f"Error in _create_summary_sheet(): {e}")
             raise e
         else:
-            console.log(f"Worksheet '{self.out_summary_sheets[0]}' has been created successfully.")
+            self.log(f"Worksheet '{self.out_summary_sheets[0]}' has been created successfully.")
  
     def create_final_summary(self, template: str, output: str):
         """Create the final deliverable summary report.
@@ -1603,7 +2060,7 @@ class Type1_ReportA_Rpt:
         """
         try:
             # Load the workbook for the final deliverable template file
-            wb = load_workbook(template)
+            wb = Type1_ReportA_Rpt.templates.load(template)
             # Create the wdc worksheets for all categories
             self._create_wdc_sheets(wb)
             # Create the Final_Comparison sheets for all categories
@@ -1611,28 +2068,170 @@ class Type1_ReportA_Rpt:
             # Create the summary sheet
             self._create_summary_sheet(wb)
             # Save and close the workbook
-            Type1_ReportA_Rpt.close_wb(wb, output)
+            with self.tracer.span(os.path.basename(output), "save"):
+                Type1_ReportA_Rpt.close_wb(wb, output)
         except Exception as e:
-            console.log(f"Error in create_final_summary(): {e}")
+            self.log(f"Error in create_final_summary(): {e}")
             raise e
         else:
-            console.log(f"Final deliverable '{output}' has been created successfully.")
+            self.log(f"Final deliverable '{output}' has been created successfully.")
             
     
-    def run(self):
+    @staticmethod
+    def _init_worker(stop_event):
+        """Keep the event that asks the category jobs of a worker process to stop, set when any category job fails."""
+        Type1_ReportA_Rpt.stop_event = stop_event
+
+    def _check_stop(self, step: str):
+        """Stop the category job before a step if another category job has failed.
+
+        Args:
+            step (str): The name of the step, e.g. 'cig dynamic report'.
+
+        Raises:
+            Exception: If another category job has failed.
+        """
+        if Type1_ReportA_Rpt.stop_event is not None and Type1_ReportA_Rpt.stop_event.is_set():
+            raise Exception(f"Step '{step}' was not started since another category job has failed.")
+
+    @staticmethod
+    def _run_category_job(connect, init_args: tuple, job_name: str) -> tuple:
+        """Run one category job in a worker process with its own connection to the Oracle database.
+
+        Args:
+            connect (callable): The function to open a connection to the Oracle database.
+            init_args (tuple): The arguments used to create the job, except for the connection.
+            job_name (str): The name of the job method, e.g. 'cig_job'.
+
+        Returns:
+            tuple: the job name, the log messages, the dataframes kept for the summary report, the phase timings, the completed steps and the error if any.
+        """
+        # Keep the log messages of the job so that the main process writes them in order
+        messages = []
+        log = lambda message: messages.append(f"[{job_name}] {message}")
+        connection = None
+        job = None
+        try:
+            connection = connect()
+            job = Type1_ReportA_Rpt(connection, *init_args, log=log)
+            # The main process saves the steps completed by all the jobs to the same run manifest
+            job.manifest.autosave = False
+            with job.tracer.span(job_name, "job"):
+                getattr(job, job_name)()
+            return job_name, messages, job.artifacts.frames, job.tracer.spans, job.manifest.recorded_steps(), None
+        except Exception as e:
+            spans = [] if job is None else job.tracer.spans
+            steps = {} if job is None else job.manifest.recorded_steps()
+            stop_event = Type1_ReportA_Rpt.stop_event
+            if stop_event is not None and stop_event.is_set():
+                # The job was stopped by the failure of another job, only the failed job reports an error
+                log(f"Stopped {job_name} since another category job has failed.")
+                return job_name, messages, {}, spans, steps, None
+            # Ask the other jobs to stop before their next step
+            if stop_event is not None:
+                stop_event.set()
+            return job_name, messages, {}, spans, steps, f"{e}\n{traceback.format_exc()}"
+        finally:
+            if connection is not None:
+                connection.close()
+
+    def _collect_job_output(self, output: tuple) -> str:
+        """Write the log messages of a finished category job, keep its dataframes and phase timings for the summary report and record its completed steps.
+
+        Args:
+            output (tuple): The output of _run_category_job().
+
+        Returns:
+            str: the error of the category job, None if it succeeded or was stopped.
+        """
+        job_name, messages, frames, spans, steps, error = output
+        for message in messages:
+            self.log(message)
+        self.tracer.merge(spans)
+        # The steps completed before a failure are kept as well, so that they can be resumed
+        self.manifest.merge(steps)
+        if error is None:
+            self.artifacts.frames.update(frames)
+        return error
+
+    def _run_jobs_parallel(self, job_names: list, workers: int, connect):
+        """Run the category jobs in a pool of worker processes, each with its own connection to the Oracle database.
+
+        The log messages of each job are written in the order of job_names. As soon as one job fails, the
+        other jobs are asked to stop before their next step, so that no report is left half written. The
+        pool is then closed and joined once every job has returned.
+
+        Args:
+            job_names (list): The names of the job methods to run.
+            workers (int): The maximum number of jobs to run at the same time.
+            connect (callable): The function to open a connection to the Oracle database.
+
+        Raises:
+            Exception: If any of the category jobs failed.
+        """
+        stop_event = multiprocessing.Event()
+        pool = multiprocessing.Pool(
+            processes=min(workers, len(job_names)),
+            initializer=Type1_ReportA_Rpt._init_worker,
+            initargs=(stop_event,),
+        )
+        errors = []
+        try:
+            pending = [
+                (job_name, pool.apply_async(Type1_ReportA_Rpt._run_category_job, (connect, self.init_args, job_name)))
+                for job_name in job_names
+            ]
+            # No other job is sent to the pool, the workers exit once their jobs have returned
+            pool.close()
+            # Wait for the jobs in order, a failed job has already asked the other jobs to stop
+            for job_name, result in pending:
+                error = self._collect_job_output(result.get())
+                if error is not None:
+                    errors.append(f"{job_name} failed: {error}")
+        except Exception:
+            stop_event.set()
+            raise
+        finally:
+            pool.close()
+            pool.join()
+        if errors:
+            raise Exception("\n".join(errors))
+
+    def _summary_params(self) -> dict:
+        """Get the parameters of the summary report step, recorded in the run manifest."""
+        inputs = [self.out_wdc_cig, self.out_wdc_ecig, self.out_wdc_cgr, self.out_wdc_otp,
+                  self.out_final_cig, self.out_final_ecig, self.out_final_cgr, self.out_final_otp]
+        return {
+            "template_sha256": Type1_ReportA_Rpt.templates.sha256(self.temp_final_summary),
+            "inputs_sha256": {os.path.basename(path): self.manifest.sha256(path) for path in inputs},
+        }
+
+    def run(self, workers: int = 1, connect=None):
         """Run the entire process to create volume changes report, WDC report, final deliverables for all category.
 
+        Args:
+            workers (int, optional): The number of category jobs to run at the same time. Defaults to 1.
+            connect (callable, optional): The function to open a connection to the Oracle database in each
+                worker process, required to run the category jobs at the same time. Defaults to None.
+
         Raises:
             e: Any exception raised during the process.
         """
         try:
             # Create volume changes dynamic report, wdc dynamic report, and final deliverable for cig, ecig, cgr, otp
-            self.cig_job()
-            self.ecig_job()
-            self.cgr_job()
-            self.otp_job()
-            # Create Volume Changes Summary report
-            self.create_final_summary(self.temp_final_summary, self.out_final_summary)
+            if workers > 1 and connect is not None:
+                self._run_jobs_parallel(["cig_job", "ecig_job", "cgr_job", "otp_job"], workers, connect)
+            else:
+                for job_name in ["cig_job", "ecig_job", "cgr_job", "otp_job"]:
+                    with self.tracer.span(job_name, "job"):
+                        getattr(self, job_name)()
+            # Create Volume Changes Summary report, unless it was already created from the same reports
+            params = self._summary_params()
+            if self.resume and self.manifest.is_done("summary", params):
+                return
+            with self.tracer.span("create_final_summary", "job"):
+                self.create_final_summary(self.temp_final_summary, self.out_final_summary)
+            self.manifest.record("summary", params, [self.out_final_summary])
         except Exception as e:
-            console.log(f"Error in run(): {e}\n{traceback.format_exc()}")
+            self.log(f"Error in run(): {e}\n{traceback.format_exc()}")
             raise e
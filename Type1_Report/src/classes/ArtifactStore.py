@@ -0,0 +1,147 @@
+import os
+import numpy as np
+import pandas as pd
+from pandas.io.parsers import TextParser
+import pdr.handlers.Console_Handler as console
+
+# Description: This class is used to keep the dataframes saved by the category jobs in memory for the rest of the run.
+
+
+class ArtifactStore:
+    def __init__(self, log=console.log):
+        # Initialize the dataframes keyed by the normalized path of the workbook they were saved to and the worksheet name
+        self.frames = {}
+        # Initialize the function that writes the log messages
+        self.log = log
+
+    @staticmethod
+    def _key(path: str, sheet: str = None) -> tuple:
+        """Normalize the file path so that the same worksheet of the same workbook always has the same key."""
+        return os.path.normcase(os.path.abspath(path)), sheet
+
+    @staticmethod
+    def _cell_value(value):
+        """Get the value pd.read_excel() reads back from a cell written with openpyxl, before the column type is inferred.
+
+        Empty cells are read as "", whole numbers as int and the other values as they were written.
+        """
+        if value is None or value is pd.NaT or value is pd.NA or (isinstance(value, float) and np.isnan(value)):
+            return ""
+        if isinstance(value, np.generic):
+            # openpyxl writes numpy booleans as numbers
+            value = int(value) if isinstance(value, np.bool_) else value.item()
+        if isinstance(value, float) and value.is_integer():
+            return int(value)
+        if isinstance(value, pd.Timestamp):
+            return value.to_pydatetime()
+        return value
+
+    @staticmethod
+    def _empty_cells(series: pd.Series) -> np.ndarray:
+        """Get a boolean array that is True for the cells of a column that pd.read_excel() reads back as empty."""
+        if isinstance(series.dtype, np.dtype) and series.dtype.kind in "biu":
+            return np.zeros(len(series), dtype=bool)
+        if isinstance(series.dtype, np.dtype) and series.dtype.kind in "fM":
+            return series.isna().to_numpy()
+        return np.array([ArtifactStore._cell_value(value) == "" for value in series.astype(object)], dtype=bool)
+
+    @staticmethod
+    def _as_read(series: pd.Series) -> pd.Series:
+        """Convert a column to what pd.read_excel() returns for it.
+
+        Args:
+            series (pd.Series): The column written to the worksheet.
+
+        Returns:
+            pd.Series: the column as read back, with a new index.
+        """
+        series = series.reset_index(drop=True)
+        if isinstance(series.dtype, np.dtype) and series.dtype.kind == "b":
+            return series
+        if isinstance(series.dtype, np.dtype) and series.dtype.kind in "iu":
+            return series.astype("int64")
+        if isinstance(series.dtype, np.dtype) and series.dtype.kind == "f":
+            # Whole numbers are read back as integers, the column is float as soon as one cell is empty or has a fraction
+            if series.notna().all() and (series % 1 == 0).all():
+                return series.astype("int64")
+            return series
+        # Other columns are inferred from their cell values the same way as pd.read_excel(), e.g. '007' becomes 7 and 'NA' becomes NaN
+        values = [ArtifactStore._cell_value(value) for value in series.astype(object)]
+        return TextParser([[0]] + [[value] for value in values], header=0, skip_blank_lines=False).read().iloc[:, 0]
+
+    @staticmethod
+    def as_saved(df: pd.DataFrame, header: list) -> pd.DataFrame:
+        """Convert a dataframe to what pd.read_excel() returns once it is saved under the header row.
+
+        The columns are typed from their cell values as pd.read_excel() does, so numeric text such as '100011'
+        is read back as a number, and '' or 'NA' as NaN. As in pd.read_excel(), the columns after the last
+        non-empty header or data cell and the rows after the last non-empty row are left out.
+
+        Args:
+            df (pd.DataFrame): The dataframe written below the header row.
+            header (list): The values of the header row in the worksheet.
+
+        Returns:
+            pd.DataFrame: a new dataframe with the same column names, column types and values as pd.read_excel().
+        """
+        df = df.reset_index(drop=True)
+        empty = [ArtifactStore._empty_cells(df.iloc[:, i]) for i in range(len(df.columns))]
+        header = [ArtifactStore._cell_value(value) for value in header]
+        # Only the columns up to the last one with a value are read
+        width = max(
+            [i + 1 for i, value in enumerate(header) if value != ""]
+            + [i + 1 for i, column_empty in enumerate(empty) if not column_empty.all()]
+            + [0]
+        )
+        if width == 0:
+            return pd.DataFrame()
+        # Header cells after the data are read as columns without values
+        empty += [np.ones(len(df.index), dtype=bool)] * (width - len(empty))
+        # Only the rows up to the last one with a value are read
+        filled = np.flatnonzero(~np.logical_and.reduce(empty[:width]))
+        rows = int(filled[-1]) + 1 if len(filled) else 0
+        df = df.iloc[:rows, :width].reset_index(drop=True)
+        columns = {i: ArtifactStore._as_read(df.iloc[:, i]) for i in range(len(df.columns))}
+        for i in range(len(df.columns), width):
+            columns[i] = pd.Series(np.nan, index=df.index, dtype="float64")
+        df_saved = pd.DataFrame(columns)
+        # The header cells are named by pd.read_excel(), e.g. empty cells become 'Unnamed: i' and repeated names get a suffix
+        df_saved.columns = TextParser([header[:width] + [""] * (width - len(header))], header=0).read().columns
+        return df_saved
+
+    def put(self, path: str, df: pd.DataFrame, header: list, sheet: str = None):
+        """Keep the dataframe saved to the workbook at path.
+
+        Args:
+            path (str): The file path of the saved workbook.
+            df (pd.DataFrame): The dataframe written below the header row.
+            header (list): The values of the header row in the worksheet.
+            sheet (str, optional): The name of the worksheet, for the workbooks with several data sheets. Defaults to None.
+        """
+        self.put_saved(path, ArtifactStore.as_saved(df, header), sheet)
+
+    def put_saved(self, path: str, df_saved: pd.DataFrame, sheet: str = None):
+        """Keep a dataframe already converted by as_saved(), so that a caller that also needs it converts it once.
+
+        Args:
+            path (str): The file path of the saved workbook.
+            df_saved (pd.DataFrame): The dataframe as returned by as_saved(), it is kept as it is.
+            sheet (str, optional): The name of the worksheet, for the workbooks with several data sheets. Defaults to None.
+        """
+        self.frames[ArtifactStore._key(path, sheet)] = df_saved
+
+    def get(self, path: str, sheet: str = None) -> pd.DataFrame:
+        """Get a copy of the dataframe saved to the workbook at path.
+
+        Args:
+            path (str): The file path of the saved workbook.
+            sheet (str, optional): The name of the worksheet, as given to put(). Defaults to None.
+
+        Returns:
+            pd.DataFrame: a copy of the dataframe, None if it was not saved during this run.
+        """
+        df = self.frames.get(ArtifactStore._key(path, sheet))
+        if df is None:
+            self.log(f"'{path}' was not created during this run, reading it from disk.")
+            return None
+        return df.copy()
@@ -0,0 +1,180 @@
+import math
+import time
+import pandas as pd
+import pdr.handlers.Console_Handler as console
+
+# Description: This class is used to fetch query results from Oracle in typed chunks with tuned fetch sizes and to log fetch metrics.
+
+
+class _TunedConnection:
+    """A connection whose cursors get the fetch sizes of the fetch layer, for the libraries that open their own cursors.
+
+    The output types of these cursors are left to the driver, so the libraries get the values they expect.
+    """
+
+    def __init__(self, fetcher):
+        self._fetcher = fetcher
+
+    def cursor(self, *args, **kwargs):
+        return self._fetcher._open_cursor(output_types=False)
+
+    def __getattr__(self, name):
+        return getattr(self._fetcher.connection, name)
+
+
+class FetchLayer:
+    def __init__(self, connection, arraysize: int = 5000, prefetchrows: int = None, chunk_rows: int = 50000, log=console.log):
+        # Initialize the connection used to open the cursors
+        self.connection = connection
+        # Initialize the function that writes the log messages
+        self.log = log
+        # Initialize the number of rows fetched per round trip and the number of rows sent back with the execute call
+        self.arraysize = arraysize
+        self.prefetchrows = arraysize + 1 if prefetchrows is None else prefetchrows
+        # Initialize the number of rows in each chunk handed out by iter_chunks()
+        self.chunk_rows = max(chunk_rows, arraysize)
+        # Initialize the metrics of the last fetch
+        self.metrics = {}
+        # Initialize the connection handed to other libraries, such as dr.collect_dynamic_report(), so that their cursors get the same fetch sizes
+        self.tuned_connection = _TunedConnection(self)
+
+    @staticmethod
+    def _output_type_handler(cursor, name, default_type, size, precision, scale):
+        """Fetch the NUMBER columns declared with a scale of 0 as int, so that they become int64 columns.
+
+        The other columns keep the default conversion of the driver.
+        The arguments are the ones passed by both cx_Oracle and python-oracledb.
+        """
+        if "NUMBER" in str(getattr(default_type, "name", default_type)) and scale == 0 and precision > 0:
+            return cursor.var(int, arraysize=cursor.arraysize)
+        return None
+
+    def _open_cursor(self, output_types: bool = True):
+        """Open a cursor with the fetch sizes and output types, skipping the settings the driver does not have.
+
+        The settings only apply to this cursor, the defaults of the driver are left as they are.
+
+        Args:
+            output_types (bool, optional): False to keep the default conversion of the driver. Defaults to True.
+        """
+        cursor = self.connection.cursor()
+        cursor.arraysize = self.arraysize
+        if hasattr(cursor, "prefetchrows"):
+            cursor.prefetchrows = self.prefetchrows
+        if output_types and hasattr(cursor, "outputtypehandler"):
+            cursor.outputtypehandler = FetchLayer._output_type_handler
+        return cursor
+
+    @staticmethod
+    def _int_columns(description) -> list:
+        """Get the positions of the columns declared as whole numbers in the cursor description."""
+        positions = []
+        for i, column in enumerate(description):
+            type_code, precision, scale = column[1], column[4], column[5]
+            if "NUMBER" in str(getattr(type_code, "name", type_code)) and scale == 0 and precision:
+                positions.append(i)
+        return positions
+
+    @staticmethod
+    def _to_frame(rows: list, names: list, int_columns: list) -> pd.DataFrame:
+        """Build a dataframe from the fetched rows, with int64 columns for the whole number columns without nulls."""
+        df = pd.DataFrame.from_records(rows, columns=names, coerce_float=True)
+        for i in int_columns:
+            series = df.iloc[:, i]
+            if pd.api.types.is_float_dtype(series) and series.notna().all():
+                df.isetitem(i, series.astype("int64"))
+        return df
+
+    def round_trips(self, rows: int) -> int:
+        """Estimate the number of round trips to fetch the rows.
+
+        The execute call brings back the first prefetchrows rows, and each following fetch brings back arraysize rows.
+        One more row than fetched is needed to know that the result has ended.
+        """
+        return 1 + max(0, math.ceil((rows + 1 - self.prefetchrows) / self.arraysize))
+
+    def _record(self, name: str, rows: int, start: float):
+        """Keep and log the metrics of a fetch."""
+        seconds = time.perf_counter() - start
+        round_trips = self.round_trips(rows)
+        self.metrics = {
+            "name": name,
+            "rows": rows,
+            "round_trips": round_trips,
+            "seconds": round(seconds, 3),
+            "rows_per_second": round(rows / seconds) if seconds > 0 else rows,
+        }
+        self.log(f"Fetched {rows} rows for '{name}' in {seconds:.2f}s ({self.metrics['rows_per_second']} rows/s, {round_trips} round trips).")
+
+    def iter_chunks(self, sql: str, params: dict = None, name: str = "query"):
+        """Run a query and yield its result in dataframes of chunk_rows rows.
+
+        Use bind variables in params (:name) rather than formatting the values into the query.
+
+        Args:
+            sql (str): The query to run, without a trailing semicolon.
+            params (dict, optional): The values of the bind variables. Defaults to None.
+            name (str, optional): The name of the query in the fetch metrics. Defaults to "query".
+
+        Yields:
+            pd.DataFrame: the next chunk of the result, all chunks have the same columns.
+        """
+        start = time.perf_counter()
+        cursor = self._open_cursor()
+        rows_fetched = 0
+        try:
+            cursor.execute(sql, params or {})
+            names = [column[0] for column in cursor.description]
+            int_columns = FetchLayer._int_columns(cursor.description)
+            rows = []
+            while True:
+                batch = cursor.fetchmany(self.arraysize)
+                if not batch:
+                    break
+                rows.extend(batch)
+                if len(rows) >= self.chunk_rows:
+                    rows_fetched += len(rows)
+                    yield FetchLayer._to_frame(rows, names, int_columns)
+                    rows = []
+            if rows or rows_fetched == 0:
+                rows_fetched += len(rows)
+                yield FetchLayer._to_frame(rows, names, int_columns)
+        finally:
+            cursor.close()
+            self._record(name, rows_fetched, start)
+
+    def fetch_frame(self, sql: str, params: dict = None, name: str = "query") -> pd.DataFrame:
+        """Run a query and get its whole result in one dataframe.
+
+        Args:
+            sql (str): The query to run, without a trailing semicolon.
+            params (dict, optional): The values of the bind variables. Defaults to None.
+            name (str, optional): The name of the query in the fetch metrics. Defaults to "query".
+
+        Returns:
+            pd.DataFrame: the result of the query.
+        """
+        chunks = list(self.iter_chunks(sql, params, name))
+        if len(chunks) == 1:
+            return chunks[0]
+        return pd.concat(chunks, ignore_index=True)
+
+    def measure(self, name: str, collect, *args) -> pd.DataFrame:
+        """Call a function that fetches a dataframe through its own cursor, and log its fetch metrics.
+
+        Pass tuned_connection to the function instead of the connection, so that its cursors get the fetch sizes
+        of the layer. Their output types are not changed, so the function returns the same dataframe as with the
+        connection. The round trips are estimated from the fetch sizes.
+
+        Args:
+            name (str): The name of the query in the fetch metrics.
+            collect (callable): The function that returns the dataframe.
+            *args: The arguments of the function.
+
+        Returns:
+            pd.DataFrame: the dataframe returned by the function.
+        """
+        start = time.perf_counter()
+        df = collect(*args)
+        self._record(name, 0 if df is None else len(df.index), start)
+        return df
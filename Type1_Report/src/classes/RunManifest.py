@@ -0,0 +1,135 @@
+import os
+import json
+import datetime
+import pdr.handlers.Console_Handler as console
+from src.classes.SidecarCache import SidecarCache
+
+# Description: This class is used to record the artifacts completed by the run of a week, so that a failed run can be resumed without redoing them.
+
+
+class RunManifest:
+    def __init__(self, path: str, cwk: int, sidecars: SidecarCache, log=console.log):
+        # Initialize the function that writes the log messages
+        self.log = log
+        # Initialize the manifest file and the week code it belongs to
+        self.path = path
+        self.cwk = cwk
+        self.version = 1
+        # Initialize the sidecar cache whose checksums are shared with the manifest, so that each file is hashed once
+        self.sidecars = sidecars
+        # Initialize the switch to save the manifest after each step, worker processes hand their steps to the main process instead
+        self.autosave = True
+        # Initialize the completed steps keyed by step name, each with its parameters and artifacts
+        self.steps = self._load()
+        # The recorded checksums are still valid for the artifacts that have not been touched since
+        for step in self.steps.values():
+            self.sidecars.checksums.update(step["artifacts"])
+        # Initialize the names of the steps completed by this instance
+        self.recorded = []
+
+    def _load(self) -> dict:
+        """Read the completed steps from the manifest file, none if it is missing, corrupted or of another week."""
+        if not os.path.exists(self.path):
+            return {}
+        try:
+            with open(self.path, "r") as file:
+                manifest = json.load(file)
+            if manifest.get("version") != self.version or manifest.get("cwk") != self.cwk:
+                self.log(f"Run manifest '{self.path}' is not for week {self.cwk}, all steps will be run.")
+                return {}
+            return manifest["steps"]
+        except (OSError, ValueError, KeyError) as e:
+            self.log(f"Error when reading the run manifest '{self.path}': {e}")
+            return {}
+
+    def save(self):
+        """Write the completed steps to the manifest file."""
+        try:
+            manifest = {"version": self.version, "cwk": self.cwk, "steps": self.steps}
+            # Write to a temporary file first so that a failed write never leaves a partial manifest
+            with open(self.path + ".tmp", "w") as file:
+                json.dump(manifest, file, indent=1)
+            os.replace(self.path + ".tmp", self.path)
+        except Exception as e:
+            # The manifest only speeds up a resumed run, the artifacts are still the source of truth
+            self.log(f"Error when writing the run manifest '{self.path}': {e}")
+
+    @staticmethod
+    def _normalize(params: dict) -> dict:
+        """Get the parameters as they are read back from the manifest file, e.g. tuples become lists."""
+        return json.loads(json.dumps(params))
+
+    def sha256(self, path: str) -> str:
+        """Get the SHA-256 checksum of a file, without reading it again if it has not changed since it was last hashed.
+
+        Args:
+            path (str): The file path.
+
+        Returns:
+            str: the hexadecimal checksum of the file, None if the file does not exist.
+        """
+        if not os.path.exists(path):
+            return None
+        return self.sidecars.checksum(path)
+
+    def is_done(self, step: str, params: dict) -> bool:
+        """Check if a step was completed with the same parameters and its artifacts are unchanged.
+
+        Args:
+            step (str): The name of the step, e.g. 'cig dynamic report'.
+            params (dict): The parameters the step would be run with.
+
+        Returns:
+            bool: True if the step does not need to be run again.
+        """
+        entry = self.steps.get(step)
+        if entry is None:
+            return False
+        if entry["params"] != RunManifest._normalize(params):
+            self.log(f"Step '{step}' was completed with other parameters, running it again.")
+            return False
+        for path, artifact in entry["artifacts"].items():
+            # The checksum is only computed again when the file was touched
+            if self.sha256(path) != artifact["sha256"]:
+                self.log(f"Artifact '{path}' of step '{step}' is missing or has changed, running the step again.")
+                return False
+        self.log(f"Step '{step}' was already completed on {entry['completed']}, skipping it.")
+        return True
+
+    def record(self, step: str, params: dict, artifacts: list):
+        """Record a completed step with the checksum of each of its artifacts and save the manifest.
+
+        Args:
+            step (str): The name of the step, e.g. 'cig dynamic report'.
+            params (dict): The parameters the step was run with.
+            artifacts (list): The file paths written by the step.
+        """
+        try:
+            records = {}
+            for path in artifacts:
+                # The sidecar of a report has already hashed it when it was saved
+                self.sidecars.checksum(path)
+                records[path] = dict(self.sidecars.checksums[path])
+            self.steps[step] = {
+                "params": RunManifest._normalize(params),
+                "artifacts": records,
+                "completed": datetime.datetime.now().strftime('%m/%d/%Y %H:%M:%S'),
+            }
+        except Exception as e:
+            self.log(f"Error when recording step '{step}' in the run manifest: {e}")
+            return
+        self.recorded.append(step)
+        if self.autosave:
+            self.save()
+
+    def recorded_steps(self) -> dict:
+        """Get the steps completed by this instance, to hand them from a worker process to the main process."""
+        return {step: self.steps[step] for step in self.recorded}
+
+    def merge(self, steps: dict):
+        """Add the steps completed by a job in a worker process and save the manifest."""
+        if steps:
+            self.steps.update(steps)
+            for step in steps.values():
+                self.sidecars.checksums.update(step["artifacts"])
+            self.save()
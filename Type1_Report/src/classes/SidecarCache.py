@@ -0,0 +1,155 @@
+import os
+import json
+import hashlib
+import zipfile
+import numpy as np
+import pandas as pd
+import pdr.handlers.Console_Handler as console
+
+# Description: This class is used to save a typed columnar copy (.npz) of a report next to its excel file and to read it back.
+
+
+class SidecarCache:
+    def __init__(self, log=console.log):
+        # Initialize the function that writes the log messages
+        self.log = log
+        # Initialize the extension of the sidecar files and the key of the metadata entry
+        self.extension = ".npz"
+        self.meta_key = "__meta__"
+        self.version = 2
+        # Initialize the checksums of the files already hashed, keyed by file path with their modified time and size
+        self.checksums = {}
+
+    @staticmethod
+    def file_sha256(path: str) -> str:
+        """Get the SHA-256 checksum of a file.
+
+        Args:
+            path (str): The file path.
+
+        Returns:
+            str: the hexadecimal checksum of the file.
+        """
+        sha256 = hashlib.sha256()
+        with open(path, "rb") as file:
+            for chunk in iter(lambda: file.read(1024 * 1024), b""):
+                sha256.update(chunk)
+        return sha256.hexdigest()
+
+    def checksum(self, path: str) -> str:
+        """Get the SHA-256 checksum of a file, without reading it again if it has not changed since it was last hashed.
+
+        Args:
+            path (str): The file path.
+
+        Returns:
+            str: the hexadecimal checksum of the file.
+        """
+        stat = os.stat(path)
+        known = self.checksums.get(path)
+        if known is not None and known["mtime"] == stat.st_mtime_ns and known["size"] == stat.st_size:
+            return known["sha256"]
+        sha256 = SidecarCache.file_sha256(path)
+        self.checksums[path] = {"sha256": sha256, "size": stat.st_size, "mtime": stat.st_mtime_ns}
+        return sha256
+
+    def sidecar_path(self, excel_path: str) -> str:
+        """Get the sidecar file path for an excel file."""
+        return os.path.splitext(excel_path)[0] + self.extension
+
+    @staticmethod
+    def _json_name(name):
+        """Get a column name as a JSON value, keeping numbers as numbers, None if it cannot be kept as it is."""
+        if isinstance(name, (bool, np.bool_)):
+            return None
+        if isinstance(name, (int, float, np.integer, np.floating)):
+            return name.item() if isinstance(name, np.generic) else name
+        return name if isinstance(name, str) else None
+
+    def write(self, excel_path: str, df: pd.DataFrame):
+        """Save the dataframe next to the excel file it was saved to.
+
+        The dataframe must already be typed as pd.read_excel() returns it (see ArtifactStore.as_saved()), the
+        sidecar gives back exactly the same dataframe. Text columns are stored as unicode arrays with a mask of
+        their NaN values, so a dataframe with an object column that also holds numbers or dates is not cached
+        and the excel file is used instead.
+
+        Args:
+            excel_path (str): The file path of the saved excel file.
+            df (pd.DataFrame): The dataframe saved to the excel file.
+        """
+        try:
+            arrays = {}
+            dtypes = []
+            names = [SidecarCache._json_name(name) for name in df.columns]
+            if any(name is None for name in names):
+                self.log(f"Skipped the sidecar for '{excel_path}' since its column names are not text or numbers.")
+                return
+            for i in range(len(df.columns)):
+                series = df.iloc[:, i]
+                if isinstance(series.dtype, np.dtype) and series.dtype.kind in "biufM":
+                    arrays[f"c{i}"] = series.to_numpy()
+                    dtypes.append(str(series.dtype))
+                elif series.dtype == object and series.map(lambda value: type(value) is str or (type(value) is float and np.isnan(value))).all():
+                    missing = series.isna().to_numpy()
+                    arrays[f"c{i}"] = series.where(~missing, "").to_numpy(dtype=str)
+                    arrays[f"m{i}"] = missing
+                    dtypes.append("object")
+                else:
+                    self.log(f"Skipped the sidecar for '{excel_path}' since column '{df.columns[i]}' has mixed types.")
+                    return
+            meta = {
+                "version": self.version,
+                "columns": names,
+                "dtypes": dtypes,
+                "rows": len(df.index),
+                "source_sha256": self.checksum(excel_path),
+            }
+            arrays[self.meta_key] = np.array(json.dumps(meta))
+            # Write to a temporary file first so that a failed write never leaves a partial sidecar
+            sidecar = self.sidecar_path(excel_path)
+            with open(sidecar + ".tmp", "wb") as file:
+                np.savez(file, **arrays)
+            os.replace(sidecar + ".tmp", sidecar)
+        except Exception as e:
+            # The sidecar is only a cache, the excel file is still the source of truth
+            self.log(f"Error when writing the sidecar for '{excel_path}': {e}")
+
+    def read(self, excel_path: str) -> pd.DataFrame:
+        """Read the dataframe from the sidecar of the excel file if it is still valid.
+
+        Args:
+            excel_path (str): The file path of the excel file.
+
+        Returns:
+            pd.DataFrame: the cached dataframe, None if the sidecar is missing, corrupted or stale.
+        """
+        sidecar = self.sidecar_path(excel_path)
+        if not os.path.exists(sidecar) or not os.path.exists(excel_path):
+            return None
+        try:
+            with np.load(sidecar, allow_pickle=False) as data:
+                meta = json.loads(str(data[self.meta_key]))
+                if meta["version"] != self.version:
+                    self.log(f"Sidecar '{sidecar}' has an old version, reading '{excel_path}' instead.")
+                    return None
+                # Check that the sidecar was written for the current content of the excel file
+                if meta["source_sha256"] != self.checksum(excel_path):
+                    self.log(f"Sidecar '{sidecar}' does not match '{excel_path}', reading the excel file instead.")
+                    return None
+                columns = {}
+                for i, dtype in enumerate(meta["dtypes"]):
+                    values = data[f"c{i}"].astype(dtype)
+                    if dtype == "object":
+                        # Text columns hold NaN where pd.read_excel() found an empty or 'NA' cell
+                        values[data[f"m{i}"]] = np.nan
+                    columns[i] = values
+            df = pd.DataFrame(columns)
+            df.columns = meta["columns"]
+            if len(df.index) != meta["rows"]:
+                self.log(f"Sidecar '{sidecar}' is incomplete, reading '{excel_path}' instead.")
+                return None
+            return df
+        except (OSError, ValueError, KeyError, zipfile.BadZipFile) as e:
+            self.log(f"Error when reading the sidecar '{sidecar}': {e}")
+            return None
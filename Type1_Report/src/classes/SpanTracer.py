@@ -0,0 +1,172 @@
+import os
+import json
+import time
+import threading
+import tracemalloc
+import pdr.handlers.Console_Handler as console
+
+# Description: This class is used to time each phase of the job (query, process, write, style, save) and to write the timings as JSON and Chrome trace files.
+
+
+class _Span:
+    def __init__(self, tracer, name: str, phase: str, rows: int, cells: int):
+        # Initialize the span, rows and cells can also be set inside the with block
+        self.tracer = tracer
+        self.name = name
+        self.phase = phase
+        self.rows = rows
+        self.cells = cells
+        # Initialize the highest traced memory of the spans nested in this one
+        self.child_peak = 0
+
+    def __enter__(self):
+        self.tracer.stack.append(self)
+        self.path = "/".join(span.name for span in self.tracer.stack)
+        if self.tracer.trace_memory:
+            self.memory_start = tracemalloc.get_traced_memory()[0]
+            tracemalloc.reset_peak()
+        self.ts = time.time()
+        self.cpu_start = time.process_time()
+        self.wall_start = time.perf_counter()
+        return self
+
+    def __exit__(self, exc_type, exc_value, tb):
+        wall = time.perf_counter() - self.wall_start
+        cpu = time.process_time() - self.cpu_start
+        self.tracer.stack.pop()
+        record = {
+            "name": self.path,
+            "phase": self.phase,
+            "ts": self.ts,
+            "wall_s": round(wall, 6),
+            "cpu_s": round(cpu, 6),
+            "rows": self.rows,
+            "cells": self.cells,
+            "pid": os.getpid(),
+            "tid": threading.get_ident(),
+            "error": None if exc_type is None else repr(exc_value),
+        }
+        if self.tracer.trace_memory:
+            # reset_peak() was called by the nested spans, so their peaks are kept separately
+            peak = max(tracemalloc.get_traced_memory()[1], self.child_peak)
+            record["peak_mb"] = round((peak - self.memory_start) / 1024 / 1024, 2)
+            if self.tracer.stack:
+                parent = self.tracer.stack[-1]
+                parent.child_peak = max(parent.child_peak, peak)
+        self.tracer.spans.append(record)
+        return False
+
+
+class _NullSpan:
+    # The span handed out when tracing is off, it is shared by all the callers so setting rows and cells on it is ignored
+    rows = None
+    cells = None
+
+    def __setattr__(self, name, value):
+        pass
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, tb):
+        return False
+
+
+class SpanTracer:
+    null_span = _NullSpan()
+
+    def __init__(self, enabled: bool = True, trace_memory: bool = False):
+        # Initialize the switches, tracing the memory slows down the job so it is off by default
+        self.enabled = enabled
+        self.trace_memory = enabled and trace_memory
+        # Initialize the finished spans and the spans that are still open
+        self.spans = []
+        self.stack = []
+        if self.trace_memory and not tracemalloc.is_tracing():
+            tracemalloc.start()
+
+    def span(self, name: str, phase: str, rows: int = None, cells: int = None):
+        """Time the code in a with block.
+
+        Args:
+            name (str): The name of the span, prefixed with the names of the spans it is nested in.
+            phase (str): The phase of the job, e.g. 'query', 'process', 'write', 'style' or 'save'.
+            rows (int, optional): The number of rows handled in the span. Defaults to None.
+            cells (int, optional): The number of cells handled in the span. Defaults to None.
+
+        Returns:
+            the span, whose rows and cells can be set inside the with block.
+        """
+        if not self.enabled:
+            return SpanTracer.null_span
+        return _Span(self, name, phase, rows, cells)
+
+    def merge(self, spans: list):
+        """Add the spans recorded by a job in a worker process."""
+        self.spans.extend(spans)
+
+    @staticmethod
+    def phase_totals(spans: list) -> dict:
+        """Add up the wall time of the innermost spans by phase, so that nested time is not counted twice.
+
+        Args:
+            spans (list): The span records, e.g. SpanTracer.spans.
+
+        Returns:
+            dict: the total wall time in seconds of each phase.
+        """
+        paths = {record["name"] for record in spans}
+        totals = {}
+        for record in spans:
+            if not any(path.startswith(record["name"] + "/") for path in paths):
+                totals[record["phase"]] = totals.get(record["phase"], 0) + record["wall_s"]
+        return totals
+
+    def chrome_trace(self) -> dict:
+        """Get the spans in the Chrome trace event format, to open in chrome://tracing or Perfetto."""
+        events = []
+        for record in self.spans:
+            args = {key: record[key] for key in ("phase", "cpu_s", "rows", "cells", "peak_mb", "error") if record.get(key) is not None}
+            events.append({
+                "name": record["name"].split("/")[-1],
+                "cat": record["phase"],
+                "ph": "X",
+                "ts": int(record["ts"] * 1_000_000),
+                "dur": int(record["wall_s"] * 1_000_000),
+                "pid": record["pid"],
+                "tid": record["tid"],
+                "args": args,
+            })
+        return {"traceEvents": events, "displayTimeUnit": "ms"}
+
+    def summary(self) -> str:
+        """Get the spans as a table, in the order they were started, followed by the total time of each phase."""
+        lines = [f"{'Span':<60} {'Phase':<8} {'Wall (s)':>9} {'CPU (s)':>9} {'Rows':>9} {'Cells':>11} {'Peak (MB)':>10}"]
+        for record in sorted(self.spans, key=lambda record: record["ts"]):
+            rows = "" if record["rows"] is None else record["rows"]
+            cells = "" if record["cells"] is None else record["cells"]
+            peak = record.get("peak_mb", "")
+            lines.append(f"{record['name'][:60]:<60} {record['phase']:<8} {record['wall_s']:>9.2f} {record['cpu_s']:>9.2f} {rows:>9} {cells:>11} {peak:>10}")
+        totals = SpanTracer.phase_totals(self.spans)
+        for phase, wall in sorted(totals.items(), key=lambda item: -item[1]):
+            lines.append(f"{'Total ' + phase:<60} {phase:<8} {wall:>9.2f}")
+        return "\n".join(lines)
+
+    def report(self, console_file: str):
+        """Write the spans as JSON and Chrome trace files next to the console log and log the summary table.
+
+        Args:
+            console_file (str): The file path of the console log, e.g. 'Type1.log' gives 'Type1.spans.json' and 'Type1.trace.json'.
+        """
+        if not self.enabled:
+            return
+        try:
+            base = os.path.splitext(console_file)[0]
+            with open(base + ".spans.json", "w") as file:
+                json.dump(self.spans, file, indent=1)
+            with open(base + ".trace.json", "w") as file:
+                json.dump(self.chrome_trace(), file)
+            console.log("Phase timings:\n" + self.summary())
+        except Exception as e:
+            # The timings are only for diagnosis, so they never fail the job
+            console.log(f"Error when writing the phase timings: {e}")
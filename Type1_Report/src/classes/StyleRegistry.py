@@ -0,0 +1,99 @@
+from openpyxl.worksheet.worksheet import Worksheet
+from openpyxl.styles import Font, Alignment, PatternFill, Border
+from openpyxl.styles.cell_style import StyleArray
+
+# Description: This class is used to hand out shared openpyxl style objects and apply them to whole ranges of cells.
+
+
+class StyleRegistry:
+    def __init__(self):
+        # Initialize one cache per style type, keyed by the parameters used to create the style
+        self.fonts = {}
+        self.alignments = {}
+        self.fills = {}
+        self.borders = {}
+
+    @staticmethod
+    def _get_or_create(cache: dict, style_class, kwargs: dict):
+        """Return the cached style object for the parameters, creating it on the first request.
+
+        Args:
+            cache (dict): The cache to look up the style object in.
+            style_class (type): The openpyxl style class to create on a cache miss.
+            kwargs (dict): The parameters used to create the style object.
+
+        Returns:
+            The shared style object for the parameters.
+        """
+        key = tuple(sorted(kwargs.items()))
+        style = cache.get(key)
+        if style is None:
+            style = style_class(**kwargs)
+            cache[key] = style
+        return style
+
+    def font(self, **kwargs) -> Font:
+        """Get the shared Font for the parameters."""
+        return StyleRegistry._get_or_create(self.fonts, Font, kwargs)
+
+    def alignment(self, **kwargs) -> Alignment:
+        """Get the shared Alignment for the parameters."""
+        return StyleRegistry._get_or_create(self.alignments, Alignment, kwargs)
+
+    def fill(self, **kwargs) -> PatternFill:
+        """Get the shared PatternFill for the parameters."""
+        return StyleRegistry._get_or_create(self.fills, PatternFill, kwargs)
+
+    def border(self, **kwargs) -> Border:
+        """Get the shared Border for the parameters."""
+        return StyleRegistry._get_or_create(self.borders, Border, kwargs)
+
+    def style_range(
+        self,
+        ws: Worksheet,
+        min_row: int,
+        max_row: int,
+        min_col: int,
+        max_col: int,
+        font: Font = None,
+        alignment: Alignment = None,
+        fill: PatternFill = None,
+        border: Border = None,
+    ):
+        """Apply the same font, alignment, fill and border to every cell in a range.
+
+        Each style is registered in the workbook once, then only its index is assigned to the cells,
+        which is what openpyxl does on every cell.font = ... assignment after hashing the style again.
+        Styles that are None are left unchanged.
+
+        Args:
+            ws (Worksheet): The worksheet to set the cell style.
+            min_row (int): The first row of the range.
+            max_row (int): The last row of the range.
+            min_col (int): The first column of the range.
+            max_col (int): The last column of the range.
+            font (Font, optional): The font to apply. Defaults to None.
+            alignment (Alignment, optional): The alignment to apply. Defaults to None.
+            fill (PatternFill, optional): The fill to apply. Defaults to None.
+            border (Border, optional): The border to apply. Defaults to None.
+        """
+        wb = ws.parent
+        # Register each style once in the workbook and keep its index
+        ids = []
+        if font is not None:
+            ids.append(("fontId", wb._fonts.add(font)))
+        if alignment is not None:
+            ids.append(("alignmentId", wb._alignments.add(alignment)))
+        if fill is not None:
+            ids.append(("fillId", wb._fills.add(fill)))
+        if border is not None:
+            ids.append(("borderId", wb._borders.add(border)))
+        if not ids or max_row < min_row or max_col < min_col:
+            return
+        for row in ws.iter_rows(min_row=min_row, max_row=max_row, min_col=min_col, max_col=max_col):
+            for cell in row:
+                if not cell._style:
+                    cell._style = StyleArray()
+                style = cell._style
+                for key, idx in ids:
+                    setattr(style, key, idx)
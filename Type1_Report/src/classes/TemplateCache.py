@@ -0,0 +1,63 @@
+import io
+import os
+import hashlib
+from openpyxl import Workbook, load_workbook
+
+# Description: This class is used to read each template workbook once per process and hand out independent copies of it.
+
+
+class TemplateCache:
+    def __init__(self):
+        # Initialize the cached templates keyed by the normalized template path
+        self.templates = {}
+
+    @staticmethod
+    def _key(path: str) -> str:
+        """Normalize the file path so that the same template always has the same key."""
+        return os.path.normcase(os.path.abspath(path))
+
+    def _entry(self, path: str) -> dict:
+        """Get the cached template, reading it again only if the file has changed.
+
+        The file is only read again when its modification time or size has changed, and the cached
+        content is only replaced when its SHA-256 checksum has changed as well.
+
+        Args:
+            path (str): The template file path.
+
+        Returns:
+            dict: the cached template with the content of the file.
+        """
+        stat = os.stat(path)
+        key = TemplateCache._key(path)
+        entry = self.templates.get(key)
+        if entry is not None and entry["mtime"] == stat.st_mtime_ns and entry["size"] == stat.st_size:
+            return entry
+        with open(path, "rb") as file:
+            data = file.read()
+        sha256 = hashlib.sha256(data).hexdigest()
+        if entry is not None and entry["sha256"] == sha256:
+            # The file was touched but its content is the same
+            entry["mtime"], entry["size"] = stat.st_mtime_ns, stat.st_size
+            return entry
+        entry = {"mtime": stat.st_mtime_ns, "size": stat.st_size, "sha256": sha256, "data": data}
+        self.templates[key] = entry
+        return entry
+
+    def sha256(self, path: str) -> str:
+        """Get the SHA-256 checksum of the template, read from the cache if the file has not changed."""
+        return self._entry(path)["sha256"]
+
+    def load(self, path: str) -> Workbook:
+        """Get a new workbook for the template, the same as load_workbook(path).
+
+        The workbook is parsed from the content kept in memory, since pickled or deep-copied openpyxl
+        workbooks lose the worksheet bindings of their row and column dimensions.
+
+        Args:
+            path (str): The template file path.
+
+        Returns:
+            Workbook: a workbook independent of the cache and of the other copies.
+        """
+        return load_workbook(io.BytesIO(self._entry(path)["data"]))
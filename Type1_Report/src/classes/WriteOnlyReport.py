@@ -0,0 +1,160 @@
+import os
+import copy
+import itertools
+import pandas as pd
+from openpyxl import Workbook
+from openpyxl.cell import WriteOnlyCell
+from openpyxl.styles import Font, Alignment, Border
+from openpyxl.worksheet.worksheet import Worksheet
+from openpyxl.worksheet._write_only import WriteOnlyWorksheet
+from openpyxl.utils import coordinate_to_tuple
+
+# Description: This class is used to stream a dataframe below the header block of a template worksheet into a write-only workbook.
+
+
+class CellRowWorksheet(WriteOnlyWorksheet):
+    """A write-only worksheet whose appended rows only hold cells or None.
+
+    The rows of WriteOnlyWorksheet are made of values, a cell is only found after setting it as the value of a new
+    cell has failed. That failure and the new cell cost about a third of the time of write_data(), so the cells are
+    placed in their row and column as they are.
+    """
+
+    def _values_to_row(self, values, row_idx):
+        for col_idx, cell in enumerate(values, 1):
+            if cell is None:
+                continue
+            cell.column = col_idx
+            cell.row = row_idx
+            yield cell
+
+
+class WriteOnlyReport:
+    def __init__(self, template_ws: Worksheet, title: str, header_rows: int):
+        # Initialize the template worksheet and the number of rows of its header block
+        self.template_ws = template_ws
+        self.header_rows = header_rows
+        # Initialize the write-only workbook, whose rows are written to a temporary file as soon as they are appended
+        self.wb = Workbook(write_only=True)
+        self.ws = CellRowWorksheet(parent=self.wb, title=title)
+        self.wb._add_sheet(self.ws)
+        self._copy_layout()
+
+    def _copy_layout(self):
+        """Copy the sheet settings, column widths and header row heights and merged cells of the template worksheet."""
+        template_ws = self.template_ws
+        # The sheet views hold the frozen panes, the zoom and the gridlines
+        self.ws.views = copy.deepcopy(template_ws.views)
+        self.ws.sheet_properties = copy.deepcopy(template_ws.sheet_properties)
+        self.ws.sheet_format = copy.deepcopy(template_ws.sheet_format)
+        self.ws.page_margins = copy.deepcopy(template_ws.page_margins)
+        self.ws.print_options = copy.deepcopy(template_ws.print_options)
+        for key, dim in template_ws.column_dimensions.items():
+            new_dim = self.ws.column_dimensions[key]
+            new_dim.min, new_dim.max = dim.min, dim.max
+            new_dim.width, new_dim.bestFit = dim.width, dim.bestFit
+            new_dim.hidden, new_dim.outlineLevel = dim.hidden, dim.outlineLevel
+        for row, dim in template_ws.row_dimensions.items():
+            if row <= self.header_rows and dim.height is not None:
+                self.ws.row_dimensions[row].height = dim.height
+        for merged in template_ws.merged_cells.ranges:
+            if merged.max_row <= self.header_rows:
+                self.ws.merged_cells.add(merged.coord)
+
+    def set_column_widths(self, column_widths: dict):
+        """Set the column widths, the same as Type1_ReportA_Rpt.apply_column_widths(). It must be called before write_header().
+
+        Args:
+            column_widths (dict): The width of each column keyed by column letter, without the buffer.
+        """
+        buffer = 2
+        for col, width in column_widths.items():
+            self.ws.column_dimensions[col].width = width + buffer
+
+    def _styled_cell(self, template_cell, value) -> WriteOnlyCell:
+        """Create a cell with the value and the style of a template cell."""
+        cell = WriteOnlyCell(self.ws, value)
+        if template_cell is not None and template_cell.has_style:
+            cell.font = copy.copy(template_cell.font)
+            cell.fill = copy.copy(template_cell.fill)
+            cell.border = copy.copy(template_cell.border)
+            cell.alignment = copy.copy(template_cell.alignment)
+            cell.protection = copy.copy(template_cell.protection)
+            cell.number_format = template_cell.number_format
+        return cell
+
+    def write_header(self, values: dict):
+        """Write the header block of the template with some of its values replaced.
+
+        Args:
+            values (dict): The new values keyed by cell coordinate, e.g. {"A1": "WKLY REPORT"}.
+        """
+        values = {coordinate_to_tuple(coordinate): value for coordinate, value in values.items()}
+        max_col = max([self.template_ws.max_column] + [col for _, col in values])
+        for row in range(1, self.header_rows + 1):
+            cells = []
+            for col in range(1, max_col + 1):
+                template_cell = self.template_ws._cells.get((row, col))
+                value = values.get((row, col), None if template_cell is None else template_cell.value)
+                if value is None and (template_cell is None or not template_cell.has_style):
+                    cells.append(None)
+                else:
+                    cells.append(self._styled_cell(template_cell, value))
+            self.ws.append(cells)
+
+    def write_data(self, data, font: Font, alignment: Alignment, border: Border, batch_size: int = 10000) -> int:
+        """Write the dataframe below the header block with the same font, alignment and border on every cell.
+
+        The other style properties of each cell come from the template cell at the same position if there is one,
+        like Type1_ReportA_Rpt.set_range_style() keeps them on the cells of the template. The cells of each column
+        are written from one cell object whose value is replaced just before it is written, so no cell object is
+        kept per value. The data can also be given in chunks with the same columns.
+
+        Args:
+            data (pd.DataFrame | Iterable[pd.DataFrame]): The dataframe to write, or its chunks with the same columns.
+            font (Font): The font of the data cells.
+            alignment (Alignment): The alignment of the data cells.
+            border (Border): The border of the data cells.
+            batch_size (int, optional): The number of rows converted to Python values at a time. Defaults to 10000.
+
+        Returns:
+            int: the number of rows written.
+        """
+        first_row = self.header_rows + 1
+        chunks = iter([data] if isinstance(data, pd.DataFrame) else data)
+        first = next(chunks, None)
+        if first is None:
+            return 0
+
+        def data_cell(template_cell):
+            cell = self._styled_cell(template_cell, None)
+            cell.font, cell.alignment, cell.border = font, alignment, border
+            return cell
+
+        column_cells = [data_cell(None) for _ in first.columns]
+        # Rows of the template below the header block that have styled cells get their own cell objects
+        template_rows = {}
+        for (row, col), template_cell in self.template_ws._cells.items():
+            if first_row <= row and col <= len(first.columns) and template_cell.has_style:
+                template_rows.setdefault(row, list(column_cells))[col - 1] = data_cell(template_cell)
+
+        def row_cells(cells, values):
+            # The write-only worksheet writes each cell as soon as it is yielded
+            for cell, value in zip(cells, values):
+                cell.value = value
+                yield cell
+
+        row = first_row
+        for df in itertools.chain([first], chunks):
+            for start in range(0, len(df.index), batch_size):
+                for values in df.iloc[start:start + batch_size].itertuples(index=False, name=None):
+                    self.ws.append(row_cells(template_rows.get(row, column_cells), values))
+                    row += 1
+        return row - first_row
+
+    def save(self, path: str):
+        """Save the workbook, which can only be done once."""
+        # Save to a temporary file first so that a failed save never leaves a partial report
+        self.wb.save(path + ".tmp")
+        self.wb.close()
+        os.replace(path + ".tmp", path)
@@ -0,0 +1,41 @@
+import os
+import sys
+import pytest
+
+# Import the src package and the test helpers from the Type1_Report folder, as Type1_ReportA_Main.py does
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from tests.synthetic import SYNTHETIC_CWK, install_pdr_stubs
+
+# The pdr modules that need the Oracle database are replaced before the job module is imported
+STATE = {"cwk": SYNTHETIC_CWK, "reports": {}}
+install_pdr_stubs(STATE)
+
+
+@pytest.fixture
+def pdr_state():
+    """The current week and the dataframes returned by each report ID of the pdr stand-ins."""
+    STATE["cwk"] = SYNTHETIC_CWK
+    STATE["reports"] = {}
+    yield STATE
+    STATE["reports"] = {}
+
+
+@pytest.fixture
+def synthetic_run(tmp_path, pdr_state):
+    """Make the synthetic data of 30 distributors and last week's dynamic reports, and return a function that creates this week's job."""
+    from tests.synthetic import prepare_run
+    from src.Type1_ReportA_Rpt import Type1_ReportA_Rpt
+    report_id, template_path, output_path = prepare_run(30, str(tmp_path / "work"), pdr_state)
+
+    def make_job(**kwargs) -> Type1_ReportA_Rpt:
+        return Type1_ReportA_Rpt(None, "BENCH.DR_REPORTS", report_id, template_path, output_path, **kwargs)
+
+    return make_job
+
+
+@pytest.fixture
+def job(tmp_path, pdr_state):
+    """A job of this week whose processing methods can be called without the templates or last week's reports."""
+    from src.Type1_ReportA_Rpt import Type1_ReportA_Rpt
+    return Type1_ReportA_Rpt(None, "BENCH.DR_REPORTS", list(range(1, 9)), str(tmp_path), [str(tmp_path)] * 4)
@@ -0,0 +1,139 @@
+import pandas as pd
+from openpyxl.styles import Font, Alignment
+from openpyxl.utils import get_column_letter
+
+# Description: This module keeps the first version of the job steps that were rewritten, as the reference of the parity tests and the benchmark program.
+
+def per_cell_dataframe_to_excel(df: pd.DataFrame, ws, skip_rows: int = 0):
+    """Write a dataframe one cell at a time in column order, as the first version of dataframe_to_excel() did."""
+    for col in range(1, len(df.columns) + 1):
+        for row in range(1, len(df.index) + 1):
+            ws[get_column_letter(col) + str(row + skip_rows)].value = df.iat[row - 1, col - 1]
+
+
+def per_cell_set_style(ws, max_row: int, max_col: int, border):
+    """Style the data of a dynamic report with new style objects for every cell, as the first version of set_cell_style() did."""
+    for row in ws.iter_rows(min_row=8, max_row=max_row, min_col=1, max_col=max_col):
+        for cell in row:
+            cell.font = Font(name="Arial", size=8, bold=False, underline=None)
+            cell.alignment = Alignment(vertical="bottom", horizontal=None, wrapText=True)
+            cell.border = border
+
+
+def row_by_row_summary_lookups(job, wb, df: pd.DataFrame):
+    """Add the Impacted, Additions/Decreases, Volume Impact and Week Change columns one summary row at a time, as the first version did."""
+    key = job.col_curr_db[0]
+    sheets = job.out_summary_sheets[1:5]
+    for sheet in sheets:
+        values = {cell[0].value for cell in wb[sheet].iter_rows(min_row=6, min_col=1, max_col=1)}
+        for index, row in df.iterrows():
+            df.loc[index, sheet] = "X" if row[key] in values else ""
+    df["Additions"] = job.SPACE
+    df["Decreases"] = job.SPACE
+    for index, row in df.iterrows():
+        additions_flag = decreases_flag = job.SPACE
+        for sheet in sheets:
+            col1_values = [cell[0].value for cell in wb[sheet].iter_rows(min_row=6, min_col=1, max_col=1)]
+            col19_values = [cell[0].value for cell in wb[sheet].iter_rows(min_row=6, min_col=19, max_col=19)]
+            for i, value in enumerate(col1_values):
+                if value == row[key] and col19_values[i] is not None:
+                    if col19_values[i] > 0:
+                        additions_flag = "X"
+                    elif col19_values[i] < 0:
+                        decreases_flag = "X"
+        df.at[index, "Additions"] = additions_flag
+        df.at[index, "Decreases"] = decreases_flag
+    for sheet, column_name in zip(sheets, job.col_summary[10:14]):
+        df[column_name] = job.SPACE
+        df[f"{sheet} wk"] = None
+        df[f"{sheet} date"] = None
+    for index, row in df.iterrows():
+        for sheet, column_name in zip(sheets, job.col_summary[10:14]):
+            ws = wb[sheet]
+            for cell in ws["A"]:
+                if cell.value == row[key] and ws.cell(row=cell.row, column=4).value is not None:
+                    df.at[index, column_name] = ws.cell(row=cell.row, column=4).value
+                    break
+            for cell in ws["A"]:
+                if cell.value == row[key]:
+                    df.at[index, f"{sheet} wk"] = ws.cell(row=cell.row, column=21).value
+                    df.at[index, f"{sheet} date"] = ws.cell(row=cell.row, column=24).value
+                    break
+    return df
+
+
+def row_by_row_reason(job, wb, df: pd.DataFrame) -> list:
+    """The Reason column as the first version of the summary report looked it up, one summary row at a time."""
+    frames = []
+    for sheet_name in job.out_summary_sheets[5:9]:
+        sheet_data = pd.DataFrame(wb[sheet_name].values)
+        sheet_data.columns = sheet_data.iloc[0]
+        frames.append(sheet_data[1:].reset_index(drop=True))
+    reason_data = pd.concat(frames, ignore_index=True)
+    reasons = []
+    for row in range(len(df.index)):
+        reason_query = reason_data[reason_data["CUSTOMER_NUMBER"] == df.iloc[row, 2]]
+        reason = reason_query.iloc[0, 3] if len(reason_query.index) > 0 else ""
+        reasons.append("" if reason is None or reason == "" or pd.isna(reason) else reason)
+    return reasons
+
+
+def row_apply_df_filtered(job, df_filtered: pd.DataFrame, cols: list, filter_str: list, end_week: int) -> pd.DataFrame:
+    """_process_df_filtered() as the first version built the C Diff strings and the labels, one row at a time."""
+    for i in range(1, end_week):
+        df_filtered[f"C Diff {i}"] = df_filtered.apply(
+            lambda row: (
+                "*   " if row[f"CURRENT_{i + 1}_Curr"] == 0 else "") +
+                f"""{int(row[f"CURRENT_{i + 1}_Curr"]) - int(row[f"CURRENT_{i}_Prev"])}""" +
+                ("   *" if row[f"CURRENT_{i}_Prev"] == 0 else ""),
+            axis=1
+        )
+    df_filtered[cols[5]] = df_filtered.iloc[:, 5:18].mean(axis=1)
+    df_filtered[cols[4]] = df_filtered.apply(
+            lambda row: (row['Distributor Hierarchy_Curr']) + " / " + (row['Measures_Curr']) + " / " + (row["Manufacturer_Curr"]), axis=1)
+    df_filtered[cols[3]] = df_filtered.apply(
+            lambda row: (row['Distributor Hierarchy_Curr'].split(job.SPACE, maxsplit=1)[1].title()) + " (" + (row['Distributor Hierarchy_Curr'].split(job.SPACE)[0]) + ")", axis=1)
+    if filter_str is not None:
+        if len(filter_str) == 1:
+            df_filtered = df_filtered[df_filtered[cols[4]].str.contains(filter_str[0], regex=True)]
+        if len(filter_str) == 2:
+            df_filtered = df_filtered[df_filtered[cols[4]].str.contains(filter_str[0], regex=True) | df_filtered[cols[4]].str.contains(filter_str[1], regex=True)]
+    col_final = cols[3:] + [f"C Diff {i}" for i in range(1, end_week)] + [cols[2]]
+    return df_filtered[col_final]
+
+
+def row_apply_put_fc_data(job, ws, input_fc: str):
+    """_put_fc_data() as the first version found the first and last non-zero weeks, one row at a time."""
+    df = pd.read_excel(input_fc, header=0, skiprows=4)
+    job.dataframe_to_excel(df, ws, skip_rows=5)
+    for column in df.columns[4:18]:
+        df[column] = df[column].astype(str).str.replace(r'[\s*]', '', regex=True)
+    df.iloc[:, 4:18] = df.iloc[:, 4:18].astype(int)
+    rsd_vol, first_date, last_date, first_fulldate, last_fulldate = job.col_fc_dates[:5]
+    df[rsd_vol] = df.iloc[:, 4:18].sum(axis=1)
+    df[rsd_vol] = df[rsd_vol].astype(int)
+    col_dates = df.columns[4:17].tolist()
+
+    def add_new_columns(row):
+        filtered_row = row[col_dates].replace(0, pd.NA).dropna()
+        if not filtered_row.empty:
+            return pd.Series([filtered_row.index[0], filtered_row.index[-1]], index=['first full', 'last full'])
+        return pd.Series([pd.NA, pd.NA], index=['first full', 'last full'])
+
+    df = df.join(df.apply(add_new_columns, axis=1))
+    df['first full'] = df['first full'].fillna(' ')
+    df['last full'] = df['last full'].fillna(' ')
+    df[[first_date, first_fulldate]] = df['first full'].str.split(expand=True)
+    df[[last_date, last_fulldate]] = df['last full'].str.split(expand=True)
+    df[first_date] = pd.to_numeric(df[first_date], errors='coerce')
+    df[last_date] = pd.to_numeric(df[last_date], errors='coerce')
+    df[first_fulldate] = df[first_fulldate].str.strip().replace('', None)
+    df[last_fulldate] = df[last_fulldate].str.strip().replace('', None)
+    df[job.col_fc_dates[5]] = df.apply(
+        lambda row: None if pd.isnull(row[first_fulldate]) or pd.isnull(row[last_fulldate])
+        else (row[first_fulldate] if row[first_fulldate] == row[last_fulldate]
+            else f"{row[last_fulldate]} - {row[first_fulldate]}"),
+        axis=1
+    )
+    job.dataframe_to_excel(df[job.col_fc_dates], ws, skip_rows=5, skip_cols=18)
+    job._update_weeks_comparison(ws, 14)
@@ -0,0 +1,292 @@
+import os
+import sys
+import types
+import datetime
+import importlib
+import numpy as np
+import pandas as pd
+from openpyxl import Workbook
+
+# Description: This module makes the synthetic data, templates and stand-ins for the pdr modules shared by the tests and the benchmark program.
+
+# Period code and end date of the current week in the synthetic data
+SYNTHETIC_CWK = 2000
+SYNTHETIC_END_WEEK = datetime.date(2024, 7, 13)
+# Measures and manufacturers of each category, the filter of each category must match one of its manufacturers
+CATEGORIES = {
+    "cig": (["Ctns", "Units", "Vol"], ["XXX Brands", "Other Brands", "Value Brands", "Import Brands"]),
+    "ecig": (["Ctns", "Units", "Vol"], ["blu ecigs", "Other ecigs", "Disposable ecigs"]),
+    "cgr": (["Ctns", "Units", "Vol"], ["XXX Cigars Inc (Mmc)", "Other Cigars", "Little Cigars"]),
+    "otp": (["Ctns", "Units", "Vol"], ["Modern Oral", "Wraps", "Other Otp", "Pipe Tobacco"]),
+}
+WDC_COLUMNS = ["DIST_ID", "CUSTOMER_NUMBER", "REASON", "OLD_VALUE", "PERIOD_CODE", "NEW_VALUE", "CHANGE_DATE"]
+# Column names of the comparison created by create_ws_comparison()
+COMPARISON_COLS = ["Sum_Change_Curr", "Sum_Change_Prev", "Sum_Change_Diff", "Dist Name / Cust #", "Dist/Packing", "AVG_Volume", "ABS_Sum_Change"]
+
+
+def install_pdr_stubs(state: dict):
+    """Install stand-ins for the pdr modules that need the Oracle database.
+
+    The period, connection and dynamic report modules are always replaced. The console handler is
+    only replaced if pdr is not installed, in which case the log messages are dropped.
+
+    Args:
+        state (dict): The current week and the dataframes returned by each report ID, read when the stubs are called.
+    """
+    def module(name: str, **attrs):
+        mod = types.ModuleType(name)
+        mod.__path__ = []
+        mod.__dict__.update(attrs)
+        sys.modules[name] = mod
+        parent, _, child = name.rpartition(".")
+        if parent:
+            setattr(sys.modules[parent], child, mod)
+        return mod
+
+    for package in ["pdr", "pdr.data", "pdr.period", "pdr.handlers"]:
+        try:
+            importlib.import_module(package)
+        except ImportError:
+            module(package)
+    try:
+        importlib.import_module("pdr.handlers.Console_Handler")
+    except ImportError:
+        module("pdr.handlers.Console_Handler", log=lambda message: None, set_log=lambda path: None)
+    module(
+        "pdr.period.XXX",
+        get_XXX_period_code=lambda connection: state["cwk"],
+        get_XXX_end_week=lambda connection, cwk: SYNTHETIC_END_WEEK - datetime.timedelta(weeks=SYNTHETIC_CWK - cwk),
+    )
+    module("pdr.data.Dynamic_Report", collect_dynamic_report=lambda connection, table, report_id: state["reports"][report_id].copy())
+    module("pdr.data.Connection", oracle_connect=lambda *args, **kwargs: None)
+
+
+def make_g360_frames(distributors: int, category: str, seed: int) -> tuple:
+    """Make this week's and last week's dynamic report data with the shape of the G360 query.
+
+    Each distributor has one row per measure and manufacturer. Last week's data is this week's data
+    shifted by one week, with about 1% of the weeks revised this week so that the comparison has changes.
+
+    Args:
+        distributors (int): The number of distributors.
+        category (str): The category, a key of CATEGORIES.
+        seed (int): The seed of the random numbers.
+
+    Returns:
+        tuple: this week's and last week's dataframes.
+    """
+    rng = np.random.default_rng(seed)
+    measures, manufacturers = CATEGORIES[category]
+    rows = distributors * len(measures) * len(manufacturers)
+    dist = np.repeat(np.arange(distributors), len(measures) * len(manufacturers))
+    hierarchy = pd.Series([f"{100000 + i} DISTRIBUTOR NUMBER {i}" for i in range(distributors)]).to_numpy()[dist]
+    keys = pd.DataFrame({
+        "Distributor Hierarchy": hierarchy,
+        "Measures": np.tile(np.repeat(measures, len(manufacturers)), distributors),
+        "Manufacturer": np.tile(manufacturers, distributors * len(measures)),
+        "Sort Order": np.arange(rows),
+    })
+    # 157 weeks of history, most of the rows are sparse like the real volumes
+    history = rng.integers(1, 5000, size=(rows, 157)).astype("float64")
+    history[rng.random((rows, 157)) < 0.4] = np.nan
+    current = history[:, :156].copy()
+    revised = rng.random(current.shape) < 0.01
+    current[revised] = rng.integers(1, 5000, size=int(revised.sum()))
+    names = ["CURRENT" if i == 0 else f"CURRENT-{i}" for i in range(156)]
+    df_curr = pd.concat([keys, pd.DataFrame(current, columns=names)], axis=1)
+    df_prev = pd.concat([keys, pd.DataFrame(history[:, 1:], columns=names)], axis=1)
+    return df_curr, df_prev
+
+
+def make_wdc_frame(distributors: int, seed: int, cwk: int) -> pd.DataFrame:
+    """Make the WDC report data for about 10% of the distributors.
+
+    Args:
+        distributors (int): The number of distributors.
+        seed (int): The seed of the random numbers.
+        cwk (int): The current week code.
+
+    Returns:
+        pd.DataFrame: the WDC data.
+    """
+    rng = np.random.default_rng(seed)
+    rows = max(1, distributors // 10)
+    dist = rng.choice(distributors, size=rows, replace=distributors < rows)
+    return pd.DataFrame({
+        WDC_COLUMNS[0]: dist + 1,
+        WDC_COLUMNS[1]: [str(100000 + i) for i in dist],
+        WDC_COLUMNS[2]: rng.choice(["New distributor", "Closed", "Data correction", "Late file"], size=rows),
+        WDC_COLUMNS[3]: rng.integers(0, 10000, size=rows),
+        WDC_COLUMNS[4]: cwk - rng.integers(0, 14, size=rows),
+        WDC_COLUMNS[5]: rng.integers(0, 10000, size=rows),
+        WDC_COLUMNS[6]: pd.Timestamp(SYNTHETIC_END_WEEK) - pd.to_timedelta(rng.integers(0, 90, size=rows), unit="D"),
+    })
+
+
+def make_templates(template_path: str, g360_columns: list):
+    """Make the minimal template workbooks with the same file names, sheet names and header rows as the real templates.
+
+    Args:
+        template_path (str): The folder to save the templates to.
+        g360_columns (list): The columns of the dynamic report data.
+    """
+    # Dynamic report templates, the header is on row 7
+    for name, columns in [("XXX_CIG_G360_XXXXX", g360_columns), ("XXX_CIG_WDC_XXXXX", WDC_COLUMNS)]:
+        wb = Workbook()
+        for col, value in enumerate(columns, start=1):
+            wb.active.cell(row=7, column=col, value=value)
+        wb.save(os.path.join(template_path, f"{name}_Template.xlsx"))
+    # Final deliverable templates, the Final_Comparison header is on row 5 and the Curr_DB/Prev_DB weeks on row 2
+    comparison_header = ["Dist Name / Cust #", "Dist/Packing", "AVG_Volume", "ABS_Sum_Change"]
+    for name in ["G360_XXXXX_Template", "G360_Ecigs_XXXXX_Template", "G360_Cgr_XXXXX_Template", "G360_OTP_XXXXX_Template"]:
+        wb = Workbook()
+        wb.active.title = "Final_Comparison"
+        for sheet in ["Comparison1", "Curr_DB", "Prev_DB"]:
+            wb.create_sheet(sheet)
+        for col, value in enumerate(comparison_header, start=1):
+            wb["Final_Comparison"].cell(row=5, column=col, value=value)
+        for sheet in ["Curr_DB", "Prev_DB"]:
+            for col, value in enumerate(["Concatenated", "Distributor Hierarchy", "Measures", "Manufacturer"], start=1):
+                wb[sheet].cell(row=2, column=col, value=value)
+        wb.save(os.path.join(template_path, f"{name}.xlsx"))
+    # Summary report template
+    wb = Workbook()
+    wb.active.title = "Summary"
+    summary_header = ["Distributor Name", "Customer Number", "Cigarettes", "e-Cigs", "Cigars", "Otp", "Additions", "Decreases",
+        "Weeks Occurred", "Reason", "Cigarettes (Ctns)", "e-Cigs (Units)", "Cigars (Sticks)", "Otp (Sticks)"]
+    for col, value in enumerate(summary_header, start=1):
+        wb["Summary"].cell(row=2, column=col, value=value)
+    for sheet in ["cig", "blu", "cgr", "otp"]:
+        ws = wb.create_sheet(sheet)
+        for col, value in enumerate(comparison_header, start=1):
+            ws.cell(row=5, column=col, value=value)
+    for sheet in ["cigwdc", "bluwdc", "cgrwdc", "otpwdc"]:
+        ws = wb.create_sheet(sheet)
+        for col, value in enumerate(["Concatenated"] + WDC_COLUMNS, start=1):
+            ws.cell(row=1, column=col, value=value)
+    wb.save(os.path.join(template_path, "Volume_Change_Summary_Template.xlsx"))
+
+
+def prepare_run(distributors: int, work_dir: str, state: dict, previous_week: bool = True) -> tuple:
+    """Make the synthetic data and templates, and save last week's dynamic reports as the job of last week would have.
+
+    Args:
+        distributors (int): The number of distributors in each category.
+        work_dir (str): The folder for the templates and the output files.
+        state (dict): The state read by the pdr stand-ins of install_pdr_stubs(), set to this week's data.
+        previous_week (bool, optional): False to skip last week's dynamic reports, for the steps that do not read them. Defaults to True.
+
+    Returns:
+        tuple: the arguments of Type1_ReportA_Rpt after the connection and the table: the report IDs, the template folder and the output folders.
+    """
+    # The job module is imported after the stubs so that it uses them
+    import src.Type1_ReportA_Rpt as itg
+    template_path = os.path.join(work_dir, "templates")
+    output_path = [os.path.join(work_dir, category) for category in CATEGORIES]
+    for folder in [template_path] + output_path:
+        os.makedirs(folder, exist_ok=True)
+    # Report IDs in the order of the CFG: cig/ecig/cgr wdc, cig/ecig/cgr/otp g360 and otp wdc
+    report_id = list(range(1, 9))
+    g360_ids = dict(zip(CATEGORIES, [4, 5, 6, 7]))
+    wdc_ids = dict(zip(CATEGORIES, [1, 2, 3, 8]))
+    prev_frames = {}
+    state["reports"] = {}
+    for i, category in enumerate(CATEGORIES):
+        df_curr, prev_frames[category] = make_g360_frames(distributors, category, seed=i)
+        state["reports"][g360_ids[category]] = df_curr
+        state["reports"][wdc_ids[category]] = make_wdc_frame(distributors, seed=10 + i, cwk=SYNTHETIC_CWK)
+    make_templates(template_path, list(prev_frames["cig"].columns))
+    if not previous_week:
+        return report_id, template_path, output_path
+    state["cwk"] = SYNTHETIC_CWK - 1
+    job = itg.Type1_ReportA_Rpt(None, "BENCH.DR_REPORTS", report_id, template_path, output_path)
+    previous = zip([job.dr_cig, job.dr_ecig, job.dr_cgr, job.dr_otp], [job.out_dr_cig, job.out_dr_ecig, job.out_dr_cgr, job.out_dr_otp])
+    for category, (data_name, out_dr) in zip(CATEGORIES, previous):
+        job.create_dr_excel(prev_frames[category], g360_ids[category], data_name, job.temp_dr_cig, out_dr, "FD4")
+    state["cwk"] = SYNTHETIC_CWK
+    return report_id, template_path, output_path
+
+
+def make_volume_frame(rows: int, columns: int, seed: int = 0) -> pd.DataFrame:
+    """Make a dynamic report shaped frame of 4 key columns and sparse volume columns.
+
+    Args:
+        rows (int): The number of rows.
+        columns (int): The total number of columns, at least 4.
+        seed (int, optional): The seed of the random numbers. Defaults to 0.
+
+    Returns:
+        pd.DataFrame: the frame.
+    """
+    rng = np.random.default_rng(seed)
+    keys = pd.DataFrame({
+        "Distributor Hierarchy": [f"{100000 + i // 12} DISTRIBUTOR NUMBER {i // 12}" for i in range(rows)],
+        "Measures": np.tile(["Ctns", "Units", "Vol"], rows // 3 + 1)[:rows],
+        "Manufacturer": np.tile(["XXX Brands", "Other Brands", "Value Brands", "Import Brands"], rows // 4 + 1)[:rows],
+        "Sort Order": np.arange(rows),
+    })
+    volumes = rng.integers(1, 5000, size=(rows, columns - 4)).astype("float64")
+    volumes[rng.random(volumes.shape) < 0.4] = np.nan
+    names = ["CURRENT" if i == 0 else f"CURRENT-{i}" for i in range(columns - 4)]
+    return pd.concat([keys, pd.DataFrame(volumes, columns=names)], axis=1)
+
+
+def make_fc_frame(distributors: int, seed: int) -> pd.DataFrame:
+    """Make the columns A to X of an FC worksheet of the summary report, numbered from 1 like the worksheet columns.
+
+    About two thirds of the distributors have a row in each category, in a shuffled order.
+    """
+    rng = np.random.default_rng(seed)
+    numbers = rng.permutation(distributors)[: distributors * 2 // 3]
+    rows = len(numbers)
+    df = pd.DataFrame(None, index=range(rows), columns=range(1, 25), dtype=object)
+    df[1] = [f"Distributor Number {i} ({100000 + i})" for i in numbers]
+    df[2] = [f"{100000 + i} DISTRIBUTOR NUMBER {i}" for i in numbers]
+    df[3] = "Vol"
+    df[4] = rng.integers(-5000, 5000, size=rows).tolist()
+    for column in range(5, 19):
+        df[column] = rng.integers(-50, 50, size=rows).tolist()
+    df[19] = rng.integers(-5000, 5000, size=rows).tolist()
+    weeks = rng.integers(0, 13, size=rows)
+    df[20] = (SYNTHETIC_CWK - weeks).tolist()
+    df[21] = (SYNTHETIC_CWK - weeks).tolist()
+    df[22] = [f"{SYNTHETIC_END_WEEK - datetime.timedelta(weeks=int(week)):%m/%d/%Y}" for week in weeks]
+    df[23] = df[22]
+    df[24] = df[22]
+    return df
+
+
+def make_filtered_frame(job, distributors: int) -> pd.DataFrame:
+    """Make the merged Curr_DB/Prev_DB rows of the cig category with a change, as create_ws_comparison() passes them to _process_df_filtered().
+
+    Some volumes have a fraction, which the C Diff strings truncate.
+    """
+    import src.Type1_ReportA_Rpt as itg
+    Rpt = itg.Type1_ReportA_Rpt
+    df_curr, df_prev = make_g360_frames(distributors, "cig", seed=0)
+    df_curr["CURRENT-5"] = df_curr["CURRENT-5"] + 0.5
+    df_curr = job._process_df_curr_db(Rpt.compact_dr_frame(df_curr), "Ctns")
+    df_prev = job._process_df_curr_db(Rpt.compact_dr_frame(df_prev), "Ctns")
+    df_merged = job._process_df_merged(job._merge_df_curr_prev(df_curr, df_prev), COMPARISON_COLS, 14)
+    return df_merged[df_merged[COMPARISON_COLS[6]] != 0].copy()
+
+
+def fc_header(job) -> list:
+    """Get a header row of the columns A to X of an FC worksheet, as _put_fc_data() keeps it with the FC data."""
+    return [job.col_curr_db[0]] + [f"Column {column}" for column in range(2, 19)] + job.col_fc_dates
+
+
+def make_fc_workbook(job, frames: dict) -> Workbook:
+    """Write the FC frames of make_fc_frame() from row 6 of their worksheets, as the FC worksheets of the summary report are saved.
+
+    Args:
+        job (Type1_ReportA_Rpt): The job that writes the frames.
+        frames (dict): The FC frames keyed by sheet name.
+
+    Returns:
+        Workbook: the workbook with a worksheet for each frame.
+    """
+    wb = Workbook()
+    for sheet, df_fc in frames.items():
+        job.dataframe_to_excel(df_fc, wb.create_sheet(sheet), skip_rows=5)
+    return wb
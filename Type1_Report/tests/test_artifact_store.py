@@ -0,0 +1,119 @@
+import numpy as np
+import pandas as pd
+import pytest
+from openpyxl import Workbook
+from tests.synthetic import make_g360_frames, make_wdc_frame, SYNTHETIC_CWK
+from src.Type1_ReportA_Rpt import Type1_ReportA_Rpt
+from src.classes.ArtifactStore import ArtifactStore
+
+
+def round_trip(tmp_path, df: pd.DataFrame, header: list, header_row: int) -> pd.DataFrame:
+    """Write the dataframe below the header row as the job does, save the workbook and read it back with pd.read_excel()."""
+    wb = Workbook()
+    ws = wb.active
+    ws["A1"] = "Title above the header"
+    for col, value in enumerate(header, start=1):
+        ws.cell(row=header_row, column=col, value=value)
+    Type1_ReportA_Rpt.dataframe_to_excel(df, ws, skip_rows=header_row)
+    path = str(tmp_path / "round_trip.xlsx")
+    wb.save(path)
+    return pd.read_excel(path, header=0, skiprows=header_row - 1)
+
+
+FRAMES = {
+    "text": (
+        pd.DataFrame({
+            "customer": ["100011", "007", "100012"],
+            "reason": ["Closed", "", "NA"],
+            "mixed": ["abc", "007", None],
+            "flags": ["True", "False", "True"],
+            "c_diff": ["*   5", "3", "-2   *"],
+            "c_diff_numbers": ["3", "-2", "0"],
+        }),
+        ["customer", "reason", "mixed", "flags", "c_diff", "c_diff_numbers"],
+    ),
+    "numbers": (
+        pd.DataFrame({
+            "whole": [1.0, 2.0, 3.0],
+            "missing": [1.0, np.nan, 3.0],
+            "fraction": [1.5, 2.0, 3.0],
+            "int": np.array([1, 2, 3], dtype="int16"),
+            "bool": [True, False, True],
+            "date": pd.to_datetime(["2024-01-01", None, "2024-03-01"]),
+            "empty": [np.nan, np.nan, np.nan],
+        }),
+        ["whole", "missing", "fraction", "int", "bool", "date", "empty"],
+    ),
+    "header": (
+        pd.DataFrame({"a": ["x", "y", ""], "b": [1, 2, 3], "c": ["", "", ""]}),
+        ["name", None, "name", "extra", None],
+    ),
+    "trailing_rows": (
+        pd.DataFrame({"a": ["x", "", None], "b": [np.nan, np.nan, np.nan]}),
+        ["a", "b"],
+    ),
+    "one_column": (
+        pd.DataFrame({"a": ["1", "", "2", None]}),
+        ["a"],
+    ),
+}
+
+
+@pytest.mark.parametrize("name", FRAMES)
+def test_as_saved_matches_read_excel(tmp_path, name):
+    df, header = FRAMES[name]
+    expected = round_trip(tmp_path, df, header, header_row=5)
+    pd.testing.assert_frame_equal(ArtifactStore.as_saved(df, header), expected)
+
+
+def test_as_saved_matches_read_excel_for_the_job_frames(tmp_path):
+    # The WDC data has the customer numbers as text, they are read back as numbers
+    df_wdc = make_wdc_frame(50, seed=0, cwk=SYNTHETIC_CWK)
+    expected = round_trip(tmp_path, df_wdc, list(df_wdc.columns), header_row=7)
+    pd.testing.assert_frame_equal(ArtifactStore.as_saved(df_wdc, list(df_wdc.columns)), expected)
+    assert pd.api.types.is_integer_dtype(expected["CUSTOMER_NUMBER"])
+    # The dynamic report data has categorical key columns and compact integer volumes
+    df_g360, _ = make_g360_frames(20, "cig", seed=0)
+    Type1_ReportA_Rpt.fill_zero(df_g360)
+    Type1_ReportA_Rpt.compact_dr_frame(df_g360)
+    expected = round_trip(tmp_path, df_g360, list(df_g360.columns), header_row=7)
+    pd.testing.assert_frame_equal(ArtifactStore.as_saved(df_g360, list(df_g360.columns)), expected)
+
+
+def test_put_and_get_return_copies(tmp_path):
+    store = ArtifactStore()
+    df, header = FRAMES["text"]
+    path = str(tmp_path / "report.xlsx")
+    store.put(path, df, header)
+    first = store.get(path)
+    first.iloc[0, 0] = -1
+    assert store.get(path).iloc[0, 0] == 100011
+    assert store.get(str(tmp_path / "other.xlsx")) is None
+
+
+def test_job_artifacts_match_the_saved_workbooks(synthetic_run):
+    job = synthetic_run()
+    for job_name in ["cig_job", "ecig_job", "cgr_job", "otp_job"]:
+        getattr(job, job_name)()
+    # The WDC reports have their header on row 7 and the final comparisons on row 5
+    for path in [job.out_wdc_cig, job.out_wdc_ecig, job.out_wdc_cgr, job.out_wdc_otp]:
+        pd.testing.assert_frame_equal(job.artifacts.get(path), pd.read_excel(path, header=0, skiprows=6))
+    for path in [job.out_final_cig, job.out_final_ecig, job.out_final_cgr, job.out_final_otp]:
+        pd.testing.assert_frame_equal(job.artifacts.get(path), pd.read_excel(path, header=0, skiprows=4))
+
+
+def test_kept_dynamic_report_is_converted_once(job, tmp_path, monkeypatch):
+    template = str(tmp_path / "template.xlsx")
+    wb = Workbook()
+    for col, value in enumerate(["CUSTOMER_NUMBER", "VOLUME"], start=1):
+        wb.active.cell(row=7, column=col, value=value)
+    wb.save(template)
+    # The sidecar and the artifact store share the frame converted for the sidecar
+    headers = []
+    as_saved = ArtifactStore.as_saved
+    monkeypatch.setattr(ArtifactStore, "as_saved", staticmethod(lambda df, header: headers.append(header) or as_saved(df, header)))
+    out_file = str(tmp_path / "report.xlsx")
+    job.create_dr_excel(pd.DataFrame({"CUSTOMER_NUMBER": ["100011", "007"], "VOLUME": [1.0, None]}), 1, "XXX_CIG_WDC_XXXXX", template, out_file, "B4", keep_frame=True)
+    assert len(headers) == 1
+    pd.testing.assert_frame_equal(job.artifacts.get(out_file), pd.read_excel(out_file, header=0, skiprows=6))
+    pd.testing.assert_frame_equal(job.sidecars.read(out_file), job.artifacts.get(out_file))
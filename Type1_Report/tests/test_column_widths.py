@@ -0,0 +1,29 @@
+import pandas as pd
+from openpyxl import Workbook
+from src.Type1_ReportA_Rpt import Type1_ReportA_Rpt
+
+
+def test_max_str_len_skips_null_values():
+    series = pd.Series(["abc", pd.NA, None, float("nan"), "", "abcdef"], dtype=object)
+    assert Type1_ReportA_Rpt._max_str_len(series) == 6
+    assert Type1_ReportA_Rpt._max_str_len(pd.Series(["abcd", pd.NA], dtype="string")) == 4
+    assert Type1_ReportA_Rpt._max_str_len(pd.Series([pd.NA, None], dtype=object)) == 0
+
+
+def test_plan_column_widths_matches_auto_adjust():
+    df = pd.DataFrame({
+        "name": ["Distributor A", "", "B", None],
+        "volume": [0, 12345, 7, 100],
+        "flag": [True, False, True, False],
+    })
+    wb = Workbook()
+    ws = wb.active
+    for col, value in enumerate(["Name", "Vol", "Flag"], start=1):
+        ws.cell(row=1, column=col, value=value)
+    Type1_ReportA_Rpt.dataframe_to_excel(df, ws, skip_rows=1)
+    expected = {}
+    for row in ws.iter_rows(min_row=1):
+        for cell in row:
+            if cell.value:
+                expected[cell.column_letter] = max(expected.get(cell.column_letter, 0), len(str(cell.value)))
+    assert Type1_ReportA_Rpt.plan_column_widths(df, ws, data_row=2) == expected
@@ -0,0 +1,14 @@
+import pandas as pd
+from tests.synthetic import COMPARISON_COLS, make_filtered_frame
+from tests.reference import row_apply_df_filtered
+
+
+def test_comparison_columns_match_the_row_apply(job):
+    df_filtered = make_filtered_frame(job, 50)
+    for filter_str in [None, ["XXX Brands"], ["XXX Brands", "Value Brands"]]:
+        expected = row_apply_df_filtered(job, df_filtered.copy(), COMPARISON_COLS, filter_str, 14)
+        result = job._process_df_filtered(df_filtered.copy(), COMPARISON_COLS, filter_str, 14)
+        pd.testing.assert_frame_equal(result, expected)
+    # Both markers and the fractional volumes are covered
+    c_diff = expected.filter(like="C Diff").to_numpy().ravel()
+    assert any(value.startswith("*") for value in c_diff) and any(value.endswith("*") for value in c_diff)
@@ -0,0 +1,50 @@
+import numpy as np
+import pandas as pd
+from openpyxl import Workbook
+from tests.reference import row_apply_put_fc_data
+
+
+def cell_values(ws) -> list:
+    """The values of the worksheet and their types, with NaN and None as the same empty value."""
+    return [
+        [None if value is None or (isinstance(value, float) and np.isnan(value)) else (type(value).__name__, value) for value in row]
+        for row in ws.iter_rows(min_row=6, values_only=True)
+    ]
+
+
+def make_final_comparison(job, rows: int) -> pd.DataFrame:
+    """Make the columns A to R of a final comparison, with the C Diff cells as text and the week headers of _update_weeks_comparison()."""
+    rng = np.random.default_rng(0)
+    weeks = [f"{job.cwk - 1 - i}     {week}" for i, week in enumerate(job.weeks[1:14])]
+    df = pd.DataFrame({
+        "Dist Name / Cust #": [f"Distributor Number {i} ({100000 + i})" for i in range(rows)],
+        "Dist/Packing": [f"{100000 + i} DISTRIBUTOR NUMBER {i} / Ctns / XXX Brands" for i in range(rows)],
+        "AVG_Volume": rng.integers(0, 5000, size=rows) / 13,
+        "ABS_Sum_Change": rng.integers(1, 500, size=rows),
+    })
+    # Most weeks have no change, and a week that is new or was empty last week is marked with *
+    changes = np.where(rng.random((rows, 13)) < 0.6, 0, rng.integers(-50, 50, size=(rows, 13)))
+    markers = rng.choice(["", "*   ", "   *"], size=(rows, 13), p=[0.8, 0.1, 0.1])
+    for i, week in enumerate(weeks):
+        df[week] = [f"{marker}{change}" if marker == "*   " else f"{change}{marker}" for change, marker in zip(changes[:, i], markers[:, i])]
+    df[f"{job.cwk - 14} - {job.cwk - 26}  ABS Chngs"] = rng.integers(-500, 500, size=rows)
+    # Rows of no, one and several non-zero weeks
+    df.iloc[:3, 4:17] = "0"
+    df.iloc[1, 9] = "*   25"
+    df.iloc[2, 5] = "-7   *"
+    df.iloc[2, 15] = "3"
+    return df
+
+
+def test_fc_dates_match_the_row_apply(job, tmp_path):
+    # Save the final comparison below the report header, as create_final_excel() does
+    input_fc = str(tmp_path / "fc.xlsx")
+    with pd.ExcelWriter(input_fc) as writer:
+        make_final_comparison(job, 30).to_excel(writer, index=False, startrow=4)
+    expected, result = Workbook().active, Workbook().active
+    row_apply_put_fc_data(job, expected, input_fc)
+    job._put_fc_data(result, input_fc)
+    assert cell_values(result) == cell_values(expected)
+    # Rows without a non-zero week have no dates, and the rows with one week have a single date as range
+    date_range = [row[23] for row in cell_values(expected)]
+    assert None in date_range and any(value and " - " not in value[1] for value in date_range)
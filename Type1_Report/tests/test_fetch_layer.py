@@ -0,0 +1,100 @@
+import sqlite3
+from types import SimpleNamespace
+import pandas as pd
+import pytest
+from openpyxl import Workbook, load_workbook
+from openpyxl.styles import Font, Alignment, Border
+from src.classes.FetchLayer import FetchLayer
+from src.classes.WriteOnlyReport import WriteOnlyReport
+
+ROWS = [(i, f"DISTRIBUTOR {i}", i * 1.5) for i in range(23)]
+
+
+@pytest.fixture
+def connection():
+    connection = sqlite3.connect(":memory:")
+    connection.execute("CREATE TABLE volumes (distributor_id INTEGER, distributor_name TEXT, volume REAL)")
+    connection.executemany("INSERT INTO volumes VALUES (?, ?, ?)", ROWS)
+    yield connection
+    connection.close()
+
+
+class FakeOracleCursor:
+    """A cursor that describes its columns like python-oracledb and returns the NUMBER values as floats."""
+
+    def __init__(self, rows):
+        self.rows = rows
+        self.arraysize = 100
+        self.prefetchrows = 2
+        self.outputtypehandler = None
+        number = SimpleNamespace(name="DB_TYPE_NUMBER")
+        # name, type, display size, internal size, precision, scale, null ok
+        self.description = [("VOLUME", number, None, None, 10, 0, True), ("MISSING", number, None, None, 10, 0, True), ("SHARE", number, None, None, 5, 2, True)]
+
+    def execute(self, sql, params):
+        self.position = 0
+
+    def fetchmany(self, size):
+        batch = self.rows[self.position:self.position + size]
+        self.position += size
+        return batch
+
+    def close(self):
+        pass
+
+
+def test_chunks_match_the_whole_result(connection):
+    fetcher = FetchLayer(connection, arraysize=2, chunk_rows=5)
+    chunks = list(fetcher.iter_chunks("SELECT * FROM volumes WHERE volume >= :low", {"low": 0}, name="volumes"))
+    assert [len(chunk.index) for chunk in chunks] == [6, 6, 6, 5]
+    expected = pd.read_sql_query("SELECT * FROM volumes", connection)
+    pd.testing.assert_frame_equal(pd.concat(chunks, ignore_index=True), expected)
+    assert fetcher.metrics["rows"] == 23
+    # The execute call brings back 3 rows, then 2 rows per round trip and one more to see the end
+    assert fetcher.metrics["round_trips"] == 1 + 11
+
+
+def test_empty_result_has_the_columns(connection):
+    df = FetchLayer(connection).fetch_frame("SELECT * FROM volumes WHERE volume < 0")
+    assert list(df.columns) == ["distributor_id", "distributor_name", "volume"] and df.empty
+
+
+def test_whole_number_columns_become_int64():
+    cursor = FakeOracleCursor([(1.0, None, 0.5), (2.0, 3.0, 0.25)])
+    fetcher = FetchLayer(SimpleNamespace(cursor=lambda: cursor), arraysize=7)
+    df = fetcher.fetch_frame("SELECT volume, missing, share FROM volumes")
+    assert df["VOLUME"].dtype == "int64" and df["MISSING"].dtype == "float64" and df["SHARE"].dtype == "float64"
+    # The fetch sizes and the output types are set on the cursor only
+    assert (cursor.arraysize, cursor.prefetchrows, cursor.outputtypehandler) == (7, 8, FetchLayer._output_type_handler)
+
+
+def test_tuned_connection_opens_tuned_cursors(connection):
+    fetcher = FetchLayer(connection, arraysize=7)
+    cursor = fetcher.tuned_connection.cursor()
+    assert cursor.arraysize == 7
+    # Only the fetch sizes are set, the cursors of the libraries keep the default output types
+    oracle_cursor = FakeOracleCursor([])
+    FetchLayer(SimpleNamespace(cursor=lambda: oracle_cursor), arraysize=7).tuned_connection.cursor()
+    assert (oracle_cursor.arraysize, oracle_cursor.prefetchrows, oracle_cursor.outputtypehandler) == (7, 8, None)
+    assert fetcher.tuned_connection.total_changes == connection.total_changes
+    # Libraries that open their own cursors read through it, their fetches are measured
+    collect = lambda con, sql: pd.DataFrame(con.cursor().execute(sql).fetchall())
+    df = fetcher.measure("volumes", collect, fetcher.tuned_connection, "SELECT * FROM volumes")
+    assert len(df.index) == fetcher.metrics["rows"] == 23
+
+
+def test_write_only_report_takes_the_chunks(connection, tmp_path):
+    template = Workbook()
+    for row in range(1, 8):
+        template.active.cell(row=row, column=1, value=f"Header {row}")
+    style = dict(font=Font(name="Arial", size=8), alignment=Alignment(wrapText=True), border=Border())
+    fetcher = FetchLayer(connection, arraysize=2, chunk_rows=5)
+    outputs = {}
+    for name, data in [("chunks", fetcher.iter_chunks("SELECT * FROM volumes")), ("frame", pd.read_sql_query("SELECT * FROM volumes", connection))]:
+        report = WriteOnlyReport(template.active, "Report", header_rows=7)
+        report.write_header({})
+        assert report.write_data(data, **style) == 23
+        report.save(str(tmp_path / f"{name}.xlsx"))
+        outputs[name] = [row for row in load_workbook(tmp_path / f"{name}.xlsx").active.iter_rows(values_only=True)]
+    assert outputs["chunks"] == outputs["frame"]
+    assert outputs["chunks"][7:] == [tuple(row) for row in ROWS]
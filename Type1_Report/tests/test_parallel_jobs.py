@@ -0,0 +1,54 @@
+import glob
+import os
+import pytest
+from src.Type1_ReportA_Rpt import Type1_ReportA_Rpt
+
+
+class FakeConnection:
+    def close(self):
+        pass
+
+
+def connect():
+    return FakeConnection()
+
+
+def test_parallel_jobs_match_the_sequential_run(synthetic_run):
+    sequential = synthetic_run()
+    sequential.run()
+    expected = list(sequential.artifacts.frames)
+    os.remove(sequential.out_final_summary)
+    messages = []
+    parallel = synthetic_run(log=messages.append)
+    parallel.run(workers=4, connect=connect)
+    assert set(parallel.artifacts.frames) == set(expected)
+    # The messages of each job are written together, in the order of the jobs
+    jobs = [message.split("]")[0][1:] for message in messages if message.startswith("[")]
+    assert jobs == sorted(jobs, key=["cig_job", "ecig_job", "cgr_job", "otp_job"].index)
+
+
+def test_a_failed_job_stops_the_others(synthetic_run, monkeypatch):
+    def fail(self):
+        raise ValueError("no data for ecig")
+
+    monkeypatch.setattr(Type1_ReportA_Rpt, "ecig_job", fail)
+    # The other jobs wait a little before each step, so that the failure is seen before they are done
+    check_stop = Type1_ReportA_Rpt._check_stop
+
+    def slow_check_stop(self, step):
+        Type1_ReportA_Rpt.stop_event.wait(5)
+        check_stop(self, step)
+
+    monkeypatch.setattr(Type1_ReportA_Rpt, "_check_stop", slow_check_stop)
+    messages = []
+    job = synthetic_run(log=messages.append)
+    with pytest.raises(Exception, match="ecig_job failed: no data for ecig"):
+        job.run(workers=4, connect=connect)
+    # Only the failed job reports an error, the others stop before their first step
+    for job_name in ["cig_job", "cgr_job", "otp_job"]:
+        assert f"[{job_name}] Stopped {job_name} since another category job has failed." in messages
+    assert job.manifest.steps == {}
+    # No report is left half written
+    work_dir = os.path.dirname(os.path.dirname(job.out_final_cig))
+    assert glob.glob(os.path.join(work_dir, "**", "*.tmp"), recursive=True) == []
+    assert not any(os.path.exists(path) for path in [job.out_dr_cig, job.out_dr_cgr, job.out_dr_otp])
@@ -0,0 +1,56 @@
+import os
+import pandas as pd
+import pytest
+from openpyxl import Workbook
+from tests.synthetic import make_g360_frames, make_wdc_frame, SYNTHETIC_CWK
+from src.Type1_ReportA_Rpt import Type1_ReportA_Rpt
+from src.classes.ArtifactStore import ArtifactStore
+from src.classes.SidecarCache import SidecarCache
+
+
+def save_report(path: str, df: pd.DataFrame, header: list):
+    """Save the dataframe below a header on row 7, as the dynamic and WDC reports are."""
+    wb = Workbook()
+    for col, value in enumerate(header, start=1):
+        wb.active.cell(row=7, column=col, value=value)
+    Type1_ReportA_Rpt.dataframe_to_excel(df, wb.active, skip_rows=7)
+    wb.save(path)
+
+
+def job_frames() -> dict:
+    df_g360, _ = make_g360_frames(20, "ecig", seed=1)
+    Type1_ReportA_Rpt.fill_zero(df_g360)
+    Type1_ReportA_Rpt.compact_dr_frame(df_g360)
+    df_text = pd.DataFrame({"customer": ["100011", "007", ""], "reason": ["Closed", "", "NA"], "name": ["a", None, "b"]})
+    return {"g360": df_g360, "wdc": make_wdc_frame(50, seed=2, cwk=SYNTHETIC_CWK), "text": df_text}
+
+
+@pytest.mark.parametrize("name", ["g360", "wdc", "text"])
+def test_sidecar_gives_back_what_read_excel_returns(tmp_path, name):
+    df = job_frames()[name]
+    path = str(tmp_path / f"{name}.xlsx")
+    save_report(path, df, list(df.columns))
+    sidecars = SidecarCache()
+    sidecars.write(path, ArtifactStore.as_saved(df, list(df.columns)))
+    assert os.path.exists(sidecars.sidecar_path(path))
+    pd.testing.assert_frame_equal(sidecars.read(path), pd.read_excel(path, header=0, skiprows=6))
+
+
+def test_sidecar_is_not_used_once_the_excel_file_changes(tmp_path):
+    df = job_frames()["text"]
+    path = str(tmp_path / "text.xlsx")
+    save_report(path, df, list(df.columns))
+    sidecars = SidecarCache()
+    sidecars.write(path, ArtifactStore.as_saved(df, list(df.columns)))
+    save_report(path, df.iloc[:2], list(df.columns))
+    assert sidecars.read(path) is None
+
+
+def test_sidecar_is_skipped_for_mixed_columns(tmp_path):
+    df = pd.DataFrame({"mixed": ["abc", 7, None]}, dtype=object)
+    path = str(tmp_path / "mixed.xlsx")
+    save_report(path, df, ["mixed"])
+    sidecars = SidecarCache()
+    sidecars.write(path, ArtifactStore.as_saved(df, ["mixed"]))
+    assert not os.path.exists(sidecars.sidecar_path(path))
+    assert sidecars.read(path) is None
@@ -0,0 +1,33 @@
+from src.classes.SpanTracer import SpanTracer
+
+
+def test_null_span_ignores_attribute_writes():
+    tracer = SpanTracer(enabled=False)
+    with tracer.span("sheet", "write") as span:
+        span.rows, span.cells = 10, 100
+        span.anything = "value"
+    assert span.rows is None and span.cells is None
+    assert not hasattr(span, "anything")
+    assert tracer.span("other", "query").rows is None
+    assert tracer.spans == []
+
+
+def test_phase_totals_only_adds_up_innermost_spans():
+    spans = [
+        {"name": "cig_job/report 4", "phase": "query", "wall_s": 1.0},
+        {"name": "cig_job/sheet", "phase": "write", "wall_s": 2.0},
+        {"name": "cig_job/sheet/inner", "phase": "style", "wall_s": 0.5},
+        {"name": "cig_job", "phase": "job", "wall_s": 4.0},
+        {"name": "cig_job_2", "phase": "job", "wall_s": 3.0},
+    ]
+    assert SpanTracer.phase_totals(spans) == {"query": 1.0, "style": 0.5, "job": 3.0}
+
+
+def test_summary_lists_the_phase_totals():
+    tracer = SpanTracer()
+    with tracer.span("job", "job"):
+        with tracer.span("sheet", "write", rows=1, cells=2):
+            pass
+    lines = tracer.summary().splitlines()
+    assert lines[-1].startswith("Total write")
+    assert not any(line.startswith("Total job") for line in lines)
@@ -0,0 +1,78 @@
+import pandas as pd
+from tests.synthetic import SYNTHETIC_CWK, WDC_COLUMNS, make_fc_frame, make_wdc_frame, fc_header, make_fc_workbook
+from tests.reference import row_by_row_summary_lookups, row_by_row_reason
+
+DISTRIBUTORS = 60
+
+
+def make_fc_frames(job) -> dict:
+    """Make the FC frames of each category, with two more rows of the first distributor added above the others.
+
+    The first added row has no volume and no RSD volume, and the second one the opposite RSD volume of the distributor's own row.
+    """
+    frames = {}
+    for i, sheet in enumerate(job.out_summary_sheets[1:5]):
+        df_fc = make_fc_frame(DISTRIBUTORS, seed=i)
+        df_fc[19] = [100] + df_fc[19].tolist()[1:]
+        extra = df_fc.iloc[[0, 0]].copy()
+        extra[4] = pd.Series([None, 7], index=extra.index, dtype=object)
+        extra[19] = [0, -100]
+        extra[21] = [SYNTHETIC_CWK - 20, SYNTHETIC_CWK - 21]
+        frames[sheet] = pd.concat([extra, df_fc], ignore_index=True)
+    return frames
+
+
+def make_summary_workbook(job, tmp_path):
+    """Create the FC and WDC worksheets of the summary report as create_final_summary() does before the summary sheet."""
+    frames = make_fc_frames(job)
+    for sheet, df_fc in frames.items():
+        job.artifacts.put(job.out_final_summary, df_fc, fc_header(job), sheet=sheet)
+    wb = make_fc_workbook(job, frames)
+    for i, sheet in enumerate(job.out_summary_sheets[5:9]):
+        ws = wb.create_sheet(sheet)
+        for col, value in enumerate([job.col_curr_db[0]] + WDC_COLUMNS, start=1):
+            ws.cell(row=1, column=col, value=value)
+        df_wdc = make_wdc_frame(DISTRIBUTORS, seed=10 + i, cwk=SYNTHETIC_CWK)
+        # The first reason of a customer number is kept even if it is empty
+        df_wdc = pd.concat([df_wdc.iloc[[0]].assign(REASON=None), df_wdc], ignore_index=True)
+        input_wdc = str(tmp_path / f"{sheet}.xlsx")
+        job.artifacts.put(input_wdc, df_wdc, WDC_COLUMNS)
+        job._create_wdc_sheet(wb, input_wdc, sheet)
+    return wb
+
+
+def summary_keys(job, wb) -> pd.DataFrame:
+    """Get the 'Concatenated', 'Distributor Name' and 'Customer Number' columns of the summary, as _put_summary_data() starts it."""
+    return job._add_cols_dist_cust(job._add_col_concatenated(wb)).reset_index(drop=True)
+
+
+def test_fc_lookups_match_the_row_by_row_scans(job, tmp_path):
+    wb = make_summary_workbook(job, tmp_path)
+    df = summary_keys(job, wb)
+    expected = row_by_row_summary_lookups(job, wb, df.copy())
+    fc_index = job._build_fc_index()
+    result = job._add_cols_impacted(fc_index, df.copy())
+    result = job._add_cols_rsd_vol(fc_index, result)
+    result = job._add_cols_vol_impact(fc_index, result)
+    result = job._add_cols_week_change(fc_index, result)
+    # Empty week codes are NaN in both, which are not equal to each other
+    as_none = lambda values: [None if pd.isna(value) else value for value in values]
+    for column_name in expected.columns[3:]:
+        assert as_none(result[column_name]) == as_none(expected[column_name]), column_name
+    # The repeated distributor is both an addition and a decrease, with the first volume and the week of its first row
+    key = wb[job.out_summary_sheets[1]]["A6"].value
+    row = result[result[job.col_curr_db[0]] == key].iloc[0]
+    assert (row["Additions"], row["Decreases"], row[job.col_summary[10]]) == ("X", "X", 7)
+    assert row[f"{job.out_summary_sheets[1]} wk"] == SYNTHETIC_CWK - 20
+
+
+def test_reason_matches_the_row_by_row_lookup(job, tmp_path):
+    wb = make_summary_workbook(job, tmp_path)
+    df = summary_keys(job, wb)
+    assert job._add_col_reason(df.copy())[job.col_summary[9]].tolist() == row_by_row_reason(job, wb, df)
+    # The customer numbers of the summary are text and the WDC ones are read back as numbers, so look them up as numbers too
+    probe = df.copy()
+    probe[probe.columns[2]] = pd.to_numeric(probe.iloc[:, 2])
+    expected = row_by_row_reason(job, wb, probe)
+    assert job._add_col_reason(probe)[job.col_summary[9]].tolist() == expected
+    assert any(expected) and not all(expected)
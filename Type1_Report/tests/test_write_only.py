@@ -0,0 +1,57 @@
+from copy import copy
+from openpyxl import load_workbook
+from tests.synthetic import prepare_run
+from src.Type1_ReportA_Rpt import Type1_ReportA_Rpt
+
+
+def workbook_contents(path: str) -> dict:
+    """Get the values, cell styles and layout of each sheet of a workbook keyed by sheet name, without the creation times."""
+    wb = load_workbook(path)
+    contents = {}
+    # The style ids are only valid in their own workbook, so the style objects are compared once per style id
+    styles = {}
+    for ws in wb.worksheets:
+        cells = {}
+        for row in ws.iter_rows():
+            for cell in row:
+                value = None if str(cell.value).startswith("Report created on") else cell.value
+                # Empty cells without a style are not written by the write-only workbook
+                if value is None and not cell.has_style:
+                    continue
+                if cell.style_id not in styles:
+                    styles[cell.style_id] = (copy(cell.font), copy(cell.fill), copy(cell.border), copy(cell.alignment), cell.number_format, copy(cell.protection))
+                cells[cell.coordinate] = (value, styles[cell.style_id])
+        contents[ws.title] = {
+            "cells": cells,
+            "widths": {key: dim.width for key, dim in ws.column_dimensions.items() if dim.customWidth},
+            "merged": sorted(str(cell_range) for cell_range in ws.merged_cells.ranges),
+            "freeze_panes": ws.freeze_panes,
+        }
+    wb.close()
+    return contents
+
+
+def create_reports(job) -> list:
+    """Create the dynamic and WDC reports of each category as the category jobs do, the only reports that write_only changes."""
+    steps = [
+        ("cig", job.rid_cig, job.dr_cig, job.out_dr_cig, job.rid_cig_wdc, job.wdc_cig, job.out_wdc_cig),
+        ("ecig", job.rid_ecig, job.dr_ecig, job.out_dr_ecig, job.rid_ecig_wdc, job.wdc_ecig, job.out_wdc_ecig),
+        ("cgr", job.rid_cgr, job.dr_cgr, job.out_dr_cgr, job.rid_cgr_wdc, job.wdc_cgr, job.out_wdc_cgr),
+        ("otp", job.rid_otp, job.dr_otp, job.out_dr_otp, job.rid_otp_wdc, job.wdc_otp, job.out_wdc_otp),
+    ]
+    for category, rid_dr, dr_name, out_dr, rid_wdc, wdc_name, out_wdc in steps:
+        job._dr_step(category, rid_dr, dr_name, job.temp_dr_cig, out_dr, "FD4")
+        job._wdc_step(category, rid_wdc, wdc_name, job.temp_wdc, out_wdc, "G4")
+    return [path for step in steps for path in (step[3], step[6])]
+
+
+def test_write_only_reports_match_the_template_reports(tmp_path, pdr_state):
+    # A few distributors are enough for the header blocks, the styles and the data rows of every report
+    report_id, template_path, output_path = prepare_run(5, str(tmp_path), pdr_state, previous_week=False)
+    make_job = lambda **kwargs: Type1_ReportA_Rpt(None, "BENCH.DR_REPORTS", report_id, template_path, output_path, **kwargs)
+    outputs = create_reports(make_job())
+    expected = {path: workbook_contents(path) for path in outputs}
+    # The write-only job saves the same files over the reports of the template job
+    assert create_reports(make_job(write_only=True)) == outputs
+    for path in outputs:
+        assert workbook_contents(path) == expected[path], path
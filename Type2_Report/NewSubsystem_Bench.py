@@ -0,0 +1,118 @@
+import os
+import re
+import sys
+import time
+import random
+import argparse
+import tempfile
+
+# Description: This is the benchmark program to time the substitution of the place holders of AutoSQL on a synthetic corpus of SQL files.
+
+# Values of the place holders of a synthetic client, as AutoSQL.init_replacers() would compile them
+CLIENT = "ABC"
+TOKENS = {
+    "XYZ": CLIENT.upper(),
+    "xyz": CLIENT.lower(),
+    "XXXXXX_VALUE": "1234",
+    "SXXXXXE_VALUE": f"'{CLIENT.upper()}_XXX_XXX_PRD'",
+    "TRANSFER_INFO_OID_VALUE": "98765",
+    "PXXXXXVALUE": "4321",
+    "FXXXXXVALUE": "555",
+}
+# Statements the synthetic files are made of, with the place holders of the input SQL files
+STATEMENTS = [
+    "INSERT INTO XXX_XXX_PRD.XXXXX_subsystem (XXXXXX, SCHEMA_NAME) VALUES (XXXXXX_VALUE, SXXXXXE_VALUE);\n",
+    "INSERT INTO {schema}.transfer_info (TRANSFER_INFO_OID, PROJECT_OID, FILE_PROJECT_ID) VALUES (TRANSFER_INFO_OID_VALUE, PXXXXXVALUE, FXXXXXVALUE);\n",
+    "CREATE TABLE XYZ_XXX_XXX_PRD.xyz_table_{i} (ID NUMBER, NAME VARCHAR2(100)) TABLESPACE XYZ_DATA;\n",
+    "GRANT SELECT, INSERT, UPDATE, DELETE ON XYZ_XXX_XXX_PRD.xyz_table_{i} TO XYZ_XXX_XXX_TST;\n",
+    "-- Comment without any place holder for the table {i} of the subsystem\n",
+]
+
+
+def chained_replace(content: str) -> str:
+    """Replace the place holders with one str.replace() call per place holder, as AutoSQL.update_sql() used to."""
+    for token, value in TOKENS.items():
+        content = content.replace(token, value)
+    return content
+
+
+def make_corpus(folder: str, files: int, statements: int, seed: int = 0) -> list[str]:
+    """Write the synthetic SQL files and return their paths."""
+    rng = random.Random(seed)
+    paths = []
+    for i in range(files):
+        lines = [rng.choice(STATEMENTS).format(schema=rng.choice(["XYZ_XXX_XXX_PRD", "XXX_XXX_TST"]), i=j) for j in range(statements)]
+        path = os.path.join(folder, f"xyz_file_{i}.sql")
+        with open(path, "w") as file:
+            file.write("".join(lines))
+        paths.append(path)
+    return paths
+
+
+def time_pass(name: str, paths: list[str], out_folder: str, rewrite) -> dict:
+    """Rewrite every file of the corpus into out_folder and return the time taken."""
+    os.makedirs(out_folder, exist_ok=True)
+    start = time.perf_counter()
+    for path in paths:
+        rewrite(path, os.path.join(out_folder, os.path.basename(path)))
+    seconds = time.perf_counter() - start
+    print(f"{name:<12} {seconds:>8.3f}s {len(paths) / seconds:>10.0f} files/s")
+    return {"name": name, "seconds": seconds}
+
+
+def main(args):
+    from src.TokenReplacer import TokenReplacer
+    replacer = TokenReplacer(TOKENS)
+
+    def rewrite_chained(input_file, output_file):
+        with open(input_file, "r") as file:
+            content = file.read()
+        with open(output_file, "w") as file:
+            file.write(chained_replace(content))
+
+    def rewrite_compiled(input_file, output_file):
+        with open(input_file, "r") as file:
+            content = file.read()
+        with open(output_file, "w") as file:
+            file.write(replacer.replace(content))
+
+    # One regular expression pass, kept to compare with the chained replacements of TokenReplacer, longest place holders first
+    pattern = re.compile("|".join(re.escape(token) for token in sorted(TOKENS, key=len, reverse=True)))
+
+    def rewrite_single_pass(input_file, output_file):
+        with open(input_file, "r") as file:
+            content = file.read()
+        with open(output_file, "w") as file:
+            file.write(pattern.sub(lambda match: TOKENS[match.group(0)], content))
+
+    def rewrite_streamed(input_file, output_file):
+        replacer.replace_file(input_file, output_file, chunk_size=args.chunk_size)
+
+    with tempfile.TemporaryDirectory() as work_dir:
+        os.makedirs(os.path.join(work_dir, "input"))
+        paths = make_corpus(os.path.join(work_dir, "input"), args.files, args.statements)
+        size = sum(os.path.getsize(path) for path in paths)
+        print(f"{len(paths)} files, {size / 1024 / 1024:.1f} MB")
+        results = [
+            time_pass("chained", paths, os.path.join(work_dir, "chained"), rewrite_chained),
+            time_pass("single-pass", paths, os.path.join(work_dir, "single-pass"), rewrite_single_pass),
+            time_pass("compiled", paths, os.path.join(work_dir, "compiled"), rewrite_compiled),
+            time_pass("streamed", paths, os.path.join(work_dir, "streamed"), rewrite_streamed),
+        ]
+        # Check that every pass gives the same files
+        for result in results[1:]:
+            for path in paths:
+                with open(os.path.join(work_dir, "chained", os.path.basename(path))) as expected, open(os.path.join(work_dir, result["name"], os.path.basename(path))) as actual:
+                    if expected.read() != actual.read():
+                        raise ValueError(f"'{result['name']}' does not match 'chained' for {os.path.basename(path)}")
+        print("All outputs match.")
+
+
+if __name__ == "__main__":
+    # Import the src package from the folder of this file
+    sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+    parser = argparse.ArgumentParser(description="Time the substitution of the place holders of AutoSQL on synthetic SQL files.")
+    parser.add_argument("--files", type=int, default=500, help="number of SQL files in the corpus")
+    parser.add_argument("--statements", type=int, default=2000, help="number of statements in each file")
+    parser.add_argument("--chunk-size", type=int, default=64 * 1024, help="number of characters read at a time when streaming")
+    main(parser.parse_args())
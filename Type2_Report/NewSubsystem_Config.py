@@ -18,3 +18,6 @@ import pdr.utils.Config as config
 ) = config.get_params(
     r"F:\XXXXX\Logs"
 )
+
+# Number of SQL files updated at the same time by AutoSQL, each in its own thread (1 updates them one after another)
+sql_workers = 8
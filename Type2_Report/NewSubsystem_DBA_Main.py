@@ -1,8 +1,10 @@
 import time, datetime, sys
+import argparse
 import pdr.handlers.Warning_Handler as warn
 import pdr.handlers.Console_Handler as console
 import pdr.data.Connection as conn
-import src.auto.AutoSQL as sql
+import src.AutoSQL as sql
+import src.AutoSQLBatch as sql_batch
 import src.dply.DeploySQL as deploy
 import NewSubsystem_Config as config
 
@@ -10,7 +12,7 @@ import NewSubsystem_Config as config
 # Will generate all CTM and Unix scripts for WLA user to run.
 
 
-def main():
+def main(args):
     current_time = datetime.datetime.now()
     # Logging the start of the program
     console.log("New Subsystem (DBA) Has Started on " + str(current_time))
@@ -32,26 +34,40 @@ def main():
         config.password[1],
         msg=False,
     )
-    # Initialize an instance of AutoSQL
-    sql_job = sql.AutoSQL(connection_GCYF1P, connection_DSC1P)
-    # Run the AutoSQL job to create and update the SQL files in the output directory
-    sql_job.run()
-    # Get the password list
-    password_list = sql_job.get_password_list()
-    # Initialize an instance of DeploySQL
-    deploy_sql = deploy.DeploySQL(password_list)
-    # Run the AutoDeploy job to deploy all connection profiles to Control-M
-    deploy_sql.run()
+    if args.batch:
+        # Initialize an instance of AutoSQLBatch with the control variables of each client
+        sql_job = sql_batch.AutoSQLBatch(connection_GCYF1P, connection_DSC1P, sql_batch.AutoSQLBatch.read_control_rows(args.batch))
+        # Run the AutoSQL job of all the clients to create and update the SQL files in their output directories
+        sql_job.run()
+        # Get the control variables and the password list of each client
+        clients = sql_job.get_deploy_inputs()
+    else:
+        # Initialize an instance of AutoSQL
+        sql_job = sql.AutoSQL(connection_GCYF1P, connection_DSC1P)
+        # Run the AutoSQL job to create and update the SQL files in the output directory
+        sql_job.run()
+        # Get the control variables and the password list
+        clients = [(sql_job.all_variables, sql_job.get_password_list())]
+    for all_variables, password_list in clients:
+        # DeploySQL reads the client from the control variables of NewSubsystem_Config, so they are set to the ones of each client in turn
+        config.all_variables = all_variables
+        # Initialize an instance of DeploySQL
+        deploy_sql = deploy.DeploySQL(password_list)
+        # Run the AutoDeploy job to deploy all connection profiles to Control-M
+        deploy_sql.run()
 
 
 
 if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Run the New Subsystem (DBA) job.")
+    parser.add_argument("--batch", metavar="FILE", help="Excel or CSV file with the control variables of several clients, one row per client, to create all their subsystems in one run")
+    args = parser.parse_args()
     warn.open_warning_handler(config.warnings_file)
     console.set_log(config.console_file)
     # Call the main method
     try:
         start = time.time()
-        main()
+        main(args)
         end = time.time()
         total = end - start
         console.log(
@@ -1,9 +1,11 @@
-import os, warnings, re, traceback, random, string, json, shutil
+import os, warnings, re, traceback, random, string, json, shutil, copy
+from concurrent.futures import ThreadPoolExecutor
 import pandas as pd
 from pandas import DataFrame
 import pdr.handlers.Console_Handler as console
 import src.config.API as API
 import NewSubsystem_Config as config
+from src.TokenReplacer import TokenReplacer
 
 # Description: This class is used to automatically update SQL file content and file names.
 
@@ -42,6 +44,7 @@ class AutoSQL:
         self.file_project_id = None
         self.transfer_info_oid = None
         # Initialize the control variables
+        self.all_variables = []
         self.database = ""
         self.data_warehouse = 0
         self.server = config.server.upper()
@@ -49,8 +52,19 @@ class AutoSQL:
         self.mclane = ""
         self.farner_dist_id = []
         self.mclane_dist_id = []
+        # Initialize the distributor names matched in xref_distributor
+        self.farner_dist_name = "FXXXXX CO - CARROLL"
+        self.mclane_dist_name = "MCLANE"
         self.user_lists = []
+        # Initialize the files of the master script written so far, in the order they are added to it
+        self.master_files = []
+        # Initialize the first line of the files run by the master script
+        self.define_off = "set define off;\n"
         self.col_dist_id = "DIST_ID"
+        self.col_dist_name = "DIST_NAME"
+        self.col_client_oid = "XXXXXX"
+        # Initialize the largest number of values in the IN list of a query
+        self.max_in_list = 1000
         self.col_swk = "START_PERIOD_CODE"
         self.col_cwk = "END_PERIOD_CODE"
         # Initialize the current week code and end week code for each enrolled distributor ID for the new client
@@ -58,6 +72,17 @@ class AutoSQL:
         # Initialize password variables
         self.password_file = "xyz_password_list_SERVER.json"
         self.password_list = {}
+        # Initialize the substitutions of the place holders, compiled once the client information is known
+        self.sql_replacer = None
+        self.objects_replacer = None
+        self.profile_replacer = None
+        self.users_replacer = None
+        # Initialize the compiled templates shared by the clients of a batch, the input files are read by each client if None
+        self.templates = None
+        # Initialize the file size from which the SQL files are updated chunk by chunk instead of in memory
+        self.stream_min_bytes = 16 * 1024 * 1024
+        # Initialize the number of files updated at the same time by update_sql_files() (1 updates them one after another)
+        self.workers = config.sql_workers
         # Suppress the sqlalchemy database connection warning
         warnings.filterwarnings(
             "ignore", message="pandas only supports SQLAlchemy connectable"
@@ -102,25 +127,47 @@ class AutoSQL:
             )
 
 
-    def init_control_variables(self):
+    def bind_chunks(self, prefix: str, values: list) -> list[dict]:
+        """Split the values of a list of bind variables into chunks of at most max_in_list values.
+
+        Oracle takes at most 1000 values in an IN list. The bind variables are numbered from 0 in
+        each chunk, so that the query text is the same for chunks of the same size.
+
+        Args:
+            prefix (str): the prefix of the bind variable names
+            values (list): the values of the bind variables
+
+        Returns:
+            list[dict]: the value of each bind variable of each chunk, e.g. [{'name_0': 'A', 'name_1': 'B'}]
+        """
+        return [
+            {f"{prefix}_{i}": value for i, value in enumerate(values[start:start + self.max_in_list])}
+            for start in range(0, len(values), self.max_in_list)
+        ]
+
+
+    def init_control_variables(self, all_variables: list = None):
         try:
+            # Initialize the control variables of the run, the ones of a batch row if given
+            all_variables = config.all_variables if all_variables is None else all_variables
+            self.all_variables = list(all_variables)
             # Initialize the new client short name, input directory, output directory, and enrollment status
-            self.new_client_short_name = config.all_variables[0]
-            self.input_directory = os.path.join(config.all_variables[4], "SQL")
+            self.new_client_short_name = all_variables[0]
+            self.input_directory = os.path.join(all_variables[4], "SQL")
             self.input_directory_base = self.input_directory
             self.connection_profile_input_directory = os.path.join(self.input_directory, "CONNECTION_PROFILES")
-            self.output_directory = os.path.join(config.all_variables[5], self.new_client_short_name.upper(), self.server, "SQL")
+            self.output_directory = os.path.join(all_variables[5], self.new_client_short_name.upper(), self.server, "SQL")
             self.output_directory_base = self.output_directory
             self.connection_profile_output_directory = os.path.join(self.output_directory, "CONNECTION_PROFILES")
-            self.data_warehouse = str(config.all_variables[1])
+            self.data_warehouse = str(all_variables[1])
             if self.data_warehouse == "1" or self.data_warehouse == "2":
                 self.data_warehouse = int(self.data_warehouse)
             elif self.data_warehouse.lower() == "both":
                 self.data_warehouse = [1, 2]
             else:
                 raise ValueError("Data warehouse must be 1, 2, or both")
-            self.farner = config.all_variables[2]
-            self.mclane = config.all_variables[3]
+            self.farner = all_variables[2]
+            self.mclane = all_variables[3]
             self.password_file = self.password_file.replace("xyz", self.new_client_short_name.lower()).replace("SERVER", self.server)
             # Create the output directory if it does not exist
             os.makedirs(self.output_directory, exist_ok=True)
@@ -164,29 +211,42 @@ class AutoSQL:
             raise e
 
 
-    def _get_dist_id(self, distributor_name: str):
+    def _get_dist_id(self, distributor_names: list[str]):
         try:
-            # Initialize the SELECT query to get the distributor ID
-            query = f"""SELECT DISTINCT {self.col_dist_id} FROM {self.tb_xref_distributor}
-            WHERE dist_name LIKE '%{distributor_name.upper()}%'
-            """
-            # Execute the query and return the results as a DataFrame
-            return pd.read_sql_query(query, self.connection_GXXXXXP)
+            frames = []
+            # Initialize one bind variable per distributor name, so that the names are read in one query per chunk
+            for binds in self.bind_chunks("dist_name", [f"%{name.upper()}%" for name in distributor_names]):
+                conditions = " OR ".join(f"dist_name LIKE :{bind}" for bind in binds)
+                # Initialize the SELECT query to get the distributor ID and name of all the distributors
+                query = f"""SELECT DISTINCT {self.col_dist_id}, {self.col_dist_name} FROM {self.tb_xref_distributor}
+                WHERE {conditions}
+                """
+                # Execute the query and keep the results as a DataFrame
+                frames.append(pd.read_sql_query(query, self.connection_GXXXXXP, params=binds))
+            # A distributor matching the names of several chunks is only kept once
+            return pd.concat(frames, ignore_index=True).drop_duplicates(ignore_index=True)
         except Exception as e:
             console.log(
-                f"An error occurred in get_dist_id() for {distributor_name.upper()}: {e}"
+                f"An error occurred in get_dist_id() for {', '.join(name.upper() for name in distributor_names)}: {e}"
             )
             raise e
 
 
-    def _get_swk_cwk(self, dist_id: int):
+    def _get_swk_cwk(self, dist_ids: list[int], client_oids: list[int] = None):
         try:
-            # Initialize the SELECT query to get the current week code and end week code for each distributor ID
-            query = f"""SELECT DISTINCT {self.col_swk}, {self.col_cwk} from {self.tb_helpdesk_distributor}
-            WHERE xXXXXX = {self.new_client_oid} AND dist_id = {dist_id}
-            """
-            # Execute the query and return the results as a DataFrame
-            return pd.read_sql_query(query, self.connection_GXXXXXP)
+            # Initialize one bind variable per client OID, only the new client unless the clients of a batch are given
+            client_oids = [self.new_client_oid] if client_oids is None else client_oids
+            frames = []
+            # Initialize one bind variable per client OID and distributor ID, in chunks of at most max_in_list values
+            for client_binds in self.bind_chunks("client_oid", [int(client_oid) for client_oid in client_oids]):
+                for binds in self.bind_chunks("dist_id", [int(dist_id) for dist_id in dist_ids]):
+                    # Initialize the SELECT query to get the current week code and end week code of all the distributor IDs
+                    query = f"""SELECT DISTINCT xXXXXX, {self.col_dist_id}, {self.col_swk}, {self.col_cwk} from {self.tb_helpdesk_distributor}
+                    WHERE xXXXXX IN ({", ".join(f":{bind}" for bind in client_binds)}) AND dist_id IN ({", ".join(f":{bind}" for bind in binds)})
+                    """
+                    # Execute the query and keep the results as a DataFrame
+                    frames.append(pd.read_sql_query(query, self.connection_GXXXXXP, params={**client_binds, **binds}))
+            return pd.concat(frames, ignore_index=True)
         except Exception as e:
             console.log(f"An error occurred in get_swk_cwk(): {e}")
             raise e
@@ -203,12 +263,13 @@ class AutoSQL:
             raise e
 
 
-    def _init_client_name(self):
+    def _init_client_name(self, df_client: DataFrame = None):
         try:
             # Initialize the column names
             cols = ["CLIENT_NAME", "XXXXXX"]
-            # Get the client data from the xref_client table
-            df_client = self._get_xref_client()
+            # Get the client data from the xref_client table, unless it was prefetched for a batch
+            if df_client is None:
+                df_client = self._get_xref_client()
             # Check if all the columns exist in the DataFrame
             AutoSQL.check_missing_cols(df_client, cols)
             # Access the first row of the DataFrame (assume only one row is returned)
@@ -227,12 +288,13 @@ class AutoSQL:
             )
 
 
-    def _init_oid(self):
+    def _init_oid(self, df_project: DataFrame = None, transfer_info_oid: int = None):
         try:
             # Initialize the column names
             cols = ["PROJECT_OID", "INDUSTRY_OID", "FILE_PROJECT_ID"]
-            # Get the project data from the project table
-            df_project = self._get_project()
+            # Get the project data from the project table, unless it was prefetched for a batch
+            if df_project is None:
+                df_project = self._get_project()
             # Check if all the columns exist in the DataFrame
             AutoSQL.check_missing_cols(df_project, cols)
             # Acess the first row of the DataFrame (assume only one row is returned)
@@ -241,7 +303,7 @@ class AutoSQL:
             self.project_oid = row_project[cols[0]]
             self.industry_oid = row_project[cols[1]]
             self.file_project_id = row_project[cols[2]]
-            self.transfer_info_oid = self._get_transfer_info_oid()
+            self.transfer_info_oid = self._get_transfer_info_oid() if transfer_info_oid is None else transfer_info_oid
         except Exception as e:
             console.log(f"An error occurred in _init_oid(): {e}")
             raise e
@@ -254,25 +316,31 @@ class AutoSQL:
             )
 
 
-    def _init_dist_id(self):
+    def _init_dist_id(self, df_dist: DataFrame = None):
         try:
-            # Get the distributor ID for FXXXXX Co and McLane if they are enrolled for the new client
+            # Get the distributor name of FXXXXX Co and McLane if they are enrolled for the new client
+            distributors = {}
             if self.farner.upper() == "Y":
-                df_farner = self._get_dist_id("FXXXXX CO - CARROLL")
-                # Convert the values in dist_id column to a list
-                self.farner_dist_id = df_farner[self.col_dist_id].tolist()
+                distributors["farner_dist_id"] = self.farner_dist_name
             else:
                 console.log(
                     "Skipped initializing dist_id for FXXXXX Co as it is not enrolled for the new client."
                 )
             if self.mclane.upper() == "Y":
-                df_mclane = self._get_dist_id("MCLANE")
-                # Convert the values in dist_id column to a list
-                self.mclane_dist_id = df_mclane[self.col_dist_id].tolist()
+                distributors["mclane_dist_id"] = self.mclane_dist_name
             else:
                 console.log(
                     "Skipped initializing dist_id for McLane as it is not enrolled for the new client."
                 )
+            if distributors:
+                # Get the distributor ID of all the enrolled distributors in one query, unless they were prefetched for a batch
+                if df_dist is None:
+                    df_dist = self._get_dist_id(list(distributors.values()))
+                for attribute, distributor_name in distributors.items():
+                    # Keep the distributor IDs whose name matches, as dist_name LIKE '%name%' does
+                    df = df_dist[df_dist[self.col_dist_name].str.contains(distributor_name.upper(), regex=False)]
+                    # Convert the distinct values in dist_id column to a list
+                    setattr(self, attribute, df[self.col_dist_id].drop_duplicates().tolist())
         except Exception as e:
             console.log(f"An error occurred in _init_dist_id(): {e}")
             raise e
@@ -284,63 +352,55 @@ class AutoSQL:
             )
 
 
-    def _init_week_code(self):
+    def _init_week_code(self, df_swk_cwk: DataFrame = None):
         try:
-            # Iterate through the distributor ID for FXXXXX Co and McLane if they are not empty
-            if not AutoSQL.check_null_empty(self.farner_dist_id):
-                for dist_id in self.farner_dist_id:
-                    df_swk_cwk = self._get_swk_cwk(dist_id)
-                    # Check if all the columns exist in the DataFrame
-                    AutoSQL.check_missing_cols(df_swk_cwk, [self.col_swk, self.col_cwk])
-                    if not df_swk_cwk.empty:
-                        # Access the first row of the DataFrame (assume only one row is returned)
-                        row_swk_cwk = df_swk_cwk.iloc[0]
-                        # Initialize the current week code and end week code for each distributor ID
-                        self.swk_cwk[dist_id] = (
-                            row_swk_cwk[self.col_swk],
-                            row_swk_cwk[self.col_cwk],
-                        )
-                    else:
-                        console.log(
-                            f"No week code found in '{self.tb_helpdesk_distributor}' for distributor '{dist_id}'."
-                        )
-                        continue
-
-            if not AutoSQL.check_null_empty(self.mclane_dist_id):
-                for dist_id in self.mclane_dist_id:
-                    df_swk_cwk = self._get_swk_cwk(dist_id)
-                    # Check if all the columns exist in the DataFrame
-                    AutoSQL.check_missing_cols(df_swk_cwk, [self.col_swk, self.col_cwk])
-                    if not df_swk_cwk.empty:
-                        # Access the first row of the DataFrame (assume only one row is returned)
-                        row_swk_cwk = df_swk_cwk.iloc[0]
-                        # Initialize the current week code and end week code for each distributor ID
-                        self.swk_cwk[dist_id] = (
-                            row_swk_cwk[self.col_swk],
-                            row_swk_cwk[self.col_cwk],
-                        )
-                    else:
-                        console.log(
-                            f"No week code found in '{self.tb_helpdesk_distributor}' for distributor '{dist_id}'."
-                        )
-                        continue
-
+            # Get the distributor ID for FXXXXX Co and McLane, in this order
+            dist_ids = list(self.farner_dist_id) + list(self.mclane_dist_id)
+            if AutoSQL.check_null_empty(dist_ids):
+                return
+            # Get the week codes of all the distributor IDs in one query, unless they were prefetched for a batch
+            if df_swk_cwk is None:
+                df_swk_cwk = self._get_swk_cwk(dist_ids)
+            # Check if all the columns exist in the DataFrame
+            AutoSQL.check_missing_cols(df_swk_cwk, [self.col_client_oid, self.col_dist_id, self.col_swk, self.col_cwk])
+            # Keep the week codes of the new client
+            df_swk_cwk = df_swk_cwk[df_swk_cwk[self.col_client_oid] == self.new_client_oid]
+            # Access the first row of each distributor ID (assume only one row is returned)
+            rows_swk_cwk = df_swk_cwk.drop_duplicates(subset=self.col_dist_id).set_index(self.col_dist_id)
+            for dist_id in dist_ids:
+                if dist_id in rows_swk_cwk.index:
+                    row_swk_cwk = rows_swk_cwk.loc[dist_id]
+                    # Initialize the current week code and end week code for each distributor ID
+                    self.swk_cwk[dist_id] = (
+                        row_swk_cwk[self.col_swk],
+                        row_swk_cwk[self.col_cwk],
+                    )
+                else:
+                    console.log(
+                        f"No week code found in '{self.tb_helpdesk_distributor}' for distributor '{dist_id}'."
+                    )
         except Exception as e:
             console.log(f"An error occurred in _init_week_code(): {e}")
             raise e
 
 
-    def init_client_info(self):
-        """Initialize all instance variables by prompting the user for input values."""
+    def init_client_info(self, prefetched: dict = None):
+        """Initialize all instance variables by prompting the user for input values.
+
+        Args:
+            prefetched (dict, optional): the rows of the new client read by AutoSQLBatch for all the clients at once,
+                keyed by 'client', 'project', 'transfer_info_oid', 'dist' and 'swk_cwk'. Defaults to None, which queries them.
+        """
         try:
+            prefetched = {} if prefetched is None else prefetched
             # Initialize the new client full name and oid
-            self._init_client_name()
+            self._init_client_name(prefetched.get("client"))
             # Initialize project_oid, industry_oid, and file_project_id
-            self._init_oid()
+            self._init_oid(prefetched.get("project"), prefetched.get("transfer_info_oid"))
             # Initialize the distributor ID for FXXXXX Co and McLane
-            self._init_dist_id()
+            self._init_dist_id(prefetched.get("dist"))
             # Initialize the start week code and end week code
-            self._init_week_code()
+            self._init_week_code(prefetched.get("swk_cwk"))
         except Exception as e:
             console.log(f"An error occurred in init_client_info(): {e}")
             raise e
@@ -348,6 +408,52 @@ class AutoSQL:
             console.log("All instance variables have been initialized successfully.")
 
 
+    def init_replacers(self):
+        """Compile the substitutions of the place holders with the client information, once per run."""
+        # Place holders of the SQL files starting with the lowercase place holder
+        self.sql_replacer = TokenReplacer({
+            self.place_holder.upper(): self.new_client_short_name.upper(),
+            self.place_holder.lower(): self.new_client_short_name.lower(),
+            "XXXXXX_VALUE": str(self.new_client_oid),
+            "SXXXXXE_VALUE": f"'{self.new_client_short_name.upper()}_XXX_XXX_PRD'",
+            "TRANSFER_INFO_OID_VALUE": str(self.transfer_info_oid),
+            "PXXXXXVALUE": str(self.project_oid),
+            "FXXXXXVALUE": str(self.file_project_id),
+        })
+        # Place holder of the objects creation scripts, in any case
+        self.objects_replacer = TokenReplacer({self.place_holder: self.new_client_short_name.upper()}, ignore_case=True)
+        # Place holders of the connection profiles
+        self.profile_replacer = TokenReplacer({
+            self.place_holder.lower(): self.new_client_short_name.lower(),
+            self.place_holder.upper(): self.new_client_short_name.upper(),
+        })
+        # Place holder of the user creation scripts
+        self.users_replacer = TokenReplacer({self.place_holder: self.new_client_short_name.upper()})
+
+
+    def read_template(self, path: str, replacer: TokenReplacer, prepare=None) -> str:
+        """Read an input file and replace its place holders, from its compiled template if the run is part of a batch.
+
+        Args:
+            path (str): path of the input file
+            replacer (TokenReplacer): the substitution of the place holders of the file
+            prepare (callable, optional): a function applied to the text before the place holders are replaced,
+                it must not depend on the client. Defaults to None.
+
+        Returns:
+            str: the updated content
+        """
+        if self.templates is None:
+            with open(path, "r") as file:
+                content = file.read()
+            if prepare is not None:
+                content = prepare(content)
+            return replacer.replace(content)
+        # The template is split once for all the clients of the batch, only the values of the slots change
+        template = self.templates.get(path, [token for token, _ in replacer.tokens], replacer.ignore_case, prepare)
+        return template.render(dict(replacer.tokens))
+
+
     def update_sql(self, filename: str) -> tuple[str, str]:
         """Reads an SQL file, replaces the client name, and writes it to the output directory.
 
@@ -358,21 +464,12 @@ class AutoSQL:
             tuple[str, str]: updated content and file name
         """
         try:
-            # Open and read the content of the SQL file
-            with open(os.path.join(self.input_directory, filename), "r") as file:
-                content = file.read()
+            # Read the content of the SQL file and replace client name and other values with the substitution compiled for this run
+            new_content = self.read_template(os.path.join(self.input_directory, filename), self.sql_replacer)
         except IOError as e:
             console.log(f"Error reading file {filename}: {e}")
             # Skip this file and continue with the next one
             return
-        # Replace client name and other values in file content
-        new_content = content.replace(self.place_holder.upper(), self.new_client_short_name.upper())
-        new_content = new_content.replace(self.place_holder.lower(), self.new_client_short_name.lower())
-        new_content = new_content.replace("XXXXXX_VALUE", str(self.new_client_oid))
-        new_content = new_content.replace("SXXXXXE_VALUE", f"'{self.new_client_short_name.upper()}_XXX_XXX_PRD'")
-        new_content = new_content.replace("TRANSFER_INFO_OID_VALUE", str(self.transfer_info_oid))
-        new_content = new_content.replace("PXXXXXVALUE", str(self.project_oid))
-        new_content = new_content.replace("FXXXXXVALUE", str(self.file_project_id))
         # Replace client name in file name
         new_filename = filename.replace(
             self.place_holder.lower(), self.new_client_short_name
@@ -380,20 +477,58 @@ class AutoSQL:
         return (new_content, new_filename)
 
 
-    def write_file(self, content: str, filename: str):
+    def stream_sql(self, filename: str) -> str:
+        """Replace the client name and other values of a large SQL file chunk by chunk and write it to the output directory.
+
+        The result is the same as update_sql() followed by write_file(), without the whole file in memory.
+
+        Args:
+            filename (str): name of SQL file to be read
+
+        Returns:
+            str: the updated file name
+        """
+        # Replace client name in file name
+        new_filename = filename.replace(
+            self.place_holder.lower(), self.new_client_short_name
+        )
+        self.sql_replacer.replace_file(
+            os.path.join(self.input_directory, filename), os.path.join(self.output_directory, new_filename), header=self._define_off_header(new_filename)
+        )
+        console.log(
+            f"Updated file written to {os.path.join(self.output_directory, new_filename)}"
+        )
+        return new_filename
+
+
+    def write_file(self, content: str, filename: str, header: str = ""):
         """Write the updated content to a new file in the output directory
 
         Args:
             content (str): file content
             filename (str): file name
+            header (str, optional): text written before the content. Defaults to "".
         """
         with open(os.path.join(self.output_directory, filename), "w") as file:
-            file.write(content)
+            file.write(header + content)
         console.log(
             f"Updated file written to {os.path.join(self.output_directory, filename)}"
         )
-        
-        
+
+
+    def _define_off_header(self, filename: str) -> str:
+        """Get the header of a file written to the output directory, 'set define off;' if the master script runs it.
+
+        Args:
+            filename (str): file name
+
+        Returns:
+            str: the text to write before the content of the file
+        """
+        # The create user files are not run by the master script
+        return "" if "create_user" in filename else self.define_off
+
+
     def separate_users(self, content: str) -> dict[str, str]:
         """Separate the SQL content into user groups and store them in a dictionary.
 
@@ -450,6 +585,8 @@ class AutoSQL:
             grant_file_path = os.path.join(self.output_directory, f"grant_tables_{user}.sql")
             # Open files for writing
             with open(user_file_path, 'w') as user_file, open(grant_file_path, 'w') as grant_file:
+                # The grant file is run by the master script
+                grant_file.write(self._define_off_header(os.path.basename(grant_file_path)))
                 for command in commands:
                     if "CREATE USER" in command:
                         insert = f"insert into dba_util.msa_sec_app_db_schema(db_schema, access_approver_email, db_schema_type, created, creator) values ('{user}', 'NONE','PROD', SYSDATE , 'PBHARGAVA');"
@@ -483,6 +620,8 @@ class AutoSQL:
         try:
             # Initialize the master script content
             script = ""
+            # The master script is written again, so only the files of these users are kept
+            self.master_files = []
             # Iterate through each user and add the file to master script
             for user in users:
                 user_file = f"create_user_{user}.sql"
@@ -495,10 +634,12 @@ class AutoSQL:
 
                 if os.path.exists(user_path):
                     script += f'@@"{user_file}"\n'
+                    self.master_files.append(user_file)
                 else:
                     console.log(f"Skipped file '{user_path}' since it does not exist.")
                 if os.path.exists(grant_path):
                     script += f'@@"{grant_file}"\n'
+                    self.master_files.append(grant_file)
                 else:
                     console.log(f"Skipped file '{grant_path}' since it does not exist.")
             # Write the master script to a file
@@ -520,13 +661,8 @@ class AutoSQL:
             master_script (str): name of the master script file
         """
         try:
-            # Open and read the content of the SQL file
-            with open(os.path.join(self.input_directory, filename), "r") as file:
-                content = file.read().strip()
-            # Replace the client name place holder with the actual client name in file content
-            new_content = content.replace(
-                self.place_holder, self.new_client_short_name.upper()
-            )
+            # Read the content of the SQL file and replace the client name place holder with the actual client name
+            new_content = self.read_template(os.path.join(self.input_directory, filename), self.users_replacer, str.strip)
             # Create a dictionary to store users and their scripts
             users = self.separate_users(new_content)
             # Create separate SQL files for each user with their respective commands
@@ -573,6 +709,20 @@ class AutoSQL:
         )
         
             
+    @staticmethod
+    def remove_drop_statements(content: str) -> str:
+        """Remove all the 'DROP INDEX' and 'DROP TABLE' statements of the objects creation scripts.
+
+        Args:
+            content (str): SQL file content
+
+        Returns:
+            str: the content without the DROP statements
+        """
+        pattern1 = re.compile(r'DROP\s+\S+.*?;', re.IGNORECASE | re.DOTALL)
+        return re.sub(pattern1, '', content.strip())
+
+
     def update_sql_objects(self, filename: str, new_filename: str):
         """Update the objects creation scripts for two users (XXX_XXX_PRD, XXX_XXX_TST).
 
@@ -583,14 +733,8 @@ class AutoSQL:
             e: _description_
         """
         try:
-            # Open and read the content of the SQL file
-            with open(os.path.join(self.input_directory, filename), "r") as file:
-                content = file.read().strip()
-            # Remove all the 'DROP INDEX' and 'DROP TABLE' statements
-            pattern1 = re.compile(r'DROP\s+\S+.*?;', re.IGNORECASE | re.DOTALL)
-            content1 = re.sub(pattern1, '', content)
-            # Replace old client name with new client name
-            new_content = re.sub(self.place_holder, self.new_client_short_name.upper(), content1, flags=re.IGNORECASE)
+            # Read the content of the SQL file without the 'DROP' statements and replace old client name with new client name
+            new_content = self.read_template(os.path.join(self.input_directory, filename), self.objects_replacer, AutoSQL.remove_drop_statements)
             # Process index creation scripts specifically
             if 'Indexes' in filename or 'Tables' in filename:
                 if 'Indexes' in filename:
@@ -605,9 +749,9 @@ class AutoSQL:
                 # Convert the list of strings to a single string separated by newlines
                 new_content_str = ';\n\n'.join(new_content) + ';' if new_content else ''                
                 # Write the new content to the file
-                self.write_file(new_content_str, new_filename)
+                self.write_file(new_content_str, new_filename, self._define_off_header(new_filename))
             else:
-                self.write_file(new_content, new_filename)
+                self.write_file(new_content, new_filename, self._define_off_header(new_filename))
         except Exception as e:
             console.log(f"Error reading file {filename}: {e}")
             raise e
@@ -615,46 +759,6 @@ class AutoSQL:
             console.log(f"Objects creation scripts '{filename}' has been updated successfully.")
 
 
-    def add_master_script(self, list_sql_files: list[str], filename: str):
-        """Add the list of sql object creation files to the master_script.
-
-        Args:
-            list_sql_files (list[str]): a list of sql object creation files
-            filename (str): name of the master script file
-        """
-        try:
-            # Open and read the content of the SQL file
-            with open(os.path.join(self.output_directory, filename), "a") as file:
-                for sql_file in list_sql_files:
-                    file.write(f'@@"{sql_file}"\n')
-        except Exception as e:
-            console.log(f"Error reading file {filename}: {e}")
-            raise e
-        else:
-            console.log(f"Objects creation scripts have been added to '{filename}' successfully.")
-            
-
-    def extract_file_list(self, master_script_path: str) -> list:
-        """Extract the list of included files from the master script.
-
-        Args:
-            master_script_path (str): path to the master script file
-
-        Returns:
-           list: a list of included file paths
-        """
-        with open(master_script_path, 'r', encoding='utf-8') as file:
-            content = file.read()
-        # Regular expression to find all included file paths
-        pattern = re.compile(r'@@(".*?"|\S+)')
-        file_paths = pattern.findall(content)
-        # Cleaning file paths by removing any possible quote marks
-        file_paths = [path.strip('"') for path in file_paths]
-        # Remove create users files from the list
-        file_paths = [path for path in file_paths if "create_user" not in path]
-        return file_paths
-
-
     def sort_files(self, file_list: list) -> tuple:
         """Sort the list of SQL files based on a custom sort key.
         The user with 'PRD' type will have higher priority than 'TST' type.
@@ -698,19 +802,13 @@ class AutoSQL:
 
     def adjust_order_master_script(self, file_list: list, master_script: str):
         """Adjust the execution order in the master_script based on the file_list.
-        
+        The files already start with 'set define off;', which write_file() adds when they are written.
+
         Args:
             file_list (list): a list of file names
             filename (str): name of the master script file
         """
         sorted_files = self.sort_files(file_list)
-        for f in sorted_files:
-            # Add set define off to the beginning of the file
-            with open(os.path.join(self.output_directory, f), 'r') as file:
-                data = file.read()
-            data = "set define off;\n" + data
-            with open(os.path.join(self.output_directory, f), 'w') as file:
-                file.write(data)
         content = f"""-- {master_script}\n-- This script calls all other SQL scripts\nset define off\n"""
         # Generate script content with ordered @@ include commands
         for filename in sorted_files:
@@ -719,11 +817,107 @@ class AutoSQL:
         self.write_file(content, master_script)
             
 
+    def _database_worker(self, database: str) -> "AutoSQL":
+        """Get a copy of this instance with the input and output directories of a database, so that the files of
+        several databases can be updated at the same time.
+
+        Args:
+            database (str): name of the database directory
+
+        Returns:
+            AutoSQL: the copy, with its own password list and user list
+        """
+        worker = copy.copy(self)
+        worker.database = database
+        worker.input_directory = os.path.join(self.input_directory_base, database)
+        worker.output_directory = os.path.join(self.output_directory_base, database)
+        worker.password_list = {}
+        worker.user_lists = []
+        worker.master_files = []
+        return worker
+
+
+    def _update_sql_file(self, filename: str, master_script_file: str) -> str:
+        """Update one file of the input directory of a database and write it to the output directory.
+
+        Args:
+            filename (str): name of the file in the input directory
+            master_script_file (str): name of the master script file of the database
+
+        Returns:
+            str: the new file name to add to the master script, None if it is not added
+        """
+        # Choose all the sql files
+        if filename.endswith(".sql"):
+            if filename.startswith(self.place_holder.lower()):
+                # Skip file if not related to the server
+                if "TST" in filename or "PRD" in filename or "STG" in filename:
+                    if self.server not in filename:
+                        return None
+                if os.path.getsize(os.path.join(self.input_directory, filename)) >= self.stream_min_bytes:
+                    # Update the large SQL file chunk by chunk
+                    new_filename = self.stream_sql(filename)
+                else:
+                    # Get the new SQL content and filename
+                    new_content, new_filename = self.update_sql(filename)
+                    # Write the updated content to a new file in the output directory
+                    self.write_file(new_content, new_filename, self._define_off_header(new_filename))
+                # Add the new filename to the list of sql object creation files
+                return new_filename
+            elif filename.startswith("create_users"):
+                # Update the SQL queries that are used to create users
+                self.update_create_users(filename, master_script_file)
+            elif filename.startswith(self.place_holder):
+                # Get the new filename by replacing the place holder with new client short name
+                new_filename = filename.replace(self.place_holder, self.new_client_short_name.upper())
+                # Update the objects creation sql files for two users (XXX_XXX_PRD, XXX_XXX_TST)
+                self.update_sql_objects(filename, new_filename)
+                # Get a complete list of sql object creation files
+                return new_filename
+        else:
+            console.log(f"Skipped '{filename}' when update_sql_files().")
+        return None
+
+
+    def _create_master_script_files(self, list_sql_files: list[str], master_script_file: str):
+        """Add the sql object creation files of a database to its master script and adjust their execution order.
+
+        The files of the master script are kept in memory as they are written, so the master script is not read back.
+
+        Args:
+            list_sql_files (list[str]): a list of sql object creation files
+            master_script_file (str): name of the master script file of the database
+        """
+        # Get the list of included files of the master script without the create user files
+        list_files = [path for path in self.master_files + list_sql_files if "create_user" not in path]
+        # Adjust the execution order in the master script
+        self.adjust_order_master_script(list_files, master_script_file)
+
+
+    def _run_tasks(self, tasks: list) -> list:
+        """Run the tasks in a pool of threads, or one after another if there is only one worker.
+
+        Args:
+            tasks (list): a list of (function, arguments) tuples
+
+        Returns:
+            list: the result of each task, in the order of tasks
+        """
+        if self.workers <= 1 or len(tasks) <= 1:
+            return [function(*args) for function, args in tasks]
+        with ThreadPoolExecutor(max_workers=self.workers) as executor:
+            futures = [executor.submit(function, *args) for function, args in tasks]
+            # Get the results in order, which raises the error of the first failed task
+            return [future.result() for future in futures]
+
+
     def update_sql_files(self):
         try:
             """Update all the SQL files in the input directory and write them to the output directory."""
             # Update SQL for each database in input directory
             databases = [d for d in os.listdir(self.input_directory) if os.path.isdir(os.path.join(self.input_directory, d))]
+            # Initialize a list of (worker, master script file, file names) for each database to update
+            jobs = []
             for database in databases:
                 # Clear the output directory for the current database
                 if os.path.exists(os.path.join(self.output_directory_base, database)):
@@ -743,40 +937,19 @@ class AutoSQL:
                 [os.remove(os.path.join(self.output_directory, f)) for f in os.listdir(self.output_directory) if os.path.isfile(os.path.join(self.output_directory, f))]
                 # Set the master script file for the current database
                 master_script_file = f"master_script_{self.database}.sql"
-                # Initialize an empty list
-                list_sql_files = []
-                for filename in os.listdir(os.path.join(self.input_directory)):
-                    # Choose all the sql files
-                    if filename.endswith(".sql"):
-                        if filename.startswith(self.place_holder.lower()):
-                            # Skip file if not related to the server
-                            if "TST" in filename or "PRD" in filename or "STG" in filename:
-                                if self.server not in filename:
-                                    continue
-                            # Get the new SQL content and filename
-                            new_content, new_filename = self.update_sql(filename)
-                            # Write the updated content to a new file in the output directory
-                            self.write_file(new_content, new_filename)
-                            # Add the new filename to the list of sql object creation files
-                            list_sql_files.append(new_filename)
-                        elif filename.startswith("create_users"):
-                            # Update the SQL queries that are used to create users
-                            self.update_create_users(filename, master_script_file)
-                        elif filename.startswith(self.place_holder):
-                            # Get the new filename by replacing the place holder with new client short name
-                            new_filename = filename.replace(self.place_holder, self.new_client_short_name.upper())
-                            # Update the objects creation sql files for two users (XXX_XXX_PRD, XXX_XXX_TST)
-                            self.update_sql_objects(filename, new_filename)
-                            # Get a complete list of sql object creation files
-                            list_sql_files.append(new_filename)
-                    else:
-                        console.log(f"Skipped '{filename}' when update_sql_files().")
-                # Add the list of sql object creation files to the master_script
-                self.add_master_script(list_sql_files, master_script_file)
-                # Extract the list of included files from the master script
-                list_files = self.extract_file_list(os.path.join(self.output_directory, master_script_file))
-                # Adjust the execution order in the master script
-                self.adjust_order_master_script(list_files, master_script_file)
+                jobs.append((self._database_worker(database), master_script_file, os.listdir(self.input_directory)))
+            # Update the files of all the databases, at the same time if there are several workers
+            tasks = [(worker._update_sql_file, (filename, master_script_file)) for worker, master_script_file, filenames in jobs for filename in filenames]
+            results = iter(self._run_tasks(tasks))
+            tasks = []
+            for worker, master_script_file, filenames in jobs:
+                # Get the list of sql object creation files in the order of the input directory
+                list_sql_files = [new_filename for new_filename in [next(results) for _ in filenames] if new_filename is not None]
+                tasks.append((worker._create_master_script_files, (list_sql_files, master_script_file)))
+                # Keep the passwords of the users created for the database
+                self.password_list.update(worker.password_list)
+            # Create the master script of all the databases, at the same time if there are several workers
+            self._run_tasks(tasks)
         except Exception as e:
             console.log(f"An error occurred in update_sql_files(): {e}")
             raise e
@@ -903,12 +1076,10 @@ class AutoSQL:
                 connection_profile_def_file = connection_profile_file.replace(self.place_holder.upper(), self.new_client_short_name.upper())
                 os.rename(connection_profile_file, connection_profile_def_file,)
 
-                with open(connection_profile_def_file, "r") as f:
-                    connection_profile_data = f.read()
-
-                # Update connection profile data with new client short name
-                connection_profile_data = connection_profile_data.replace(self.place_holder.lower(), self.new_client_short_name.lower())
-                connection_profile_data = connection_profile_data.replace(self.place_holder.upper(), self.new_client_short_name.upper())
+                # Update connection profile data with new client short name, read from the input file the profile was copied from
+                connection_profile_data = self.read_template(
+                    os.path.join(self.connection_profile_input_directory, os.path.basename(connection_profile_file)), self.profile_replacer
+                )
 
                 # Save the updated connection profile data to the output directory
                 with open(connection_profile_def_file, "w") as f:
@@ -952,12 +1123,20 @@ class AutoSQL:
             self.init_control_variables()
             # Initialize client information based on table xref_client
             self.init_client_info()
-            # Update all SQL files in the input directory and save them to the output directory
-            self.update_sql_files()
-            # Update the connection profiles
-            self.update_connection_profiles()
-            # Export the password list to an Excel file
-            self.export_password_list()
+            # Compile the substitutions of the place holders with the client information
+            self.init_replacers()
+            # Write the output files of the new client
+            self.write_output_files()
         except Exception as e:
             console.log(f"An error occurred in run(): {e}\n{traceback.format_exc()}")
-            raise e
\ No newline at end of file
+            raise e
+
+
+    def write_output_files(self):
+        """Write the SQL files, the connection profiles and the password list of the new client to the output directory."""
+        # Update all SQL files in the input directory and save them to the output directory
+        self.update_sql_files()
+        # Update the connection profiles
+        self.update_connection_profiles()
+        # Export the password list to an Excel file
+        self.export_password_list()
\ No newline at end of file
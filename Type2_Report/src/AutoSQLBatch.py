@@ -0,0 +1,194 @@
+import time
+import traceback
+from concurrent.futures import ThreadPoolExecutor
+import pandas as pd
+import pdr.handlers.Console_Handler as console
+import NewSubsystem_Config as config
+from src.AutoSQL import AutoSQL
+from src.TemplateCache import TemplateCache
+
+# Description: This class is used to create the new subsystems of several clients in one run, reading the input files and the client information once for all of them.
+
+
+class AutoSQLBatch:
+    def __init__(self, connection_GXXXXXP, connection_DXXXXXP, control_rows: list[list]):
+        # Initialize the connection to two Oracle database: GXXXXXP and DXXXXXP
+        self.connection_GXXXXXP = connection_GXXXXXP
+        self.connection_DXXXXXP = connection_DXXXXXP
+        # Initialize the control variables of each client, in the order of NewSubsystem_Config.all_variables
+        self.control_rows = control_rows
+        # Initialize one AutoSQL job per client
+        self.jobs = []
+        # Initialize the compiled templates of the input files, shared by all the jobs
+        self.templates = TemplateCache()
+        # Initialize the number of threads, shared by the clients written at the same time
+        self.workers = config.sql_workers
+        self.col_client_short_name = "CLIENT_SHORT_NAME"
+        self.col_project_short_name = "PROJECT_SHORT_NAME"
+
+
+    @staticmethod
+    def read_control_rows(path: str) -> list[list]:
+        """Read the control variables of each client from an Excel or CSV file.
+
+        The file has a header row and one row per client, with the columns in the order of
+        NewSubsystem_Config.all_variables: client short name, data warehouse, FXXXXX (Y/N), MXXXXX (Y/N),
+        input directory and output directory.
+
+        Args:
+            path (str): path of the Excel or CSV file
+
+        Returns:
+            list[list]: the control variables of each client
+        """
+        # Keep the values as text, e.g. the data warehouse 1 is read as '1'
+        if path.lower().endswith((".xlsx", ".xls")):
+            df = pd.read_excel(path, dtype=str)
+        else:
+            df = pd.read_csv(path, dtype=str)
+        return df.dropna(how="all").values.tolist()
+
+
+    def init_jobs(self):
+        """Initialize one AutoSQL job per control row, all sharing the compiled templates."""
+        try:
+            for row in self.control_rows:
+                job = AutoSQL(self.connection_GXXXXXP, self.connection_DXXXXXP)
+                job.init_control_variables(row)
+                job.templates = self.templates
+                self.jobs.append(job)
+            # Each client is written to its own output directory
+            short_names = [job.new_client_short_name.upper() for job in self.jobs]
+            duplicates = sorted({name for name in short_names if short_names.count(name) > 1})
+            if duplicates:
+                raise ValueError(f"Clients found more than once in the batch: {', '.join(duplicates)}")
+        except Exception as e:
+            console.log(f"An error occurred in init_jobs(): {e}")
+            raise e
+        else:
+            console.log(f"Successfully read the control variables of {len(self.jobs)} clients: {', '.join(short_names)}")
+
+
+    def _get_xref_clients(self, short_names: list[str]) -> pd.DataFrame:
+        try:
+            frames = []
+            # Initialize one bind variable per client short name, in chunks of at most max_in_list names
+            for binds in self.jobs[0].bind_chunks("client_short_name", short_names):
+                # Initialize the SELECT query to get the information of all the new clients
+                query = f"""SELECT * FROM {self.jobs[0].tb_xref_client}
+                WHERE client_short_name IN ({", ".join(f":{bind}" for bind in binds)})
+                """
+                # Execute the query and keep the results as a DataFrame
+                frames.append(pd.read_sql_query(query, self.connection_GXXXXXP, params=binds))
+            return pd.concat(frames, ignore_index=True)
+        except Exception as e:
+            console.log(f"An error occurred in get_xref_clients(): {e}")
+            raise e
+
+
+    def _get_projects(self, short_names: list[str]) -> pd.DataFrame:
+        try:
+            frames = []
+            # Initialize one bind variable per project short name, in chunks of at most max_in_list names
+            for binds in self.jobs[0].bind_chunks("project_short_name", short_names):
+                # Initialize the SELECT query to get the project information of all the new clients
+                query = f"""SELECT * FROM {self.jobs[0].tb_project}
+                WHERE project_short_name IN ({", ".join(f":{bind}" for bind in binds)})
+                """
+                # Execute the query and keep the results as a DataFrame
+                frames.append(pd.read_sql_query(query, self.connection_DXXXXXP, params=binds))
+            return pd.concat(frames, ignore_index=True)
+        except Exception as e:
+            console.log(f"An error occurred in get_projects(): {e}")
+            raise e
+
+
+    def init_client_info(self):
+        """Read the information of all the clients with one query per table and initialize each job with its rows."""
+        try:
+            first = self.jobs[0]
+            short_names = [job.new_client_short_name.upper() for job in self.jobs]
+            # Get the client and project data of all the clients
+            df_clients = self._get_xref_clients(short_names)
+            df_projects = self._get_projects(short_names)
+            AutoSQL.check_missing_cols(df_clients, [self.col_client_short_name, first.col_client_oid])
+            AutoSQL.check_missing_cols(df_projects, [self.col_project_short_name])
+            # The transfer info OIDs follow each other, so that the INSERT scripts of the clients can all be run
+            transfer_info_oid = first._get_transfer_info_oid()
+            # Get the distributor ID of the distributors enrolled for any of the clients, they are the same for all the clients
+            dist_names = []
+            if any(job.farner.upper() == "Y" for job in self.jobs):
+                dist_names.append(first.farner_dist_name)
+            if any(job.mclane.upper() == "Y" for job in self.jobs):
+                dist_names.append(first.mclane_dist_name)
+            df_dist = first._get_dist_id(dist_names) if dist_names else None
+            # Get the week codes of all the clients and distributor IDs
+            dist_ids = [] if df_dist is None else df_dist[first.col_dist_id].drop_duplicates().tolist()
+            client_oids = df_clients[first.col_client_oid].drop_duplicates().tolist()
+            df_swk_cwk = first._get_swk_cwk(dist_ids, client_oids) if dist_ids and client_oids else None
+            for i, job in enumerate(self.jobs):
+                short_name = job.new_client_short_name.upper()
+                prefetched = {
+                    "client": df_clients[df_clients[self.col_client_short_name] == short_name].reset_index(drop=True),
+                    "project": df_projects[df_projects[self.col_project_short_name] == short_name].reset_index(drop=True),
+                    "transfer_info_oid": transfer_info_oid + i,
+                    "dist": df_dist,
+                    "swk_cwk": df_swk_cwk,
+                }
+                job.init_client_info(prefetched)
+                # Compile the substitutions of the place holders with the client information
+                job.init_replacers()
+        except Exception as e:
+            console.log(f"An error occurred in AutoSQLBatch.init_client_info(): {e}")
+            raise e
+
+
+    def write_output_files(self):
+        """Write the output files of all the clients, several clients at the same time if there are several workers."""
+        # The threads are shared between the clients written at the same time and the files of each client
+        clients = max(1, min(self.workers, len(self.jobs)))
+        for job in self.jobs:
+            job.workers = max(1, self.workers // clients)
+        if clients == 1:
+            for job in self.jobs:
+                job.write_output_files()
+            return
+        with ThreadPoolExecutor(max_workers=clients) as executor:
+            futures = [executor.submit(job.write_output_files) for job in self.jobs]
+            # Get the results in order, which raises the error of the first failed client
+            for future in futures:
+                future.result()
+
+
+    def get_password_lists(self) -> dict:
+        """
+        Get the password list of each client, keyed by client short name.
+        """
+        return {job.new_client_short_name.upper(): job.get_password_list() for job in self.jobs}
+
+
+    def get_deploy_inputs(self) -> list[tuple[list, dict]]:
+        """
+        Get the control variables and the password list of each client, in the order of the control rows.
+        """
+        return [(job.all_variables, job.get_password_list()) for job in self.jobs]
+
+
+    def run(self):
+        """Run the AutoSQL program for all the clients of the batch.
+
+        Raises:
+            e: An error occurred while running the program
+        """
+        try:
+            start = time.perf_counter()
+            # Initialize one job per client
+            self.init_jobs()
+            # Initialize the client information of all the jobs
+            self.init_client_info()
+            # Write the output files of all the clients from the compiled templates
+            self.write_output_files()
+            console.log(f"Successfully created the SQL files of {len(self.jobs)} clients in {time.perf_counter() - start:.2f}s.")
+        except Exception as e:
+            console.log(f"An error occurred in AutoSQLBatch.run(): {e}\n{traceback.format_exc()}")
+            raise e
@@ -0,0 +1,51 @@
+import re
+
+# Description: This class is used to hold an input file split once into literal segments and place holder slots, so that it can be rendered for several clients.
+
+
+class CompiledTemplate:
+    def __init__(self, text: str, tokens: list[str], ignore_case: bool = False):
+        """Split the text into literal segments and place holder slots.
+
+        The text is split by each place holder in turn, the same order as chained str.replace() calls, and
+        a place holder is never looked for in the slot of a previous one.
+
+        Args:
+            text (str): the text of the input file
+            tokens (list[str]): the place holders, in the order they are replaced
+            ignore_case (bool, optional): True to also find the place holders in any case. Defaults to False.
+        """
+        # Initialize the place holders and the switch to find them in any case
+        self.tokens = list(tokens)
+        self.ignore_case = ignore_case
+        # Parts alternate literal segments (str) and slots (a tuple of the place holder), starting and ending with a literal
+        parts = [text]
+        for token in self.tokens:
+            split = re.compile(re.escape(token), re.IGNORECASE if ignore_case else 0).split
+            new_parts = []
+            for part in parts:
+                if isinstance(part, tuple):
+                    new_parts.append(part)
+                    continue
+                for i, piece in enumerate(split(part)):
+                    if i:
+                        new_parts.append((token,))
+                    new_parts.append(piece)
+            parts = new_parts
+        # Initialize the literal segments and the place holder of each slot between them
+        self.literals = parts[0::2]
+        self.slots = [part[0] for part in parts[1::2]]
+
+    def render(self, values: dict[str, str]) -> str:
+        """Join the literal segments with the value of each slot.
+
+        Args:
+            values (dict[str, str]): the value of each place holder
+
+        Returns:
+            str: the rendered text
+        """
+        parts = [None] * (len(self.literals) + len(self.slots))
+        parts[0::2] = self.literals
+        parts[1::2] = [values[token] for token in self.slots]
+        return "".join(parts)
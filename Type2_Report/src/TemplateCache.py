@@ -0,0 +1,36 @@
+import threading
+from src.CompiledTemplate import CompiledTemplate
+
+# Description: This class is used to share the compiled templates of the input files between the clients of a batch, so that each input file is read and split only once.
+
+
+class TemplateCache:
+    def __init__(self):
+        # Initialize the compiled templates keyed by input file, place holders and case switch
+        self.templates = {}
+        # Initialize the lock of the dictionary, each template has its own lock so that different files are compiled at the same time
+        self.lock = threading.Lock()
+
+    def get(self, path: str, tokens: list[str], ignore_case: bool = False, prepare=None) -> CompiledTemplate:
+        """Get the compiled template of an input file, compiling it the first time it is asked for.
+
+        Args:
+            path (str): path of the input file
+            tokens (list[str]): the place holders, in the order they are replaced
+            ignore_case (bool, optional): True to also find the place holders in any case. Defaults to False.
+            prepare (callable, optional): a function applied to the text before it is compiled, it must not depend on the client. Defaults to None.
+
+        Returns:
+            CompiledTemplate: the compiled template
+        """
+        key = (path, tuple(tokens), ignore_case)
+        with self.lock:
+            entry = self.templates.setdefault(key, {"lock": threading.Lock(), "template": None})
+        with entry["lock"]:
+            if entry["template"] is None:
+                with open(path, "r") as file:
+                    text = file.read()
+                if prepare is not None:
+                    text = prepare(text)
+                entry["template"] = CompiledTemplate(text, tokens, ignore_case)
+        return entry["template"]
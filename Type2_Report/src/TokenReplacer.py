@@ -0,0 +1,107 @@
+import re
+
+# Description: This class is used to replace the place holders of SQL and JSON files with the client information, compiled once per run.
+
+
+class TokenReplacer:
+    def __init__(self, tokens: dict[str, str], ignore_case: bool = False):
+        """Compile the replacement of the place holders.
+
+        The place holders are replaced in the order of tokens, the same as chained str.replace() calls.
+        Each str.replace() scans the text in C, which is faster than a single regular expression pass
+        that calls back into Python for each match. A regular expression is only compiled when the place
+        holders are also replaced in any case.
+
+        Args:
+            tokens (dict[str, str]): the value of each place holder, in the order they are replaced
+            ignore_case (bool, optional): True to also replace the place holders in any case. Defaults to False.
+        """
+        # Initialize the place holders and their values, the empty place holders are skipped
+        self.ignore_case = ignore_case
+        self.tokens = [(token, str(value)) for token, value in tokens.items() if token]
+        # Initialize the longest place holder, the end of a chunk that may hold the start of a place holder when streaming
+        self.max_length = max((len(token) for token, _ in self.tokens), default=0)
+        # Initialize the case insensitive pattern and the value of each lower case place holder, only used in any case
+        self.values = None
+        self.pattern = None
+        if ignore_case and self.tokens:
+            self.values = {token.lower(): value for token, value in self.tokens}
+            # Longest place holders first so that a place holder is never cut short by one of its prefixes
+            alternation = "|".join(re.escape(token) for token, _ in sorted(self.tokens, key=lambda item: len(item[0]), reverse=True))
+            self.pattern = re.compile(alternation, re.IGNORECASE)
+
+    def replace(self, text: str) -> str:
+        """Replace all the place holders in the text.
+
+        Args:
+            text (str): the text to update
+
+        Returns:
+            str: the updated text
+        """
+        if self.ignore_case:
+            if self.pattern is None:
+                return text
+            return self.pattern.sub(lambda match: self.values[match.group(0).lower()], text)
+        for token, value in self.tokens:
+            text = text.replace(token, value)
+        return text
+
+    def _safe_cut(self, buffer: str, cut: int) -> int:
+        """Move the cut of a buffer back to the start of any place holder it would cut.
+
+        Args:
+            buffer (str): the text read so far
+            cut (int): the position the buffer would be cut at
+
+        Returns:
+            int: a position where no place holder starts before and ends after
+        """
+        moved = True
+        while moved and cut > 0:
+            moved = False
+            for token, _ in self.tokens:
+                # Only a place holder starting less than its length before the cut can end after it
+                low = max(0, cut - len(token) + 1)
+                window = buffer[low:cut + len(token) - 1]
+                start = (window.lower() if self.ignore_case else window).find(token.lower() if self.ignore_case else token)
+                if start != -1 and low + start < cut:
+                    cut = low + start
+                    moved = True
+        return cut
+
+    def replace_stream(self, reader, writer, chunk_size: int = 1024 * 1024):
+        """Replace all the place holders of a text stream chunk by chunk, so that the whole text is never in memory.
+
+        The text is only cut between place holders, which gives the same result as replace() unless a
+        value makes up a place holder with the text around it.
+
+        Args:
+            reader: a text file object to read from
+            writer: a text file object to write to
+            chunk_size (int, optional): the number of characters read at a time. Defaults to 1 MB.
+        """
+        tail = ""
+        while True:
+            chunk = reader.read(chunk_size)
+            if not chunk:
+                writer.write(self.replace(tail))
+                return
+            buffer = tail + chunk
+            # The last characters may hold the start of a place holder that ends in the next chunk
+            cut = self._safe_cut(buffer, max(len(buffer) - self.max_length + 1, 0))
+            writer.write(self.replace(buffer[:cut]))
+            tail = buffer[cut:]
+
+    def replace_file(self, input_file: str, output_file: str, chunk_size: int = 1024 * 1024, header: str = ""):
+        """Replace all the place holders of a file and write the result to another file, chunk by chunk.
+
+        Args:
+            input_file (str): path of the file to read
+            output_file (str): path of the file to write
+            chunk_size (int, optional): the number of characters read at a time. Defaults to 1 MB.
+            header (str, optional): text written before the updated content. Defaults to "".
+        """
+        with open(input_file, "r") as reader, open(output_file, "w") as writer:
+            writer.write(header)
+            self.replace_stream(reader, writer, chunk_size)
@@ -0,0 +1,140 @@
+import os
+import sys
+import types
+import random
+import sqlite3
+import pytest
+
+# Import the src package from the Type2_Report folder, as NewSubsystem_DBA_Main.py does
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+
+def _module(name: str, **attrs):
+    """Register a stand-in module, and its parent packages if they are missing."""
+    parent, _, child = name.rpartition(".")
+    if parent and parent not in sys.modules:
+        _module(parent)
+    mod = types.ModuleType(name)
+    mod.__path__ = []
+    mod.__dict__.update(attrs)
+    sys.modules[name] = mod
+    if parent:
+        setattr(sys.modules[parent], child, mod)
+    return mod
+
+
+class _ReversingCipher:
+    # Stand-in for the cipher of src.config.API, reversible so that the password lists can be compared
+    def encrypt(self, data: bytes) -> bytes:
+        return data[::-1]
+
+
+# The pdr library, the API keys and the config of the production server are not available to the tests
+try:
+    import pdr.handlers.Console_Handler  # noqa: F401
+except ImportError:
+    _module("pdr.handlers.Console_Handler", log=lambda message: None, set_log=lambda path: None)
+import src  # noqa: E402
+_module("src.config.API", cipher=_ReversingCipher())
+CONFIG = _module("NewSubsystem_Config", server="PRD", all_variables=[], sql_workers=1)
+
+from src.AutoSQL import AutoSQL  # noqa: E402
+
+# The passwords are random in production, the tests need the same output on every run
+AutoSQL.generate_db_password = lambda self: "Password1"
+
+CLIENTS = ["abc", "defg", "hij"]
+DATABASES = ["DXXXXX", "GXXXXX", "GCYM1", "GCYM2"]
+STATEMENTS = [
+    "INSERT INTO XXX_XXX_PRD.XXXXX_subsystem (XXXXXX, SCHEMA_NAME) VALUES (XXXXXX_VALUE, SXXXXXE_VALUE);\n",
+    "INSERT INTO xyz.transfer_info VALUES (TRANSFER_INFO_OID_VALUE, PXXXXXVALUE, FXXXXXVALUE);\n",
+    "DROP TABLE XYZ_XXX_XXX_PRD.t{i};\n",
+    "CREATE TABLE XYZ_XXX_XXX_PRD.xyz_t{i} (ID NUMBER) PCTUSED 40;\n",
+    "CREATE UNIQUE INDEX XYZ_XXX_XXX_PRD.i{i} ON XYZ_XXX_XXX_PRD.t{i} (ID) LOGGING TABLESPACE XYZ_IDX PCTFREE 10;\n",
+    "-- comment {i} for Xyz and xYz\n",
+]
+
+
+def write_corpus(root: str, files: int = 2, statements: int = 16, seed: int = 0) -> str:
+    """Write a synthetic input directory with the layout of the production one and return it.
+
+    Each database has plain SQL files, the objects creation scripts of both users, a create users script
+    and a file that is not SQL. The connection profiles have one file per data warehouse.
+    """
+    rng = random.Random(seed)
+
+    def body(count: int) -> str:
+        return "".join(rng.choice(STATEMENTS).format(i=i) for i in range(count))
+
+    for database in DATABASES:
+        folder = os.path.join(root, "SQL", database)
+        os.makedirs(folder)
+        for i in range(files):
+            for name in [f"xyz_file{i}.sql", f"xyz_file{i}_PRD.sql", f"xyz_file{i}_TST.sql"]:
+                with open(os.path.join(folder, name), "w") as file:
+                    file.write(body(statements))
+        for kind in ["Tables", "Indexes", "Views", "Packages"]:
+            for env in ["PRD", "TST"]:
+                with open(os.path.join(folder, f"XYZ-SUB-ODS-{env}-{kind}.sql"), "w") as file:
+                    file.write(body(statements))
+        with open(os.path.join(folder, "notes.txt"), "w") as file:
+            file.write("not a SQL file")
+        users = ["XYZ_XXX_XXX_TST", "XYZ_XXX_XXX_PRD", "XYZ_RO"]
+        with open(os.path.join(folder, "create_users.sql"), "w") as file:
+            file.write("".join(
+                f'CREATE USER "{user}" IDENTIFIED BY "*******"\nGRANT SELECT ON "XYZ_XXX_XXX_PRD"."T1" TO "{user}"\nGRANT CONNECT TO "{user}";\n'
+                for user in users
+            ))
+    profiles = os.path.join(root, "SQL", "CONNECTION_PROFILES")
+    os.makedirs(profiles)
+    for i in (1, 2):
+        with open(os.path.join(profiles, f"XYZ_DW{i}.json"), "w") as file:
+            file.write('{"name": "xyz_dw%d", "user": "XYZ_XXX"}' % i)
+    return root
+
+
+def client_database() -> sqlite3.Connection:
+    """Create an in-memory database with the tables AutoSQL queries, holding the clients of CLIENTS."""
+    connection = sqlite3.connect(":memory:", check_same_thread=False)
+    for schema in ["XXXXX_PRD", "MXXXXX_PROD"]:
+        connection.execute(f"ATTACH ':memory:' AS {schema}")
+    connection.execute("CREATE TABLE XXXXX_PRD.xref_client (CLIENT_SHORT_NAME TEXT, CLIENT_NAME TEXT, XXXXXX INT)")
+    connection.execute("CREATE TABLE MXXXXX_PROD.project (PROJECT_SHORT_NAME TEXT, PROJECT_OID INT, INDUSTRY_OID INT, FILE_PROJECT_ID INT)")
+    connection.execute("CREATE TABLE MXXXXX_PROD.transfer_info (TRANSFER_INFO_OID INT)")
+    connection.execute("CREATE TABLE XXXXX_PRD.xref_distributor (DIST_ID INT, DIST_NAME TEXT)")
+    connection.execute("CREATE TABLE XXXXX_PRD.helpdesk_distributor (XXXXXX INT, DIST_ID INT, START_PERIOD_CODE INT, END_PERIOD_CODE INT)")
+    for i, name in enumerate(CLIENTS):
+        connection.execute("INSERT INTO XXXXX_PRD.xref_client VALUES (?, ?, ?)", (name.upper(), f"{name} Co", 70 + i))
+        connection.execute("INSERT INTO MXXXXX_PROD.project VALUES (?, ?, ?, ?)", (name.upper(), 5 + i, 6 + i, 9 + i))
+        for dist_id in (1, 2, 100):
+            connection.execute("INSERT INTO XXXXX_PRD.helpdesk_distributor VALUES (?, ?, ?, ?)", (70 + i, dist_id, 2000 + dist_id + i, 3000 + dist_id))
+    connection.execute("INSERT INTO MXXXXX_PROD.transfer_info VALUES (1000)")
+    connection.executemany("INSERT INTO XXXXX_PRD.xref_distributor VALUES (?, ?)", [(1, "FXXXXX CO - CARROLL A"), (2, "FXXXXX CO - CARROLL B"), (100, "MCLANE X")])
+    connection.commit()
+    return connection
+
+
+def read_tree(root: str) -> dict:
+    """Read all the files under root as bytes, keyed by their path relative to root."""
+    tree = {}
+    for folder, _, files in os.walk(root):
+        for name in files:
+            path = os.path.join(folder, name)
+            with open(path, "rb") as file:
+                tree[os.path.relpath(path, root).replace(os.sep, "/")] = file.read()
+    return tree
+
+
+@pytest.fixture
+def corpus(tmp_path):
+    """The synthetic input directory."""
+    return write_corpus(str(tmp_path / "input"))
+
+
+@pytest.fixture
+def config():
+    """The stand-in of NewSubsystem_Config, restored after the test."""
+    saved = dict(CONFIG.__dict__)
+    yield CONFIG
+    CONFIG.__dict__.clear()
+    CONFIG.__dict__.update(saved)
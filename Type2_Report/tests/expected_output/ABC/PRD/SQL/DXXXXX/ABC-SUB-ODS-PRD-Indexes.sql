@@ -0,0 +1,4 @@
+set define off;
+CREATE UNIQUE INDEX ABC_XXX_XXX_PRD.i5 ON ABC_XXX_XXX_PRD.t5 (ID) LOGGING TABLESPACE ABC_IDX;
+
+CREATE UNIQUE INDEX ABC_XXX_XXX_PRD.i8 ON ABC_XXX_XXX_PRD.t8 (ID) LOGGING TABLESPACE ABC_IDX;
\ No newline at end of file
@@ -0,0 +1,17 @@
+set define off;
+INSERT INTO XXX_XXX_PRD.XXXXX_subsystem (XXXXXX, SCHEMA_NAME) VALUES (XXXXXX_VALUE, SXXXXXE_VALUE);
+INSERT INTO ABC.transfer_info VALUES (TRANSFER_INFO_OID_VALUE, PXXXXXVALUE, FXXXXXVALUE);
+INSERT INTO XXX_XXX_PRD.XXXXX_subsystem (XXXXXX, SCHEMA_NAME) VALUES (XXXXXX_VALUE, SXXXXXE_VALUE);
+-- comment 3 for ABC and ABC
+
+
+CREATE TABLE ABC_XXX_XXX_PRD.ABC_t6 (ID NUMBER) PCTUSED 40;
+INSERT INTO ABC.transfer_info VALUES (TRANSFER_INFO_OID_VALUE, PXXXXXVALUE, FXXXXXVALUE);
+INSERT INTO XXX_XXX_PRD.XXXXX_subsystem (XXXXXX, SCHEMA_NAME) VALUES (XXXXXX_VALUE, SXXXXXE_VALUE);
+CREATE UNIQUE INDEX ABC_XXX_XXX_PRD.i9 ON ABC_XXX_XXX_PRD.t9 (ID) LOGGING TABLESPACE ABC_IDX PCTFREE 10;
+CREATE TABLE ABC_XXX_XXX_PRD.ABC_t10 (ID NUMBER) PCTUSED 40;
+INSERT INTO XXX_XXX_PRD.XXXXX_subsystem (XXXXXX, SCHEMA_NAME) VALUES (XXXXXX_VALUE, SXXXXXE_VALUE);
+CREATE UNIQUE INDEX ABC_XXX_XXX_PRD.i12 ON ABC_XXX_XXX_PRD.t12 (ID) LOGGING TABLESPACE ABC_IDX PCTFREE 10;
+INSERT INTO XXX_XXX_PRD.XXXXX_subsystem (XXXXXX, SCHEMA_NAME) VALUES (XXXXXX_VALUE, SXXXXXE_VALUE);
+-- comment 14 for ABC and ABC
+CREATE TABLE ABC_XXX_XXX_PRD.ABC_t15 (ID NUMBER) PCTUSED 40;
\ No newline at end of file
@@ -0,0 +1,2 @@
+set define off;
+CREATE TABLE ABC_XXX_XXX_PRD.ABC_t6 (ID NUMBER);
\ No newline at end of file
@@ -0,0 +1,17 @@
+set define off;
+CREATE UNIQUE INDEX ABC_XXX_XXX_PRD.i0 ON ABC_XXX_XXX_PRD.t0 (ID) LOGGING TABLESPACE ABC_IDX PCTFREE 10;
+-- comment 1 for ABC and ABC
+INSERT INTO XXX_XXX_PRD.XXXXX_subsystem (XXXXXX, SCHEMA_NAME) VALUES (XXXXXX_VALUE, SXXXXXE_VALUE);
+INSERT INTO XXX_XXX_PRD.XXXXX_subsystem (XXXXXX, SCHEMA_NAME) VALUES (XXXXXX_VALUE, SXXXXXE_VALUE);
+INSERT INTO XXX_XXX_PRD.XXXXX_subsystem (XXXXXX, SCHEMA_NAME) VALUES (XXXXXX_VALUE, SXXXXXE_VALUE);
+-- comment 5 for ABC and ABC
+INSERT INTO ABC.transfer_info VALUES (TRANSFER_INFO_OID_VALUE, PXXXXXVALUE, FXXXXXVALUE);
+CREATE UNIQUE INDEX ABC_XXX_XXX_PRD.i7 ON ABC_XXX_XXX_PRD.t7 (ID) LOGGING TABLESPACE ABC_IDX PCTFREE 10;
+CREATE UNIQUE INDEX ABC_XXX_XXX_PRD.i8 ON ABC_XXX_XXX_PRD.t8 (ID) LOGGING TABLESPACE ABC_IDX PCTFREE 10;
+INSERT INTO XXX_XXX_PRD.XXXXX_subsystem (XXXXXX, SCHEMA_NAME) VALUES (XXXXXX_VALUE, SXXXXXE_VALUE);
+CREATE TABLE ABC_XXX_XXX_PRD.ABC_t10 (ID NUMBER) PCTUSED 40;
+INSERT INTO XXX_XXX_PRD.XXXXX_subsystem (XXXXXX, SCHEMA_NAME) VALUES (XXXXXX_VALUE, SXXXXXE_VALUE);
+
+INSERT INTO XXX_XXX_PRD.XXXXX_subsystem (XXXXXX, SCHEMA_NAME) VALUES (XXXXXX_VALUE, SXXXXXE_VALUE);
+INSERT INTO XXX_XXX_PRD.XXXXX_subsystem (XXXXXX, SCHEMA_NAME) VALUES (XXXXXX_VALUE, SXXXXXE_VALUE);
+CREATE UNIQUE INDEX ABC_XXX_XXX_PRD.i15 ON ABC_XXX_XXX_PRD.t15 (ID) LOGGING TABLESPACE ABC_IDX PCTFREE 10;
\ No newline at end of file
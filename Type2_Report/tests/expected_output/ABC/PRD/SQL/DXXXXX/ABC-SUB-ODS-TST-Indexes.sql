@@ -0,0 +1,4 @@
+set define off;
+CREATE UNIQUE INDEX ABC_XXX_XXX_PRD.i13 ON ABC_XXX_XXX_PRD.t13 (ID) LOGGING TABLESPACE ABC_IDX;
+
+CREATE UNIQUE INDEX ABC_XXX_XXX_PRD.i15 ON ABC_XXX_XXX_PRD.t15 (ID) LOGGING TABLESPACE ABC_IDX;
\ No newline at end of file
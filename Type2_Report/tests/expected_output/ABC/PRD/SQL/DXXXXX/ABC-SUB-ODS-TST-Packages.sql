@@ -0,0 +1,17 @@
+set define off;
+INSERT INTO ABC.transfer_info VALUES (TRANSFER_INFO_OID_VALUE, PXXXXXVALUE, FXXXXXVALUE);
+
+
+-- comment 3 for ABC and ABC
+CREATE TABLE ABC_XXX_XXX_PRD.ABC_t4 (ID NUMBER) PCTUSED 40;
+CREATE UNIQUE INDEX ABC_XXX_XXX_PRD.i5 ON ABC_XXX_XXX_PRD.t5 (ID) LOGGING TABLESPACE ABC_IDX PCTFREE 10;
+INSERT INTO ABC.transfer_info VALUES (TRANSFER_INFO_OID_VALUE, PXXXXXVALUE, FXXXXXVALUE);
+-- comment 7 for ABC and ABC
+-- comment 8 for ABC and ABC
+INSERT INTO ABC.transfer_info VALUES (TRANSFER_INFO_OID_VALUE, PXXXXXVALUE, FXXXXXVALUE);
+INSERT INTO XXX_XXX_PRD.XXXXX_subsystem (XXXXXX, SCHEMA_NAME) VALUES (XXXXXX_VALUE, SXXXXXE_VALUE);
+-- comment 11 for ABC and ABC
+INSERT INTO ABC.transfer_info VALUES (TRANSFER_INFO_OID_VALUE, PXXXXXVALUE, FXXXXXVALUE);
+INSERT INTO ABC.transfer_info VALUES (TRANSFER_INFO_OID_VALUE, PXXXXXVALUE, FXXXXXVALUE);
+
+CREATE UNIQUE INDEX ABC_XXX_XXX_PRD.i15 ON ABC_XXX_XXX_PRD.t15 (ID) LOGGING TABLESPACE ABC_IDX PCTFREE 10;
\ No newline at end of file
@@ -0,0 +1,8 @@
+set define off;
+CREATE TABLE ABC_XXX_XXX_PRD.ABC_t1 (ID NUMBER);
+
+CREATE TABLE ABC_XXX_XXX_PRD.ABC_t10 (ID NUMBER);
+
+CREATE TABLE ABC_XXX_XXX_PRD.ABC_t13 (ID NUMBER);
+
+CREATE TABLE ABC_XXX_XXX_PRD.ABC_t14 (ID NUMBER);
\ No newline at end of file
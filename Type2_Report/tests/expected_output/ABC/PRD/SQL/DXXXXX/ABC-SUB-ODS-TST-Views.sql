@@ -0,0 +1,16 @@
+set define off;
+INSERT INTO XXX_XXX_PRD.XXXXX_subsystem (XXXXXX, SCHEMA_NAME) VALUES (XXXXXX_VALUE, SXXXXXE_VALUE);
+INSERT INTO ABC.transfer_info VALUES (TRANSFER_INFO_OID_VALUE, PXXXXXVALUE, FXXXXXVALUE);
+INSERT INTO ABC.transfer_info VALUES (TRANSFER_INFO_OID_VALUE, PXXXXXVALUE, FXXXXXVALUE);
+-- comment 3 for ABC and ABC
+INSERT INTO XXX_XXX_PRD.XXXXX_subsystem (XXXXXX, SCHEMA_NAME) VALUES (XXXXXX_VALUE, SXXXXXE_VALUE);
+CREATE TABLE ABC_XXX_XXX_PRD.ABC_t5 (ID NUMBER) PCTUSED 40;
+INSERT INTO ABC.transfer_info VALUES (TRANSFER_INFO_OID_VALUE, PXXXXXVALUE, FXXXXXVALUE);
+-- comment 7 for ABC and ABC
+INSERT INTO XXX_XXX_PRD.XXXXX_subsystem (XXXXXX, SCHEMA_NAME) VALUES (XXXXXX_VALUE, SXXXXXE_VALUE);
+-- comment 9 for ABC and ABC
+INSERT INTO XXX_XXX_PRD.XXXXX_subsystem (XXXXXX, SCHEMA_NAME) VALUES (XXXXXX_VALUE, SXXXXXE_VALUE);
+CREATE UNIQUE INDEX ABC_XXX_XXX_PRD.i11 ON ABC_XXX_XXX_PRD.t11 (ID) LOGGING TABLESPACE ABC_IDX PCTFREE 10;
+CREATE TABLE ABC_XXX_XXX_PRD.ABC_t12 (ID NUMBER) PCTUSED 40;
+CREATE UNIQUE INDEX ABC_XXX_XXX_PRD.i13 ON ABC_XXX_XXX_PRD.t13 (ID) LOGGING TABLESPACE ABC_IDX PCTFREE 10;
+INSERT INTO XXX_XXX_PRD.XXXXX_subsystem (XXXXXX, SCHEMA_NAME) VALUES (XXXXXX_VALUE, SXXXXXE_VALUE);
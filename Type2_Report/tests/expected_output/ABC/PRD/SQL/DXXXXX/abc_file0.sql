@@ -0,0 +1,17 @@
+set define off;
+CREATE TABLE ABC_XXX_XXX_PRD.abc_t0 (ID NUMBER) PCTUSED 40;
+CREATE TABLE ABC_XXX_XXX_PRD.abc_t1 (ID NUMBER) PCTUSED 40;
+INSERT INTO XXX_XXX_PRD.XXXXX_subsystem (XXXXXX, SCHEMA_NAME) VALUES (70, 'ABC_XXX_XXX_PRD');
+DROP TABLE ABC_XXX_XXX_PRD.t3;
+CREATE UNIQUE INDEX ABC_XXX_XXX_PRD.i4 ON ABC_XXX_XXX_PRD.t4 (ID) LOGGING TABLESPACE ABC_IDX PCTFREE 10;
+CREATE TABLE ABC_XXX_XXX_PRD.abc_t5 (ID NUMBER) PCTUSED 40;
+CREATE TABLE ABC_XXX_XXX_PRD.abc_t6 (ID NUMBER) PCTUSED 40;
+DROP TABLE ABC_XXX_XXX_PRD.t7;
+CREATE TABLE ABC_XXX_XXX_PRD.abc_t8 (ID NUMBER) PCTUSED 40;
+DROP TABLE ABC_XXX_XXX_PRD.t9;
+CREATE UNIQUE INDEX ABC_XXX_XXX_PRD.i10 ON ABC_XXX_XXX_PRD.t10 (ID) LOGGING TABLESPACE ABC_IDX PCTFREE 10;
+INSERT INTO abc.transfer_info VALUES (1000, 5, 9);
+CREATE UNIQUE INDEX ABC_XXX_XXX_PRD.i12 ON ABC_XXX_XXX_PRD.t12 (ID) LOGGING TABLESPACE ABC_IDX PCTFREE 10;
+INSERT INTO abc.transfer_info VALUES (1000, 5, 9);
+DROP TABLE ABC_XXX_XXX_PRD.t14;
+INSERT INTO abc.transfer_info VALUES (1000, 5, 9);
@@ -0,0 +1,17 @@
+set define off;
+INSERT INTO XXX_XXX_PRD.XXXXX_subsystem (XXXXXX, SCHEMA_NAME) VALUES (70, 'ABC_XXX_XXX_PRD');
+CREATE UNIQUE INDEX ABC_XXX_XXX_PRD.i1 ON ABC_XXX_XXX_PRD.t1 (ID) LOGGING TABLESPACE ABC_IDX PCTFREE 10;
+DROP TABLE ABC_XXX_XXX_PRD.t2;
+CREATE UNIQUE INDEX ABC_XXX_XXX_PRD.i3 ON ABC_XXX_XXX_PRD.t3 (ID) LOGGING TABLESPACE ABC_IDX PCTFREE 10;
+-- comment 4 for Xyz and xYz
+CREATE UNIQUE INDEX ABC_XXX_XXX_PRD.i5 ON ABC_XXX_XXX_PRD.t5 (ID) LOGGING TABLESPACE ABC_IDX PCTFREE 10;
+INSERT INTO abc.transfer_info VALUES (1000, 5, 9);
+DROP TABLE ABC_XXX_XXX_PRD.t7;
+INSERT INTO XXX_XXX_PRD.XXXXX_subsystem (XXXXXX, SCHEMA_NAME) VALUES (70, 'ABC_XXX_XXX_PRD');
+-- comment 9 for Xyz and xYz
+INSERT INTO XXX_XXX_PRD.XXXXX_subsystem (XXXXXX, SCHEMA_NAME) VALUES (70, 'ABC_XXX_XXX_PRD');
+-- comment 11 for Xyz and xYz
+DROP TABLE ABC_XXX_XXX_PRD.t12;
+CREATE TABLE ABC_XXX_XXX_PRD.abc_t13 (ID NUMBER) PCTUSED 40;
+CREATE UNIQUE INDEX ABC_XXX_XXX_PRD.i14 ON ABC_XXX_XXX_PRD.t14 (ID) LOGGING TABLESPACE ABC_IDX PCTFREE 10;
+INSERT INTO XXX_XXX_PRD.XXXXX_subsystem (XXXXXX, SCHEMA_NAME) VALUES (70, 'ABC_XXX_XXX_PRD');
@@ -0,0 +1,17 @@
+set define off;
+CREATE TABLE ABC_XXX_XXX_PRD.abc_t0 (ID NUMBER) PCTUSED 40;
+-- comment 1 for Xyz and xYz
+-- comment 2 for Xyz and xYz
+-- comment 3 for Xyz and xYz
+INSERT INTO XXX_XXX_PRD.XXXXX_subsystem (XXXXXX, SCHEMA_NAME) VALUES (70, 'ABC_XXX_XXX_PRD');
+CREATE UNIQUE INDEX ABC_XXX_XXX_PRD.i5 ON ABC_XXX_XXX_PRD.t5 (ID) LOGGING TABLESPACE ABC_IDX PCTFREE 10;
+CREATE TABLE ABC_XXX_XXX_PRD.abc_t6 (ID NUMBER) PCTUSED 40;
+DROP TABLE ABC_XXX_XXX_PRD.t7;
+INSERT INTO abc.transfer_info VALUES (1000, 5, 9);
+-- comment 9 for Xyz and xYz
+DROP TABLE ABC_XXX_XXX_PRD.t10;
+-- comment 11 for Xyz and xYz
+INSERT INTO XXX_XXX_PRD.XXXXX_subsystem (XXXXXX, SCHEMA_NAME) VALUES (70, 'ABC_XXX_XXX_PRD');
+INSERT INTO abc.transfer_info VALUES (1000, 5, 9);
+CREATE UNIQUE INDEX ABC_XXX_XXX_PRD.i14 ON ABC_XXX_XXX_PRD.t14 (ID) LOGGING TABLESPACE ABC_IDX PCTFREE 10;
+INSERT INTO abc.transfer_info VALUES (1000, 5, 9);
@@ -0,0 +1,17 @@
+set define off;
+INSERT INTO abc.transfer_info VALUES (1000, 5, 9);
+INSERT INTO abc.transfer_info VALUES (1000, 5, 9);
+CREATE UNIQUE INDEX ABC_XXX_XXX_PRD.i2 ON ABC_XXX_XXX_PRD.t2 (ID) LOGGING TABLESPACE ABC_IDX PCTFREE 10;
+CREATE TABLE ABC_XXX_XXX_PRD.abc_t3 (ID NUMBER) PCTUSED 40;
+INSERT INTO XXX_XXX_PRD.XXXXX_subsystem (XXXXXX, SCHEMA_NAME) VALUES (70, 'ABC_XXX_XXX_PRD');
+INSERT INTO XXX_XXX_PRD.XXXXX_subsystem (XXXXXX, SCHEMA_NAME) VALUES (70, 'ABC_XXX_XXX_PRD');
+DROP TABLE ABC_XXX_XXX_PRD.t6;
+CREATE UNIQUE INDEX ABC_XXX_XXX_PRD.i7 ON ABC_XXX_XXX_PRD.t7 (ID) LOGGING TABLESPACE ABC_IDX PCTFREE 10;
+CREATE TABLE ABC_XXX_XXX_PRD.abc_t8 (ID NUMBER) PCTUSED 40;
+INSERT INTO XXX_XXX_PRD.XXXXX_subsystem (XXXXXX, SCHEMA_NAME) VALUES (70, 'ABC_XXX_XXX_PRD');
+DROP TABLE ABC_XXX_XXX_PRD.t10;
+CREATE UNIQUE INDEX ABC_XXX_XXX_PRD.i11 ON ABC_XXX_XXX_PRD.t11 (ID) LOGGING TABLESPACE ABC_IDX PCTFREE 10;
+DROP TABLE ABC_XXX_XXX_PRD.t12;
+-- comment 13 for Xyz and xYz
+INSERT INTO XXX_XXX_PRD.XXXXX_subsystem (XXXXXX, SCHEMA_NAME) VALUES (70, 'ABC_XXX_XXX_PRD');
+CREATE UNIQUE INDEX ABC_XXX_XXX_PRD.i15 ON ABC_XXX_XXX_PRD.t15 (ID) LOGGING TABLESPACE ABC_IDX PCTFREE 10;
@@ -0,0 +1,8 @@
+set define off;
+CREATE UNIQUE INDEX ABC_XXX_XXX_PRD.i3 ON ABC_XXX_XXX_PRD.t3 (ID) LOGGING TABLESPACE ABC_IDX;
+
+CREATE UNIQUE INDEX ABC_XXX_XXX_PRD.i4 ON ABC_XXX_XXX_PRD.t4 (ID) LOGGING TABLESPACE ABC_IDX;
+
+CREATE UNIQUE INDEX ABC_XXX_XXX_PRD.i8 ON ABC_XXX_XXX_PRD.t8 (ID) LOGGING TABLESPACE ABC_IDX;
+
+CREATE UNIQUE INDEX ABC_XXX_XXX_PRD.i9 ON ABC_XXX_XXX_PRD.t9 (ID) LOGGING TABLESPACE ABC_IDX;
\ No newline at end of file
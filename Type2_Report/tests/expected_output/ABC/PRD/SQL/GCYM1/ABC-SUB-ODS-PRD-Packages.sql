@@ -0,0 +1,17 @@
+set define off;
+-- comment 0 for ABC and ABC
+
+INSERT INTO XXX_XXX_PRD.XXXXX_subsystem (XXXXXX, SCHEMA_NAME) VALUES (XXXXXX_VALUE, SXXXXXE_VALUE);
+-- comment 3 for ABC and ABC
+CREATE UNIQUE INDEX ABC_XXX_XXX_PRD.i4 ON ABC_XXX_XXX_PRD.t4 (ID) LOGGING TABLESPACE ABC_IDX PCTFREE 10;
+-- comment 5 for ABC and ABC
+
+INSERT INTO ABC.transfer_info VALUES (TRANSFER_INFO_OID_VALUE, PXXXXXVALUE, FXXXXXVALUE);
+CREATE TABLE ABC_XXX_XXX_PRD.ABC_t8 (ID NUMBER) PCTUSED 40;
+CREATE TABLE ABC_XXX_XXX_PRD.ABC_t9 (ID NUMBER) PCTUSED 40;
+INSERT INTO XXX_XXX_PRD.XXXXX_subsystem (XXXXXX, SCHEMA_NAME) VALUES (XXXXXX_VALUE, SXXXXXE_VALUE);
+INSERT INTO XXX_XXX_PRD.XXXXX_subsystem (XXXXXX, SCHEMA_NAME) VALUES (XXXXXX_VALUE, SXXXXXE_VALUE);
+CREATE UNIQUE INDEX ABC_XXX_XXX_PRD.i12 ON ABC_XXX_XXX_PRD.t12 (ID) LOGGING TABLESPACE ABC_IDX PCTFREE 10;
+-- comment 13 for ABC and ABC
+CREATE TABLE ABC_XXX_XXX_PRD.ABC_t14 (ID NUMBER) PCTUSED 40;
+CREATE UNIQUE INDEX ABC_XXX_XXX_PRD.i15 ON ABC_XXX_XXX_PRD.t15 (ID) LOGGING TABLESPACE ABC_IDX PCTFREE 10;
\ No newline at end of file
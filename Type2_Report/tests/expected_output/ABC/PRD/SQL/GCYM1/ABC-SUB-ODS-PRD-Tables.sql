@@ -0,0 +1,4 @@
+set define off;
+CREATE TABLE ABC_XXX_XXX_PRD.ABC_t2 (ID NUMBER);
+
+CREATE TABLE ABC_XXX_XXX_PRD.ABC_t13 (ID NUMBER);
\ No newline at end of file
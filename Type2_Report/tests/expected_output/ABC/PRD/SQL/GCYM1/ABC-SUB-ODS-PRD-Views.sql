@@ -0,0 +1,17 @@
+set define off;
+INSERT INTO ABC.transfer_info VALUES (TRANSFER_INFO_OID_VALUE, PXXXXXVALUE, FXXXXXVALUE);
+
+-- comment 2 for ABC and ABC
+
+INSERT INTO XXX_XXX_PRD.XXXXX_subsystem (XXXXXX, SCHEMA_NAME) VALUES (XXXXXX_VALUE, SXXXXXE_VALUE);
+INSERT INTO XXX_XXX_PRD.XXXXX_subsystem (XXXXXX, SCHEMA_NAME) VALUES (XXXXXX_VALUE, SXXXXXE_VALUE);
+CREATE TABLE ABC_XXX_XXX_PRD.ABC_t6 (ID NUMBER) PCTUSED 40;
+CREATE TABLE ABC_XXX_XXX_PRD.ABC_t7 (ID NUMBER) PCTUSED 40;
+INSERT INTO ABC.transfer_info VALUES (TRANSFER_INFO_OID_VALUE, PXXXXXVALUE, FXXXXXVALUE);
+CREATE TABLE ABC_XXX_XXX_PRD.ABC_t9 (ID NUMBER) PCTUSED 40;
+CREATE UNIQUE INDEX ABC_XXX_XXX_PRD.i10 ON ABC_XXX_XXX_PRD.t10 (ID) LOGGING TABLESPACE ABC_IDX PCTFREE 10;
+-- comment 11 for ABC and ABC
+INSERT INTO XXX_XXX_PRD.XXXXX_subsystem (XXXXXX, SCHEMA_NAME) VALUES (XXXXXX_VALUE, SXXXXXE_VALUE);
+-- comment 13 for ABC and ABC
+-- comment 14 for ABC and ABC
+INSERT INTO ABC.transfer_info VALUES (TRANSFER_INFO_OID_VALUE, PXXXXXVALUE, FXXXXXVALUE);
\ No newline at end of file
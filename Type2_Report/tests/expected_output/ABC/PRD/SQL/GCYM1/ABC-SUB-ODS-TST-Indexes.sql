@@ -0,0 +1,4 @@
+set define off;
+CREATE UNIQUE INDEX ABC_XXX_XXX_PRD.i1 ON ABC_XXX_XXX_PRD.t1 (ID) LOGGING TABLESPACE ABC_IDX;
+
+CREATE UNIQUE INDEX ABC_XXX_XXX_PRD.i2 ON ABC_XXX_XXX_PRD.t2 (ID) LOGGING TABLESPACE ABC_IDX;
\ No newline at end of file
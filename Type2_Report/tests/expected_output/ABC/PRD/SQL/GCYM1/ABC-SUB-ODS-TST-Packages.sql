@@ -0,0 +1,17 @@
+set define off;
+-- comment 0 for ABC and ABC
+
+-- comment 2 for ABC and ABC
+INSERT INTO XXX_XXX_PRD.XXXXX_subsystem (XXXXXX, SCHEMA_NAME) VALUES (XXXXXX_VALUE, SXXXXXE_VALUE);
+-- comment 4 for ABC and ABC
+-- comment 5 for ABC and ABC
+CREATE UNIQUE INDEX ABC_XXX_XXX_PRD.i6 ON ABC_XXX_XXX_PRD.t6 (ID) LOGGING TABLESPACE ABC_IDX PCTFREE 10;
+
+INSERT INTO ABC.transfer_info VALUES (TRANSFER_INFO_OID_VALUE, PXXXXXVALUE, FXXXXXVALUE);
+CREATE TABLE ABC_XXX_XXX_PRD.ABC_t9 (ID NUMBER) PCTUSED 40;
+
+-- comment 11 for ABC and ABC
+-- comment 12 for ABC and ABC
+INSERT INTO XXX_XXX_PRD.XXXXX_subsystem (XXXXXX, SCHEMA_NAME) VALUES (XXXXXX_VALUE, SXXXXXE_VALUE);
+CREATE UNIQUE INDEX ABC_XXX_XXX_PRD.i14 ON ABC_XXX_XXX_PRD.t14 (ID) LOGGING TABLESPACE ABC_IDX PCTFREE 10;
+INSERT INTO ABC.transfer_info VALUES (TRANSFER_INFO_OID_VALUE, PXXXXXVALUE, FXXXXXVALUE);
\ No newline at end of file
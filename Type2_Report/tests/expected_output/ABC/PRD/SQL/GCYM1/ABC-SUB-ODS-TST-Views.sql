@@ -0,0 +1,17 @@
+set define off;
+
+CREATE TABLE ABC_XXX_XXX_PRD.ABC_t1 (ID NUMBER) PCTUSED 40;
+INSERT INTO XXX_XXX_PRD.XXXXX_subsystem (XXXXXX, SCHEMA_NAME) VALUES (XXXXXX_VALUE, SXXXXXE_VALUE);
+CREATE UNIQUE INDEX ABC_XXX_XXX_PRD.i3 ON ABC_XXX_XXX_PRD.t3 (ID) LOGGING TABLESPACE ABC_IDX PCTFREE 10;
+CREATE TABLE ABC_XXX_XXX_PRD.ABC_t4 (ID NUMBER) PCTUSED 40;
+CREATE TABLE ABC_XXX_XXX_PRD.ABC_t5 (ID NUMBER) PCTUSED 40;
+CREATE TABLE ABC_XXX_XXX_PRD.ABC_t6 (ID NUMBER) PCTUSED 40;
+INSERT INTO XXX_XXX_PRD.XXXXX_subsystem (XXXXXX, SCHEMA_NAME) VALUES (XXXXXX_VALUE, SXXXXXE_VALUE);
+INSERT INTO XXX_XXX_PRD.XXXXX_subsystem (XXXXXX, SCHEMA_NAME) VALUES (XXXXXX_VALUE, SXXXXXE_VALUE);
+CREATE TABLE ABC_XXX_XXX_PRD.ABC_t9 (ID NUMBER) PCTUSED 40;
+INSERT INTO ABC.transfer_info VALUES (TRANSFER_INFO_OID_VALUE, PXXXXXVALUE, FXXXXXVALUE);
+INSERT INTO XXX_XXX_PRD.XXXXX_subsystem (XXXXXX, SCHEMA_NAME) VALUES (XXXXXX_VALUE, SXXXXXE_VALUE);
+INSERT INTO XXX_XXX_PRD.XXXXX_subsystem (XXXXXX, SCHEMA_NAME) VALUES (XXXXXX_VALUE, SXXXXXE_VALUE);
+CREATE UNIQUE INDEX ABC_XXX_XXX_PRD.i13 ON ABC_XXX_XXX_PRD.t13 (ID) LOGGING TABLESPACE ABC_IDX PCTFREE 10;
+CREATE UNIQUE INDEX ABC_XXX_XXX_PRD.i14 ON ABC_XXX_XXX_PRD.t14 (ID) LOGGING TABLESPACE ABC_IDX PCTFREE 10;
+INSERT INTO ABC.transfer_info VALUES (TRANSFER_INFO_OID_VALUE, PXXXXXVALUE, FXXXXXVALUE);
\ No newline at end of file
@@ -0,0 +1,17 @@
+set define off;
+INSERT INTO abc.transfer_info VALUES (1000, 5, 9);
+-- comment 1 for Xyz and xYz
+CREATE UNIQUE INDEX ABC_XXX_XXX_PRD.i2 ON ABC_XXX_XXX_PRD.t2 (ID) LOGGING TABLESPACE ABC_IDX PCTFREE 10;
+CREATE TABLE ABC_XXX_XXX_PRD.abc_t3 (ID NUMBER) PCTUSED 40;
+-- comment 4 for Xyz and xYz
+INSERT INTO XXX_XXX_PRD.XXXXX_subsystem (XXXXXX, SCHEMA_NAME) VALUES (70, 'ABC_XXX_XXX_PRD');
+INSERT INTO XXX_XXX_PRD.XXXXX_subsystem (XXXXXX, SCHEMA_NAME) VALUES (70, 'ABC_XXX_XXX_PRD');
+INSERT INTO XXX_XXX_PRD.XXXXX_subsystem (XXXXXX, SCHEMA_NAME) VALUES (70, 'ABC_XXX_XXX_PRD');
+INSERT INTO abc.transfer_info VALUES (1000, 5, 9);
+-- comment 9 for Xyz and xYz
+INSERT INTO abc.transfer_info VALUES (1000, 5, 9);
+INSERT INTO XXX_XXX_PRD.XXXXX_subsystem (XXXXXX, SCHEMA_NAME) VALUES (70, 'ABC_XXX_XXX_PRD');
+CREATE TABLE ABC_XXX_XXX_PRD.abc_t12 (ID NUMBER) PCTUSED 40;
+INSERT INTO XXX_XXX_PRD.XXXXX_subsystem (XXXXXX, SCHEMA_NAME) VALUES (70, 'ABC_XXX_XXX_PRD');
+INSERT INTO XXX_XXX_PRD.XXXXX_subsystem (XXXXXX, SCHEMA_NAME) VALUES (70, 'ABC_XXX_XXX_PRD');
+CREATE TABLE ABC_XXX_XXX_PRD.abc_t15 (ID NUMBER) PCTUSED 40;
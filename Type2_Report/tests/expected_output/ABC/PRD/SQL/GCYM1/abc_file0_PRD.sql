@@ -0,0 +1,17 @@
+set define off;
+CREATE UNIQUE INDEX ABC_XXX_XXX_PRD.i0 ON ABC_XXX_XXX_PRD.t0 (ID) LOGGING TABLESPACE ABC_IDX PCTFREE 10;
+CREATE UNIQUE INDEX ABC_XXX_XXX_PRD.i1 ON ABC_XXX_XXX_PRD.t1 (ID) LOGGING TABLESPACE ABC_IDX PCTFREE 10;
+DROP TABLE ABC_XXX_XXX_PRD.t2;
+CREATE TABLE ABC_XXX_XXX_PRD.abc_t3 (ID NUMBER) PCTUSED 40;
+CREATE TABLE ABC_XXX_XXX_PRD.abc_t4 (ID NUMBER) PCTUSED 40;
+CREATE UNIQUE INDEX ABC_XXX_XXX_PRD.i5 ON ABC_XXX_XXX_PRD.t5 (ID) LOGGING TABLESPACE ABC_IDX PCTFREE 10;
+-- comment 6 for Xyz and xYz
+-- comment 7 for Xyz and xYz
+INSERT INTO abc.transfer_info VALUES (1000, 5, 9);
+CREATE TABLE ABC_XXX_XXX_PRD.abc_t9 (ID NUMBER) PCTUSED 40;
+INSERT INTO XXX_XXX_PRD.XXXXX_subsystem (XXXXXX, SCHEMA_NAME) VALUES (70, 'ABC_XXX_XXX_PRD');
+DROP TABLE ABC_XXX_XXX_PRD.t11;
+INSERT INTO abc.transfer_info VALUES (1000, 5, 9);
+DROP TABLE ABC_XXX_XXX_PRD.t13;
+CREATE UNIQUE INDEX ABC_XXX_XXX_PRD.i14 ON ABC_XXX_XXX_PRD.t14 (ID) LOGGING TABLESPACE ABC_IDX PCTFREE 10;
+INSERT INTO abc.transfer_info VALUES (1000, 5, 9);
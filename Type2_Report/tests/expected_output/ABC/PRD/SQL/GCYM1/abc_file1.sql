@@ -0,0 +1,17 @@
+set define off;
+-- comment 0 for Xyz and xYz
+INSERT INTO XXX_XXX_PRD.XXXXX_subsystem (XXXXXX, SCHEMA_NAME) VALUES (70, 'ABC_XXX_XXX_PRD');
+INSERT INTO abc.transfer_info VALUES (1000, 5, 9);
+CREATE UNIQUE INDEX ABC_XXX_XXX_PRD.i3 ON ABC_XXX_XXX_PRD.t3 (ID) LOGGING TABLESPACE ABC_IDX PCTFREE 10;
+INSERT INTO abc.transfer_info VALUES (1000, 5, 9);
+INSERT INTO XXX_XXX_PRD.XXXXX_subsystem (XXXXXX, SCHEMA_NAME) VALUES (70, 'ABC_XXX_XXX_PRD');
+INSERT INTO abc.transfer_info VALUES (1000, 5, 9);
+CREATE TABLE ABC_XXX_XXX_PRD.abc_t7 (ID NUMBER) PCTUSED 40;
+CREATE TABLE ABC_XXX_XXX_PRD.abc_t8 (ID NUMBER) PCTUSED 40;
+DROP TABLE ABC_XXX_XXX_PRD.t9;
+CREATE UNIQUE INDEX ABC_XXX_XXX_PRD.i10 ON ABC_XXX_XXX_PRD.t10 (ID) LOGGING TABLESPACE ABC_IDX PCTFREE 10;
+INSERT INTO abc.transfer_info VALUES (1000, 5, 9);
+INSERT INTO XXX_XXX_PRD.XXXXX_subsystem (XXXXXX, SCHEMA_NAME) VALUES (70, 'ABC_XXX_XXX_PRD');
+CREATE UNIQUE INDEX ABC_XXX_XXX_PRD.i13 ON ABC_XXX_XXX_PRD.t13 (ID) LOGGING TABLESPACE ABC_IDX PCTFREE 10;
+CREATE TABLE ABC_XXX_XXX_PRD.abc_t14 (ID NUMBER) PCTUSED 40;
+INSERT INTO abc.transfer_info VALUES (1000, 5, 9);
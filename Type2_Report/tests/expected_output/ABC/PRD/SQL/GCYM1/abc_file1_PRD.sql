@@ -0,0 +1,17 @@
+set define off;
+CREATE UNIQUE INDEX ABC_XXX_XXX_PRD.i0 ON ABC_XXX_XXX_PRD.t0 (ID) LOGGING TABLESPACE ABC_IDX PCTFREE 10;
+CREATE TABLE ABC_XXX_XXX_PRD.abc_t1 (ID NUMBER) PCTUSED 40;
+-- comment 2 for Xyz and xYz
+-- comment 3 for Xyz and xYz
+CREATE TABLE ABC_XXX_XXX_PRD.abc_t4 (ID NUMBER) PCTUSED 40;
+CREATE UNIQUE INDEX ABC_XXX_XXX_PRD.i5 ON ABC_XXX_XXX_PRD.t5 (ID) LOGGING TABLESPACE ABC_IDX PCTFREE 10;
+CREATE TABLE ABC_XXX_XXX_PRD.abc_t6 (ID NUMBER) PCTUSED 40;
+-- comment 7 for Xyz and xYz
+DROP TABLE ABC_XXX_XXX_PRD.t8;
+CREATE TABLE ABC_XXX_XXX_PRD.abc_t9 (ID NUMBER) PCTUSED 40;
+CREATE TABLE ABC_XXX_XXX_PRD.abc_t10 (ID NUMBER) PCTUSED 40;
+-- comment 11 for Xyz and xYz
+-- comment 12 for Xyz and xYz
+INSERT INTO abc.transfer_info VALUES (1000, 5, 9);
+CREATE UNIQUE INDEX ABC_XXX_XXX_PRD.i14 ON ABC_XXX_XXX_PRD.t14 (ID) LOGGING TABLESPACE ABC_IDX PCTFREE 10;
+CREATE UNIQUE INDEX ABC_XXX_XXX_PRD.i15 ON ABC_XXX_XXX_PRD.t15 (ID) LOGGING TABLESPACE ABC_IDX PCTFREE 10;
@@ -0,0 +1,17 @@
+set define off;
+CREATE TABLE ABC_XXX_XXX_PRD.ABC_t0 (ID NUMBER) PCTUSED 40;
+CREATE UNIQUE INDEX ABC_XXX_XXX_PRD.i1 ON ABC_XXX_XXX_PRD.t1 (ID) LOGGING TABLESPACE ABC_IDX PCTFREE 10;
+CREATE TABLE ABC_XXX_XXX_PRD.ABC_t2 (ID NUMBER) PCTUSED 40;
+INSERT INTO XXX_XXX_PRD.XXXXX_subsystem (XXXXXX, SCHEMA_NAME) VALUES (XXXXXX_VALUE, SXXXXXE_VALUE);
+INSERT INTO ABC.transfer_info VALUES (TRANSFER_INFO_OID_VALUE, PXXXXXVALUE, FXXXXXVALUE);
+
+INSERT INTO XXX_XXX_PRD.XXXXX_subsystem (XXXXXX, SCHEMA_NAME) VALUES (XXXXXX_VALUE, SXXXXXE_VALUE);
+-- comment 7 for ABC and ABC
+
+CREATE UNIQUE INDEX ABC_XXX_XXX_PRD.i9 ON ABC_XXX_XXX_PRD.t9 (ID) LOGGING TABLESPACE ABC_IDX PCTFREE 10;
+CREATE UNIQUE INDEX ABC_XXX_XXX_PRD.i10 ON ABC_XXX_XXX_PRD.t10 (ID) LOGGING TABLESPACE ABC_IDX PCTFREE 10;
+INSERT INTO ABC.transfer_info VALUES (TRANSFER_INFO_OID_VALUE, PXXXXXVALUE, FXXXXXVALUE);
+CREATE TABLE ABC_XXX_XXX_PRD.ABC_t12 (ID NUMBER) PCTUSED 40;
+-- comment 13 for ABC and ABC
+CREATE TABLE ABC_XXX_XXX_PRD.ABC_t14 (ID NUMBER) PCTUSED 40;
+INSERT INTO XXX_XXX_PRD.XXXXX_subsystem (XXXXXX, SCHEMA_NAME) VALUES (XXXXXX_VALUE, SXXXXXE_VALUE);
\ No newline at end of file
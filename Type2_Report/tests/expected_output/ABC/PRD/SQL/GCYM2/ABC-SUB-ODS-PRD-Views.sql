@@ -0,0 +1,17 @@
+set define off;
+CREATE TABLE ABC_XXX_XXX_PRD.ABC_t0 (ID NUMBER) PCTUSED 40;
+INSERT INTO XXX_XXX_PRD.XXXXX_subsystem (XXXXXX, SCHEMA_NAME) VALUES (XXXXXX_VALUE, SXXXXXE_VALUE);
+INSERT INTO ABC.transfer_info VALUES (TRANSFER_INFO_OID_VALUE, PXXXXXVALUE, FXXXXXVALUE);
+INSERT INTO XXX_XXX_PRD.XXXXX_subsystem (XXXXXX, SCHEMA_NAME) VALUES (XXXXXX_VALUE, SXXXXXE_VALUE);
+
+INSERT INTO XXX_XXX_PRD.XXXXX_subsystem (XXXXXX, SCHEMA_NAME) VALUES (XXXXXX_VALUE, SXXXXXE_VALUE);
+CREATE UNIQUE INDEX ABC_XXX_XXX_PRD.i6 ON ABC_XXX_XXX_PRD.t6 (ID) LOGGING TABLESPACE ABC_IDX PCTFREE 10;
+CREATE UNIQUE INDEX ABC_XXX_XXX_PRD.i7 ON ABC_XXX_XXX_PRD.t7 (ID) LOGGING TABLESPACE ABC_IDX PCTFREE 10;
+-- comment 8 for ABC and ABC
+INSERT INTO ABC.transfer_info VALUES (TRANSFER_INFO_OID_VALUE, PXXXXXVALUE, FXXXXXVALUE);
+-- comment 10 for ABC and ABC
+CREATE TABLE ABC_XXX_XXX_PRD.ABC_t11 (ID NUMBER) PCTUSED 40;
+CREATE TABLE ABC_XXX_XXX_PRD.ABC_t12 (ID NUMBER) PCTUSED 40;
+INSERT INTO ABC.transfer_info VALUES (TRANSFER_INFO_OID_VALUE, PXXXXXVALUE, FXXXXXVALUE);
+CREATE TABLE ABC_XXX_XXX_PRD.ABC_t14 (ID NUMBER) PCTUSED 40;
+CREATE TABLE ABC_XXX_XXX_PRD.ABC_t15 (ID NUMBER) PCTUSED 40;
\ No newline at end of file
@@ -0,0 +1,4 @@
+set define off;
+CREATE TABLE ABC_XXX_XXX_PRD.ABC_t8 (ID NUMBER);
+
+CREATE TABLE ABC_XXX_XXX_PRD.ABC_t14 (ID NUMBER);
\ No newline at end of file
@@ -0,0 +1,17 @@
+set define off;
+INSERT INTO ABC.transfer_info VALUES (TRANSFER_INFO_OID_VALUE, PXXXXXVALUE, FXXXXXVALUE);
+INSERT INTO ABC.transfer_info VALUES (TRANSFER_INFO_OID_VALUE, PXXXXXVALUE, FXXXXXVALUE);
+CREATE TABLE ABC_XXX_XXX_PRD.ABC_t2 (ID NUMBER) PCTUSED 40;
+
+CREATE UNIQUE INDEX ABC_XXX_XXX_PRD.i4 ON ABC_XXX_XXX_PRD.t4 (ID) LOGGING TABLESPACE ABC_IDX PCTFREE 10;
+INSERT INTO ABC.transfer_info VALUES (TRANSFER_INFO_OID_VALUE, PXXXXXVALUE, FXXXXXVALUE);
+
+CREATE TABLE ABC_XXX_XXX_PRD.ABC_t7 (ID NUMBER) PCTUSED 40;
+-- comment 8 for ABC and ABC
+-- comment 9 for ABC and ABC
+INSERT INTO XXX_XXX_PRD.XXXXX_subsystem (XXXXXX, SCHEMA_NAME) VALUES (XXXXXX_VALUE, SXXXXXE_VALUE);
+CREATE TABLE ABC_XXX_XXX_PRD.ABC_t11 (ID NUMBER) PCTUSED 40;
+INSERT INTO ABC.transfer_info VALUES (TRANSFER_INFO_OID_VALUE, PXXXXXVALUE, FXXXXXVALUE);
+
+INSERT INTO XXX_XXX_PRD.XXXXX_subsystem (XXXXXX, SCHEMA_NAME) VALUES (XXXXXX_VALUE, SXXXXXE_VALUE);
+-- comment 15 for ABC and ABC
\ No newline at end of file
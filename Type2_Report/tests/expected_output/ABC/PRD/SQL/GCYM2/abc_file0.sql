@@ -0,0 +1,17 @@
+set define off;
+INSERT INTO XXX_XXX_PRD.XXXXX_subsystem (XXXXXX, SCHEMA_NAME) VALUES (70, 'ABC_XXX_XXX_PRD');
+CREATE TABLE ABC_XXX_XXX_PRD.abc_t1 (ID NUMBER) PCTUSED 40;
+CREATE TABLE ABC_XXX_XXX_PRD.abc_t2 (ID NUMBER) PCTUSED 40;
+DROP TABLE ABC_XXX_XXX_PRD.t3;
+INSERT INTO abc.transfer_info VALUES (1000, 5, 9);
+CREATE TABLE ABC_XXX_XXX_PRD.abc_t5 (ID NUMBER) PCTUSED 40;
+DROP TABLE ABC_XXX_XXX_PRD.t6;
+-- comment 7 for Xyz and xYz
+INSERT INTO XXX_XXX_PRD.XXXXX_subsystem (XXXXXX, SCHEMA_NAME) VALUES (70, 'ABC_XXX_XXX_PRD');
+INSERT INTO XXX_XXX_PRD.XXXXX_subsystem (XXXXXX, SCHEMA_NAME) VALUES (70, 'ABC_XXX_XXX_PRD');
+INSERT INTO XXX_XXX_PRD.XXXXX_subsystem (XXXXXX, SCHEMA_NAME) VALUES (70, 'ABC_XXX_XXX_PRD');
+CREATE TABLE ABC_XXX_XXX_PRD.abc_t11 (ID NUMBER) PCTUSED 40;
+DROP TABLE ABC_XXX_XXX_PRD.t12;
+INSERT INTO XXX_XXX_PRD.XXXXX_subsystem (XXXXXX, SCHEMA_NAME) VALUES (70, 'ABC_XXX_XXX_PRD');
+CREATE UNIQUE INDEX ABC_XXX_XXX_PRD.i14 ON ABC_XXX_XXX_PRD.t14 (ID) LOGGING TABLESPACE ABC_IDX PCTFREE 10;
+-- comment 15 for Xyz and xYz
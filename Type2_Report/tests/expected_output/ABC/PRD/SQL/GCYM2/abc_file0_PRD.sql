@@ -0,0 +1,17 @@
+set define off;
+CREATE UNIQUE INDEX ABC_XXX_XXX_PRD.i0 ON ABC_XXX_XXX_PRD.t0 (ID) LOGGING TABLESPACE ABC_IDX PCTFREE 10;
+CREATE UNIQUE INDEX ABC_XXX_XXX_PRD.i1 ON ABC_XXX_XXX_PRD.t1 (ID) LOGGING TABLESPACE ABC_IDX PCTFREE 10;
+INSERT INTO abc.transfer_info VALUES (1000, 5, 9);
+INSERT INTO abc.transfer_info VALUES (1000, 5, 9);
+INSERT INTO XXX_XXX_PRD.XXXXX_subsystem (XXXXXX, SCHEMA_NAME) VALUES (70, 'ABC_XXX_XXX_PRD');
+-- comment 5 for Xyz and xYz
+CREATE UNIQUE INDEX ABC_XXX_XXX_PRD.i6 ON ABC_XXX_XXX_PRD.t6 (ID) LOGGING TABLESPACE ABC_IDX PCTFREE 10;
+-- comment 7 for Xyz and xYz
+CREATE UNIQUE INDEX ABC_XXX_XXX_PRD.i8 ON ABC_XXX_XXX_PRD.t8 (ID) LOGGING TABLESPACE ABC_IDX PCTFREE 10;
+CREATE TABLE ABC_XXX_XXX_PRD.abc_t9 (ID NUMBER) PCTUSED 40;
+CREATE UNIQUE INDEX ABC_XXX_XXX_PRD.i10 ON ABC_XXX_XXX_PRD.t10 (ID) LOGGING TABLESPACE ABC_IDX PCTFREE 10;
+DROP TABLE ABC_XXX_XXX_PRD.t11;
+INSERT INTO XXX_XXX_PRD.XXXXX_subsystem (XXXXXX, SCHEMA_NAME) VALUES (70, 'ABC_XXX_XXX_PRD');
+INSERT INTO abc.transfer_info VALUES (1000, 5, 9);
+CREATE TABLE ABC_XXX_XXX_PRD.abc_t14 (ID NUMBER) PCTUSED 40;
+CREATE UNIQUE INDEX ABC_XXX_XXX_PRD.i15 ON ABC_XXX_XXX_PRD.t15 (ID) LOGGING TABLESPACE ABC_IDX PCTFREE 10;
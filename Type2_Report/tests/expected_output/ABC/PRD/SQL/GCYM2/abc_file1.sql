@@ -0,0 +1,17 @@
+set define off;
+DROP TABLE ABC_XXX_XXX_PRD.t0;
+-- comment 1 for Xyz and xYz
+DROP TABLE ABC_XXX_XXX_PRD.t2;
+INSERT INTO XXX_XXX_PRD.XXXXX_subsystem (XXXXXX, SCHEMA_NAME) VALUES (70, 'ABC_XXX_XXX_PRD');
+DROP TABLE ABC_XXX_XXX_PRD.t4;
+INSERT INTO XXX_XXX_PRD.XXXXX_subsystem (XXXXXX, SCHEMA_NAME) VALUES (70, 'ABC_XXX_XXX_PRD');
+INSERT INTO XXX_XXX_PRD.XXXXX_subsystem (XXXXXX, SCHEMA_NAME) VALUES (70, 'ABC_XXX_XXX_PRD');
+DROP TABLE ABC_XXX_XXX_PRD.t7;
+-- comment 8 for Xyz and xYz
+INSERT INTO XXX_XXX_PRD.XXXXX_subsystem (XXXXXX, SCHEMA_NAME) VALUES (70, 'ABC_XXX_XXX_PRD');
+DROP TABLE ABC_XXX_XXX_PRD.t10;
+DROP TABLE ABC_XXX_XXX_PRD.t11;
+INSERT INTO abc.transfer_info VALUES (1000, 5, 9);
+INSERT INTO XXX_XXX_PRD.XXXXX_subsystem (XXXXXX, SCHEMA_NAME) VALUES (70, 'ABC_XXX_XXX_PRD');
+INSERT INTO abc.transfer_info VALUES (1000, 5, 9);
+DROP TABLE ABC_XXX_XXX_PRD.t15;
@@ -0,0 +1,2 @@
+CREATE USER ABC_RO IDENTIFIED BY "*******";
+insert into dba_util.msa_sec_app_db_schema(db_schema, access_approver_email, db_schema_type, created, creator) values ('ABC_RO', 'NONE','PROD', SYSDATE , 'PBHARGAVA');
@@ -0,0 +1,18 @@
+-- master_script_GCYM2.sql
+-- This script calls all other SQL scripts
+set define off
+@@"ABC-SUB-ODS-PRD-Tables.sql"
+@@"ABC-SUB-ODS-PRD-Views.sql"
+@@"ABC-SUB-ODS-PRD-Indexes.sql"
+@@"ABC-SUB-ODS-PRD-Packages.sql"
+@@"ABC-SUB-ODS-TST-Tables.sql"
+@@"ABC-SUB-ODS-TST-Views.sql"
+@@"ABC-SUB-ODS-TST-Indexes.sql"
+@@"ABC-SUB-ODS-TST-Packages.sql"
+@@"grant_tables_ABC_RO.sql"
+@@"grant_tables_ABC_XXX_XXX_PRD.sql"
+@@"grant_tables_ABC_XXX_XXX_TST.sql"
+@@"abc_file0.sql"
+@@"abc_file0_PRD.sql"
+@@"abc_file1.sql"
+@@"abc_file1_PRD.sql"
@@ -0,0 +1,2 @@
+set define off;
+CREATE UNIQUE INDEX ABC_XXX_XXX_PRD.i4 ON ABC_XXX_XXX_PRD.t4 (ID) LOGGING TABLESPACE ABC_IDX;
\ No newline at end of file
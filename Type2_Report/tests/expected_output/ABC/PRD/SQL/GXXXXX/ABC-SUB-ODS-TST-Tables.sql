@@ -0,0 +1,6 @@
+set define off;
+CREATE TABLE ABC_XXX_XXX_PRD.ABC_t9 (ID NUMBER);
+
+CREATE TABLE ABC_XXX_XXX_PRD.ABC_t10 (ID NUMBER);
+
+CREATE TABLE ABC_XXX_XXX_PRD.ABC_t15 (ID NUMBER);
\ No newline at end of file
@@ -0,0 +1,17 @@
+set define off;
+DROP TABLE ABC_XXX_XXX_PRD.t0;
+INSERT INTO XXX_XXX_PRD.XXXXX_subsystem (XXXXXX, SCHEMA_NAME) VALUES (70, 'ABC_XXX_XXX_PRD');
+CREATE UNIQUE INDEX ABC_XXX_XXX_PRD.i2 ON ABC_XXX_XXX_PRD.t2 (ID) LOGGING TABLESPACE ABC_IDX PCTFREE 10;
+CREATE TABLE ABC_XXX_XXX_PRD.abc_t3 (ID NUMBER) PCTUSED 40;
+-- comment 4 for Xyz and xYz
+INSERT INTO abc.transfer_info VALUES (1000, 5, 9);
+INSERT INTO XXX_XXX_PRD.XXXXX_subsystem (XXXXXX, SCHEMA_NAME) VALUES (70, 'ABC_XXX_XXX_PRD');
+CREATE TABLE ABC_XXX_XXX_PRD.abc_t7 (ID NUMBER) PCTUSED 40;
+-- comment 8 for Xyz and xYz
+CREATE TABLE ABC_XXX_XXX_PRD.abc_t9 (ID NUMBER) PCTUSED 40;
+CREATE UNIQUE INDEX ABC_XXX_XXX_PRD.i10 ON ABC_XXX_XXX_PRD.t10 (ID) LOGGING TABLESPACE ABC_IDX PCTFREE 10;
+CREATE UNIQUE INDEX ABC_XXX_XXX_PRD.i11 ON ABC_XXX_XXX_PRD.t11 (ID) LOGGING TABLESPACE ABC_IDX PCTFREE 10;
+DROP TABLE ABC_XXX_XXX_PRD.t12;
+-- comment 13 for Xyz and xYz
+DROP TABLE ABC_XXX_XXX_PRD.t14;
+CREATE TABLE ABC_XXX_XXX_PRD.abc_t15 (ID NUMBER) PCTUSED 40;
@@ -0,0 +1,17 @@
+set define off;
+-- comment 0 for Xyz and xYz
+DROP TABLE ABC_XXX_XXX_PRD.t1;
+INSERT INTO abc.transfer_info VALUES (1000, 5, 9);
+CREATE UNIQUE INDEX ABC_XXX_XXX_PRD.i3 ON ABC_XXX_XXX_PRD.t3 (ID) LOGGING TABLESPACE ABC_IDX PCTFREE 10;
+-- comment 4 for Xyz and xYz
+INSERT INTO XXX_XXX_PRD.XXXXX_subsystem (XXXXXX, SCHEMA_NAME) VALUES (70, 'ABC_XXX_XXX_PRD');
+CREATE TABLE ABC_XXX_XXX_PRD.abc_t6 (ID NUMBER) PCTUSED 40;
+-- comment 7 for Xyz and xYz
+INSERT INTO XXX_XXX_PRD.XXXXX_subsystem (XXXXXX, SCHEMA_NAME) VALUES (70, 'ABC_XXX_XXX_PRD');
+DROP TABLE ABC_XXX_XXX_PRD.t9;
+-- comment 10 for Xyz and xYz
+INSERT INTO XXX_XXX_PRD.XXXXX_subsystem (XXXXXX, SCHEMA_NAME) VALUES (70, 'ABC_XXX_XXX_PRD');
+CREATE UNIQUE INDEX ABC_XXX_XXX_PRD.i12 ON ABC_XXX_XXX_PRD.t12 (ID) LOGGING TABLESPACE ABC_IDX PCTFREE 10;
+DROP TABLE ABC_XXX_XXX_PRD.t13;
+INSERT INTO abc.transfer_info VALUES (1000, 5, 9);
+INSERT INTO abc.transfer_info VALUES (1000, 5, 9);
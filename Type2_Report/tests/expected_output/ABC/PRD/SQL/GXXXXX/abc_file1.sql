@@ -0,0 +1,17 @@
+set define off;
+INSERT INTO XXX_XXX_PRD.XXXXX_subsystem (XXXXXX, SCHEMA_NAME) VALUES (70, 'ABC_XXX_XXX_PRD');
+INSERT INTO XXX_XXX_PRD.XXXXX_subsystem (XXXXXX, SCHEMA_NAME) VALUES (70, 'ABC_XXX_XXX_PRD');
+CREATE UNIQUE INDEX ABC_XXX_XXX_PRD.i2 ON ABC_XXX_XXX_PRD.t2 (ID) LOGGING TABLESPACE ABC_IDX PCTFREE 10;
+INSERT INTO abc.transfer_info VALUES (1000, 5, 9);
+-- comment 4 for Xyz and xYz
+DROP TABLE ABC_XXX_XXX_PRD.t5;
+INSERT INTO abc.transfer_info VALUES (1000, 5, 9);
+INSERT INTO abc.transfer_info VALUES (1000, 5, 9);
+INSERT INTO abc.transfer_info VALUES (1000, 5, 9);
+-- comment 9 for Xyz and xYz
+CREATE TABLE ABC_XXX_XXX_PRD.abc_t10 (ID NUMBER) PCTUSED 40;
+CREATE TABLE ABC_XXX_XXX_PRD.abc_t11 (ID NUMBER) PCTUSED 40;
+-- comment 12 for Xyz and xYz
+-- comment 13 for Xyz and xYz
+CREATE UNIQUE INDEX ABC_XXX_XXX_PRD.i14 ON ABC_XXX_XXX_PRD.t14 (ID) LOGGING TABLESPACE ABC_IDX PCTFREE 10;
+CREATE TABLE ABC_XXX_XXX_PRD.abc_t15 (ID NUMBER) PCTUSED 40;
@@ -0,0 +1,3 @@
+set define off;
+GRANT SELECT ON ABC_XXX_XXX_PRD.T1 TO ABC_XXX_XXX_PRD;
+GRANT CONNECT TO ABC_XXX_XXX_PRD;
@@ -0,0 +1,56 @@
+from conftest import CLIENTS, client_database, read_tree
+from src.AutoSQL import AutoSQL
+from src.AutoSQLBatch import AutoSQLBatch
+
+
+def control_rows(corpus: str, output: str) -> list:
+    return [[client, "both", "Y", "Y", corpus, output] for client in CLIENTS]
+
+
+def test_batch_writes_the_same_files_as_one_run_per_client(config, corpus, tmp_path):
+    single_output = str(tmp_path / "single")
+    connection = client_database()
+    for i, row in enumerate(control_rows(corpus, single_output)):
+        config.all_variables = row
+        AutoSQL(connection, connection).run()
+        # The next client gets the next transfer info OID, as in the batch
+        connection.execute("INSERT INTO MXXXXX_PROD.transfer_info VALUES (?)", (1001 + i,))
+    batch_output = str(tmp_path / "batch")
+    config.sql_workers = 4
+    batch = AutoSQLBatch(client_database(), client_database(), control_rows(corpus, batch_output))
+    batch.run()
+    assert read_tree(batch_output) == read_tree(single_output)
+    assert sorted(batch.get_password_lists()) == [client.upper() for client in CLIENTS]
+
+
+def test_deploy_inputs_hold_the_values_of_each_client(config, corpus, tmp_path):
+    rows = control_rows(corpus, str(tmp_path / "batch"))
+    connection = client_database()
+    batch = AutoSQLBatch(connection, connection, rows)
+    batch.run()
+    inputs = batch.get_deploy_inputs()
+    assert [all_variables for all_variables, _ in inputs] == rows
+    for (all_variables, password_list), job in zip(inputs, batch.jobs):
+        assert password_list is job.get_password_list()
+        assert all(user.startswith(all_variables[0].upper()) for user in password_list)
+
+
+def test_in_lists_are_split_at_max_in_list(config, corpus, tmp_path):
+    connection = client_database()
+    expected_output = str(tmp_path / "expected")
+    AutoSQLBatch(connection, connection, control_rows(corpus, expected_output)).run()
+    # Every IN list and LIKE condition of the batch holds one value per query
+    queries = []
+    connection = client_database()
+    connection.set_trace_callback(queries.append)
+    chunked_output = str(tmp_path / "chunked")
+    batch = AutoSQLBatch(connection, connection, control_rows(corpus, chunked_output))
+    batch.init_jobs()
+    for job in batch.jobs:
+        job.max_in_list = 1
+    assert batch.jobs[0].bind_chunks("name", ["A", "B", "C"]) == [{"name_0": "A"}, {"name_0": "B"}, {"name_0": "C"}]
+    batch.init_client_info()
+    batch.write_output_files()
+    assert read_tree(chunked_output) == read_tree(expected_output)
+    assert sum("client_short_name IN" in query for query in queries) == len(CLIENTS)
+    assert sum("project_short_name IN" in query for query in queries) == len(CLIENTS)
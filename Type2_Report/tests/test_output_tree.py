@@ -0,0 +1,53 @@
+import os
+import pytest
+from conftest import read_tree
+from src.AutoSQL import AutoSQL
+
+# Output of the original AutoSQL, before the files were written in threads and the master script was ordered from memory
+EXPECTED_OUTPUT = os.path.join(os.path.dirname(os.path.abspath(__file__)), "expected_output")
+
+
+def run_client(config, corpus: str, output: str, workers: int = 1, stream_min_bytes: int = None) -> AutoSQL:
+    """Write the output files of the client 'abc' with fixed client information."""
+    config.all_variables = ["abc", "both", "Y", "Y", corpus, output]
+    job = AutoSQL(None, None)
+    job.init_control_variables()
+    job.new_client_full_name = "abc Co"
+    job.new_client_oid = 70
+    job.project_oid = 5
+    job.industry_oid = 6
+    job.file_project_id = 9
+    job.transfer_info_oid = 1000
+    job.workers = workers
+    if stream_min_bytes is not None:
+        job.stream_min_bytes = stream_min_bytes
+    job.init_replacers()
+    job.write_output_files()
+    return job
+
+
+@pytest.mark.parametrize("workers", [1, 4])
+def test_output_tree_is_byte_for_byte_the_same(config, corpus, tmp_path, workers):
+    output = str(tmp_path / "output")
+    run_client(config, corpus, output, workers=workers)
+    assert read_tree(output) == read_tree(EXPECTED_OUTPUT)
+
+
+def test_streamed_files_are_byte_for_byte_the_same(config, corpus, tmp_path):
+    output = str(tmp_path / "output")
+    # Every plain SQL file is updated chunk by chunk
+    run_client(config, corpus, output, stream_min_bytes=0)
+    assert read_tree(output) == read_tree(EXPECTED_OUTPUT)
+
+
+def test_master_script_lists_the_files_in_execution_order(config, corpus, tmp_path):
+    output = str(tmp_path / "output")
+    run_client(config, corpus, output, workers=4)
+    master_script = os.path.join(output, "ABC", "PRD", "SQL", "DXXXXX", "master_script_DXXXXX.sql")
+    with open(master_script) as file:
+        listed = [line[3:-1] for line in file.read().splitlines() if line.startswith("@@")]
+    # Every listed file exists and starts with 'set define off;'
+    for name in listed:
+        with open(os.path.join(os.path.dirname(master_script), name)) as file:
+            assert file.readline() == "set define off;\n"
+    assert not any(name.startswith("create_user") for name in listed)